@@ -0,0 +1,113 @@
+"""
+In-process CPU per frame of one `Broadcast` fanned out to many connections, against independent plays.
+
+Connections send into a stub transport, so encryption and RTP headers are measured but no packet leaves the
+process. FFmpeg runs in child processes and isn't counted - each independent play starts one, while a broadcast
+starts one in total.
+
+Usage: `python benchmarks/broadcast.py [seconds] [listeners ...]`
+"""
+
+from __future__ import annotations
+
+from hikariwave.audio.broadcast import Broadcast
+from hikariwave.audio.encryption import EncryptionMode
+from hikariwave.audio.scheduler import PlaybackScheduler
+from hikariwave.audio.source.file import FileAudioSource
+from hikariwave.connection import VoiceConnection
+from hikariwave.header import RTPHeader
+from hikariwave.internal import constants
+from hikariwave.voice import EncryptionType
+
+import asyncio
+import hikari
+import numpy
+import os
+import sys
+import tempfile
+import time
+import typing
+import wave
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.packets: int = 0
+
+    def sendto(self, data: typing.Any) -> None:
+        self.packets += 1
+
+
+def _tone(path: str, seconds: float) -> None:
+    samples: numpy.ndarray = numpy.arange(int(constants.SAMPLE_RATE * seconds))
+    wave_data: numpy.ndarray = (numpy.sin(samples * 440 * 2 * numpy.pi / constants.SAMPLE_RATE) * 8000).astype(numpy.int16)
+
+    with wave.open(path, "wb") as file:
+        file.setnchannels(constants.CHANNELS)
+        file.setsampwidth(2)
+        file.setframerate(constants.SAMPLE_RATE)
+        file.writeframes(numpy.repeat(wave_data, constants.CHANNELS).tobytes())
+
+
+def _connection(scheduler: PlaybackScheduler, guild_id: int) -> VoiceConnection:
+    connection: VoiceConnection = VoiceConnection(
+        typing.cast("hikari.GatewayBot", None),
+        hikari.Snowflake(1),
+        hikari.Snowflake(guild_id),
+        scheduler=scheduler,
+        lookahead=25,
+    )
+
+    async def set_speaking(_: bool) -> None: ...
+
+    connection._transport = typing.cast("asyncio.DatagramTransport", _Transport())
+    connection._encryption = EncryptionMode(os.urandom(32))
+    connection._mode = EncryptionType.AEAD_XCHACHA20_POLY1305_RTPSIZE
+    connection._header = RTPHeader(guild_id)
+    connection._set_speaking = set_speaking  # type: ignore[method-assign]
+    connection._ready_to_send.set()
+
+    return connection
+
+
+async def _broadcast(path: str, listeners: int) -> tuple[float, int]:
+    scheduler: PlaybackScheduler = PlaybackScheduler()
+    connections: list[VoiceConnection] = [_connection(scheduler, guild_id) for guild_id in range(1, listeners + 1)]
+    broadcast: Broadcast = Broadcast(FileAudioSource(path), scheduler, lookahead=25)
+
+    cpu: float = time.process_time()
+    await asyncio.gather(*(connection.listen(broadcast) for connection in connections))
+
+    return time.process_time() - cpu, broadcast.frames_sent
+
+
+async def _independent(path: str, listeners: int) -> tuple[float, int]:
+    scheduler: PlaybackScheduler = PlaybackScheduler()
+    connections: list[VoiceConnection] = [_connection(scheduler, guild_id) for guild_id in range(1, listeners + 1)]
+
+    cpu: float = time.process_time()
+    await asyncio.gather(*(connection.play(FileAudioSource(path)) for connection in connections))
+
+    return time.process_time() - cpu, scheduler.ticks
+
+
+def main() -> None:
+    seconds: float = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    counts: list[int] = [int(count) for count in sys.argv[2:]] or [1, 10, 50, 200]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "tone.wav")
+        _tone(path, seconds)
+
+        print(f"{seconds:.0f} s WAV, {EncryptionType.AEAD_XCHACHA20_POLY1305_RTPSIZE.value}, CPU per 20 ms frame")
+
+        for listeners in counts:
+            cpu, frames = asyncio.run(_broadcast(path, listeners))
+            print(f"  broadcast, {listeners:4d} listeners: {cpu / frames * 1e6:7.0f} us")
+
+        cpu, frames = asyncio.run(_independent(path, 10))
+        print(f"  10 independent plays:      {cpu / frames * 1e6:7.0f} us")
+
+
+if __name__ == "__main__":
+    main()
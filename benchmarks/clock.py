@@ -0,0 +1,64 @@
+"""
+Drift of a fixed-sleep send loop against `FrameClock` pacing.
+
+Each frame does a fixed amount of busy work, standing in for encoding and encryption, and the drift is how far
+the last frame ended up behind its schedule. The default of 30,000 frames is ten minutes of audio, long enough for
+drift to build up the way it does over a real track - Pass fewer frames for a quick check.
+
+Usage: `python benchmarks/clock.py [frames] [work_ms]`
+"""
+
+from __future__ import annotations
+
+from hikariwave.audio.clock import FrameClock
+from hikariwave.internal import constants
+
+import asyncio
+import sys
+import time
+
+_PERIOD: float = constants.FRAME_LENGTH / 1000
+
+
+def _work(seconds: float) -> None:
+    start: float = time.perf_counter()
+
+    while time.perf_counter() - start < seconds:
+        pass
+
+
+async def _sleep_loop(frames: int, work: float) -> float:
+    start: float = time.perf_counter()
+
+    for _ in range(frames):
+        _work(work)
+        await asyncio.sleep(_PERIOD)
+
+    return time.perf_counter() - start - frames * _PERIOD
+
+
+async def _frame_clock(frames: int, work: float) -> float:
+    clock: FrameClock = FrameClock()
+    clock.start()
+    start: float = time.perf_counter()
+
+    for _ in range(frames):
+        await clock.wait()
+        _work(work)
+        clock.advance()
+
+    await clock.wait()
+    return time.perf_counter() - start - frames * _PERIOD
+
+
+def main() -> None:
+    frames: int = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+    work: float = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.003
+
+    print(f"{frames} frames, {work * 1000:.1f} ms of work per frame")
+    print(f"  sleep loop:  {asyncio.run(_sleep_loop(frames, work)) * 1000:8.2f} ms drift")
+    print(f"  frame clock: {asyncio.run(_frame_clock(frames, work)) * 1000:8.2f} ms drift")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Per-packet cost of every `EncryptionMode` method, encrypting a typical Opus payload.
+
+The methods keep the same signature across versions, so running this against an older checkout gives the
+figures to compare with.
+
+Usage: `python benchmarks/encryption.py [payload_size] [packets]`
+"""
+
+from __future__ import annotations
+
+from hikariwave.audio.encryption import EncryptionMode
+from hikariwave.header import Header
+from hikariwave.voice import EncryptionType
+
+import os
+import sys
+import timeit
+import typing
+
+
+def main() -> None:
+    size: int = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    packets: int = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    header: bytes = Header.create_rtp(1, 960, 1234)
+    payload: bytes = os.urandom(size)
+
+    print(f"{size}-byte payload, best of 5 runs of {packets} packets")
+
+    for mode in EncryptionType:
+        encrypt: typing.Callable[[bytes, bytes], typing.Any] = getattr(EncryptionMode(os.urandom(32)), mode.value)
+        elapsed: float = min(timeit.repeat(lambda: encrypt(header, payload), number=packets, repeat=5))
+
+        print(f"  {mode.value:34s} {elapsed / packets * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
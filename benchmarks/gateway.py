@@ -0,0 +1,98 @@
+"""
+Cost of decoding and encoding voice gateway payloads.
+
+The corpus mirrors a typical session: `HELLO`, `READY` and `SESSION_DESCRIPTION`, then mostly heartbeat ACKs and
+`SPEAKING` updates, with a few client payloads and ops the library has no type for. `decode` and `encode` keep
+the same signature across versions, so running this against an older checkout gives the figures to compare with.
+Each figure is the best of several runs, as differences under a tenth of a microsecond are otherwise noise.
+
+Usage: `python benchmarks/gateway.py [rounds]`
+"""
+
+from __future__ import annotations
+
+from hikariwave import voice
+
+import json
+import random
+import sys
+import time
+import typing
+
+
+def _corpus() -> list[str]:
+    generator: random.Random = random.Random(1)
+    user_id: int = 80351110224678912
+    payloads: list[dict[str, typing.Any]] = [
+        {"op": 8, "d": {"heartbeat_interval": 13750}},
+        {
+            "op": 2,
+            "d": {
+                "ssrc": 1234,
+                "ip": "127.0.0.1",
+                "port": 1234,
+                "modes": [mode.value for mode in voice.EncryptionType],
+                "heartbeat_interval": 1,
+            },
+        },
+        {
+            "op": 4,
+            "d": {
+                "mode": "aead_xchacha20_poly1305_rtpsize",
+                "secret_key": [generator.randrange(256) for _ in range(32)],
+                "dave_protocol_version": 0,
+            },
+            "seq": 2,
+        },
+    ]
+
+    payloads += [{"op": 6, "d": {"t": 1700000000000 + i}, "seq": 3 + i} for i in range(60)]
+    payloads += [
+        {"op": 5, "d": {"user_id": str(user_id + i), "ssrc": 2000 + i, "speaking": 1, "delay": 0}, "seq": 70 + i}
+        for i in range(20)
+    ]
+    payloads += [
+        {"op": 11, "d": {"user_ids": [str(user_id + i) for i in range(5)]}, "seq": 100},
+        {"op": 13, "d": {"user_id": str(user_id)}, "seq": 101},
+        {"op": 18, "d": {"flags": 2, "user_id": str(user_id)}, "seq": 102},
+        {"op": 20, "d": {"platform": 0, "user_id": str(user_id)}, "seq": 103},
+    ]
+
+    return [json.dumps(payload) for payload in payloads]
+
+
+def _time(function: typing.Callable[[], object], rounds: int, repeats: int = 5) -> float:
+    # The best of several runs, since a single one is easily skewed by the rest of the machine
+    function()
+    best: float = float("inf")
+
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+
+        for _ in range(rounds):
+            function()
+
+        best = min(best, (time.perf_counter() - start) / rounds)
+
+    return best
+
+
+def main() -> None:
+    rounds: int = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    corpus: list[str] = _corpus()
+    heartbeat: voice.VoicePayload[typing.Any] = voice.VoicePayload(
+        voice.VoiceCode.HEARTBEAT,
+        voice.Heartbeat(1700000000000, 5),
+    )
+
+    def decode_all() -> None:
+        for message in corpus:
+            voice.decode(message)
+
+    print(f"{len(corpus)} payloads, {rounds} rounds")
+    print(f"  decode:           {_time(decode_all, rounds) / len(corpus) * 1e6:5.2f} us per message")
+    print(f"  encode heartbeat: {_time(lambda: voice.encode(heartbeat), rounds * 100) * 1e6:5.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Per-frame cost of `MixerAudioSource` summing in-memory PCM inputs.
+
+The time spent pulling frames out of the inputs themselves is measured separately and subtracted, leaving the
+cost of mixing alone.
+
+Usage: `python benchmarks/mixer.py [frames] [inputs ...]`
+"""
+
+from __future__ import annotations
+
+from hikariwave.audio.source.base import AudioSource
+from hikariwave.audio.source.mixer import MixerAudioSource
+from hikariwave.internal import constants
+from typing import AsyncGenerator
+from typing_extensions import override
+
+import asyncio
+import numpy
+import sys
+import time
+
+
+class _MemoryAudioSource(AudioSource):
+    def __init__(self, frames: int) -> None:
+        self._frames: int = frames
+        self._frame: bytes = numpy.full(constants.FRAME_SIZE * constants.CHANNELS, 3000, numpy.int16).tobytes()
+
+    @override
+    async def decode(self) -> AsyncGenerator[bytes, None]: # type: ignore
+        for _ in range(self._frames):
+            yield self._frame
+
+
+async def _pull(inputs: int, frames: int) -> float:
+    sources: list[AsyncGenerator[bytes, None]] = [_MemoryAudioSource(frames).decode() for _ in range(inputs)]
+    start: float = time.perf_counter()
+
+    for _ in range(frames):
+        for source in sources:
+            await source.__anext__()
+
+    return time.perf_counter() - start
+
+
+async def _mix(inputs: int, frames: int) -> float:
+    mixer: MixerAudioSource = MixerAudioSource(*(_MemoryAudioSource(frames) for _ in range(inputs)))
+    start: float = time.perf_counter()
+
+    async for _ in mixer.decode():
+        pass
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    frames: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    counts: list[int] = [int(count) for count in sys.argv[2:]] or [1, 4, 16]
+
+    print(f"{frames} frames of {constants.FRAME_SIZE * constants.CHANNELS} samples")
+
+    for inputs in counts:
+        total: float = asyncio.run(_mix(inputs, frames)) / frames
+        pull: float = asyncio.run(_pull(inputs, frames)) / frames
+
+        print(f"  {inputs:3d} inputs: {(total - pull) * 1e6:7.1f} us mixing per frame ({total * 1e6:.1f} us with input pulls)")
+
+
+if __name__ == "__main__":
+    main()
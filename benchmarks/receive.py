@@ -0,0 +1,100 @@
+"""
+Cost of receiving voice packets, from datagram to buffered Opus frame.
+
+Packets for many concurrent speakers are sealed the way Discord sends them - RTP header, ciphertext, then the
+4 byte nonce counter - and fed to an `AudioReceiver` the way the voice socket does. The memory still held after
+the frames are read shows whether anything is kept per packet.
+
+Usage: `python benchmarks/receive.py [speakers] [ticks]`
+"""
+
+from __future__ import annotations
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from hikariwave.audio.encryption import EncryptionMode
+from hikariwave.audio.receive import AudioReceiver
+from hikariwave.header import Header
+from hikariwave.voice import EncryptionType
+from nacl.bindings import crypto_aead_xchacha20poly1305_ietf_encrypt
+
+import hikari
+import os
+import struct
+import sys
+import time
+import tracemalloc
+
+
+def _packets(key: bytes, mode: EncryptionType, speakers: int, ticks: int) -> list[bytes]:
+    aes_gcm: AESGCM = AESGCM(key)
+    payload: bytes = os.urandom(120)
+    packets: list[bytes] = []
+
+    for tick in range(ticks):
+        for speaker in range(speakers):
+            header: bytes = Header.create_rtp(tick, tick * 960, 1000 + speaker)
+            counter: bytes = struct.pack(">I", len(packets))
+
+            if mode is EncryptionType.AEAD_XCHACHA20_POLY1305_RTPSIZE:
+                ciphertext: bytes = crypto_aead_xchacha20poly1305_ietf_encrypt(payload, header, counter + bytes(20), key)
+            else:
+                ciphertext = aes_gcm.encrypt(counter + bytes(8), payload, header)
+
+            packets.append(header + ciphertext + counter)
+
+    return packets
+
+
+def _drain(receiver: AudioReceiver, users: list[hikari.Snowflake]) -> None:
+    for user_id in users:
+        while receiver.read(user_id) is not None:
+            pass
+
+
+def main() -> None:
+    speakers: int = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    ticks: int = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    print(f"{speakers} speakers, {ticks} packets each")
+
+    for mode in (EncryptionType.AEAD_XCHACHA20_POLY1305_RTPSIZE, EncryptionType.AEAD_AES256_GCM_RTPSIZE):
+        key: bytes = os.urandom(32)
+        packets: list[bytes] = _packets(key, mode, speakers, ticks)
+        users: list[hikari.Snowflake] = [hikari.Snowflake(5000 + speaker) for speaker in range(speakers)]
+
+        receiver: AudioReceiver = AudioReceiver()
+        receiver._rebind(EncryptionMode(key), mode.value)
+
+        for speaker, user_id in enumerate(users):
+            receiver._speaking(user_id, 1000 + speaker)
+
+        # The first packet of each stream creates its buffer, so it is left out of the timing
+        for packet in packets[:speakers]:
+            receiver._receive(packet)
+
+        half: int = len(packets) // 2
+        start: float = time.perf_counter()
+
+        for packet in packets[speakers:half]:
+            receiver._receive(packet)
+
+        elapsed: float = time.perf_counter() - start
+        timed: int = half - speakers
+
+        _drain(receiver, users)
+        tracemalloc.start()
+        before: int = tracemalloc.get_traced_memory()[0]
+
+        for packet in packets[half:]:
+            receiver._receive(packet)
+
+        _drain(receiver, users)
+        retained: int = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        print(f"  {mode.value:34s} {elapsed / timed * 1e6:6.2f} us per packet, {timed / elapsed:8.0f} packets/s")
+        print(f"  {'':34s} {retained} bytes retained after {len(packets) - half} more, {receiver.packets_dropped} dropped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+One shared `PlaybackScheduler` against a self-paced `FrameClock` task per player.
+
+Players are stubs whose tick only records when it ran, so the cost measured is pacing alone. Reported per run are
+the process CPU used, how often the event loop woke up and how many timers were scheduled, the worst lag behind
+schedule, and how far apart the players' sends of one frame were spread. Wakeups are counted as iterations of the
+loop's private `_run_once`, each of which waits on the selector once, so they are specific to the default asyncio loop.
+A self-paced player that has fallen behind yields without a timer, so an overloaded run reports few of either.
+
+Usage: `python benchmarks/scheduler.py [seconds] [players ...]`
+"""
+
+from __future__ import annotations
+
+from hikariwave.audio.clock import FrameClock
+from hikariwave.audio.scheduler import PlaybackScheduler
+
+import asyncio
+import sys
+import time
+import typing
+
+
+class _Player:
+    def __init__(self) -> None:
+        self.sent: list[float] = []
+
+    def _tick(self) -> None:
+        self.sent.append(time.perf_counter())
+
+    def _skip_tick(self) -> None:
+        self._tick()
+
+    def _finish(self) -> None: ...
+
+
+def _spread(players: list[_Player]) -> float:
+    frames: int = min(len(player.sent) for player in players)
+    return max(
+        max(player.sent[frame] for player in players) - min(player.sent[frame] for player in players)
+        for frame in range(frames)
+    )
+
+
+async def _self_paced(count: int, seconds: float) -> tuple[list[_Player], float]:
+    players: list[_Player] = [_Player() for _ in range(count)]
+    lag: float = 0.0
+
+    async def pace(player: _Player) -> None:
+        nonlocal lag
+
+        clock: FrameClock = FrameClock()
+        clock.start()
+
+        while True:
+            await clock.wait()
+            player._tick()
+            clock.advance()
+            lag = max(lag, clock.max_lag)
+
+    tasks: list[asyncio.Task[None]] = [asyncio.create_task(pace(player)) for player in players]
+    await asyncio.sleep(seconds)
+
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.wait(tasks)
+    return players, lag
+
+
+async def _scheduled(count: int, seconds: float) -> tuple[list[_Player], float]:
+    scheduler: PlaybackScheduler = PlaybackScheduler()
+    players: list[_Player] = [_Player() for _ in range(count)]
+
+    for player in players:
+        scheduler.register(typing.cast("typing.Any", player))
+
+    await asyncio.sleep(seconds)
+
+    for player in players:
+        scheduler.unregister(typing.cast("typing.Any", player))
+
+    await asyncio.sleep(0.05)
+    return players, scheduler.max_lag
+
+
+_Benchmark = typing.Callable[[int, float], typing.Coroutine[typing.Any, typing.Any, tuple[list[_Player], float]]]
+
+
+def _run(name: str, benchmark: _Benchmark, count: int, seconds: float) -> None:
+    wakeups: int = 0
+    timers: int = 0
+
+    async def counted() -> tuple[list[_Player], float]:
+        loop: typing.Any = asyncio.get_running_loop()
+        run_once: typing.Callable[[], None] = loop._run_once
+        call_at: typing.Callable[..., asyncio.TimerHandle] = loop.call_at
+
+        def count_wakeup() -> None:
+            nonlocal wakeups
+
+            wakeups += 1
+            run_once()
+
+        def count_timer(when: float, callback: typing.Callable[..., object], *args: object, context: typing.Any = None) -> asyncio.TimerHandle:
+            nonlocal timers
+
+            timers += 1
+            return call_at(when, callback, *args, context=context)
+
+        loop._run_once = count_wakeup
+        loop.call_at = count_timer
+        return await benchmark(count, seconds)
+
+    cpu: float = time.process_time()
+    players, lag = asyncio.run(counted())
+    cpu = time.process_time() - cpu
+
+    print(
+        f"  {name:12s} CPU {cpu / seconds * 100:5.1f}%  wakeups {wakeups / seconds:6.0f}/s  timers {timers / seconds:7.0f}/s  "
+        f"max lag {lag * 1000:6.2f} ms  send spread {_spread(players) * 1000:6.2f} ms"
+    )
+
+
+def main() -> None:
+    seconds: float = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    counts: list[int] = [int(count) for count in sys.argv[2:]] or [100, 1000, 5000]
+
+    for count in counts:
+        print(f"{count} players, {seconds:.0f} s")
+
+        _run("self-paced", _self_paced, count, seconds)
+        _run("scheduler", _scheduled, count, seconds)
+
+
+if __name__ == "__main__":
+    main()
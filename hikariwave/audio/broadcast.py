@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from hikariwave.audio.clock import LateFramePolicy
+from hikariwave.audio.opus import OpusEncoder
+from hikariwave.audio.pump import FramePump
+from hikariwave.internal import constants
+from typing import Union
+from typing_extensions import override
+
+import asyncio
+import logging
+import typing
+
+if typing.TYPE_CHECKING:
+    from hikariwave.audio.scheduler import PlaybackScheduler
+    from hikariwave.audio.source.base import AudioSource
+    from hikariwave.connection import VoiceConnection
+
+    from typing import AsyncGenerator
+    from typing import Callable
+
+__all__: typing.Sequence[str] = ("Broadcast",)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.broadcast")
+
+_LOOKAHEAD_FRAMES: typing.Final[int] = 3
+
+
+def _log_broadcast_error(task: asyncio.Task[None]) -> None:
+    if task.cancelled():
+        return
+
+    exception: Union[BaseException, None] = task.exception()
+
+    if exception:
+        _logger.error("Broadcast failed", exc_info=exception)
+
+
+class Broadcast(FramePump):
+    """
+    A single audio stream shared by any number of voice connections.
+
+    The source is decoded and encoded into Opus once, then every tick the same packet is sent to each
+    listening connection under its own RTP header and encryption, so each additional listener only costs
+    one encryption and one send per frame. Connections can start listening at any point of the stream.
+
+    Volume set on a listening connection does not apply, since the stream is encoded once for everyone.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        scheduler: Union[PlaybackScheduler, None] = None,
+        *,
+        late_frame_policy: LateFramePolicy = LateFramePolicy.BURST,
+        lookahead: int = _LOOKAHEAD_FRAMES,
+    ) -> None:
+        """
+        Create a new broadcast - It starts streaming once its first listener subscribes.
+
+        Warning
+        -------
+        This is an internal method and should not be called - Use `VoiceClient.broadcast_file` or `VoiceClient.broadcast_url` instead.
+
+        Parameters
+        ----------
+        source : AudioSource
+            The audio source to stream from.
+        scheduler : PlaybackScheduler | None
+            The shared scheduler that should tick this broadcast - If `None`, the broadcast paces itself.
+        late_frame_policy : LateFramePolicy
+            How the broadcast should behave when it falls behind its send schedule, if it paces itself.
+        lookahead : int
+            The amount of encoded frames read ahead of the one being sent.
+        """
+        super().__init__(scheduler, late_frame_policy, lookahead)
+
+        self._source: AudioSource = source
+        self._encoder: OpusEncoder = OpusEncoder()
+
+        self._listeners: dict[VoiceConnection, Callable[[memoryview, memoryview], memoryview]] = {}
+        self._task: Union[asyncio.Task[None], None] = None
+
+        self._frames_sent: int = 0
+        self._packets_sent: int = 0
+
+    @property
+    def listeners(self) -> tuple[VoiceConnection, ...]:
+        """The connections currently listening to this broadcast."""
+        return tuple(self._listeners)
+
+    @property
+    def playing(self) -> bool:
+        """If this broadcast has started and not yet finished."""
+        return self._task is not None and self._finished is not None and not self._finished.done()
+
+    @property
+    def done(self) -> bool:
+        """If this broadcast has finished, either by reaching the end of its source or by being stopped."""
+        return self._finished is not None and self._finished.done()
+
+    @property
+    def frames_sent(self) -> int:
+        """The amount of frames encoded and sent to listeners."""
+        return self._frames_sent
+
+    @property
+    def packets_sent(self) -> int:
+        """The amount of packets sent across every listener."""
+        return self._packets_sent
+
+    @override
+    def _tick(self) -> None:
+        frame: Union[memoryview, None] = self._frames.pop()
+
+        if frame is None:
+            if self._exhausted:
+                self._finish()
+
+            return
+
+        self._frame_taken()
+        self._frames_sent += 1
+
+        for connection, encrypt in self._listeners.items():
+            if not connection._header or not connection._transport:
+                continue
+
+            connection._transport.sendto(encrypt(connection._header.view, frame))
+            connection._header.advance()
+
+            self._packets_sent += 1
+
+    @override
+    def _skip_tick(self) -> None:
+        if self._frames.pop() is None:
+            if self._exhausted:
+                self._finish()
+
+            return
+
+        self._frame_taken()
+
+        for connection in self._listeners:
+            if connection._header:
+                connection._header.skip()
+
+    async def _feed(self) -> None:
+        frames: AsyncGenerator[bytes, None] = self._source.decode() # type: ignore
+        encode_to_opus: bool = not self._source.encoded
+        frame_total: int = constants.FRAME_SIZE * constants.CHANNELS * 2
+
+        try:
+            async for frame in frames:
+                if encode_to_opus:
+                    if len(frame) < frame_total:
+                        frame = bytes(frame) + b"\x00" * (frame_total - len(frame))
+
+                    frame = self._encoder.encode(frame)
+
+                self._frames.push(frame)
+                await self._wait_for_room()
+        finally:
+            await frames.aclose()
+
+            self._exhausted = True
+
+    async def _run(self, finished: asyncio.Future[None]) -> None:
+        _logger.debug("Broadcast started")
+
+        try:
+            await self._pump(self._feed(), finished)
+        finally:
+            _logger.debug("Broadcast finished after %s frames and %s packets", self._frames_sent, self._packets_sent)
+
+    def subscribe(self, connection: VoiceConnection) -> None:
+        """
+        Start sending this broadcast to a connection from its next frame, starting the broadcast if it hasn't started yet.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        connection : VoiceConnection
+            The connection to send to.
+        """
+        self._listeners[connection] = getattr(
+            connection._encryption,
+            connection._mode if connection._mode else '',
+        )
+
+        if self._task:
+            return
+
+        if self._finished is None:
+            self._finished = asyncio.get_running_loop().create_future()
+
+        self._task = asyncio.create_task(self._run(self._finished))
+        self._task.add_done_callback(_log_broadcast_error)
+
+    def unsubscribe(self, connection: VoiceConnection) -> None:
+        """
+        Stop sending this broadcast to a connection.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        connection : VoiceConnection
+            The connection to stop sending to - Nothing happens if it isn't listening.
+        """
+        self._listeners.pop(connection, None)
+
+    async def wait(self) -> None:
+        """
+        Wait until this broadcast finishes, either by reaching the end of its source or by being stopped.
+
+        Raises
+        ------
+        Exception
+            Whatever the source, or the encoding of its frames, raised - The broadcast stops for every listener as soon as it does.
+        """
+        if self._finished is None:
+            self._finished = asyncio.get_running_loop().create_future()
+
+        await asyncio.shield(self._finished)
+
+    async def stop(self) -> None:
+        """Stop this broadcast for every listener."""
+        self._finish()
+
+        if self._task:
+            await asyncio.wait((self._task,))
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from array import array
+from typing import Union
+
+import typing
+
+__all__: typing.Sequence[str] = ("FrameRingBuffer",)
+
+_SLOT_SIZE: typing.Final[int] = 1500
+"""Bytes reserved per frame - Packets beyond a standard MTU can't be delivered in one datagram anyway."""
+
+
+class FrameRingBuffer:
+    """
+    Fixed-capacity FIFO of frames, stored in fixed-size slots of a single preallocated `bytearray`.
+
+    Popped frames are `memoryview` slices of the buffer's own storage and stay valid until their slot is
+    written again, which is `capacity` pushes later. A zero-length frame is a valid entry.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, capacity: int, slot_size: int = _SLOT_SIZE) -> None:
+        """
+        Create a new frame ring buffer.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        capacity : int
+            The maximum amount of frames the buffer holds.
+        slot_size : int
+            The maximum size (in bytes) of a single frame.
+        """
+        self._capacity: int = max(1, capacity)
+        self._slot_size: int = slot_size
+
+        self._data: bytearray = bytearray(self._capacity * slot_size)
+        self._view: memoryview = memoryview(self._data)
+        self._lengths: array[int] = array("H", bytes(2 * self._capacity))
+
+        self._head: int = 0
+        self._count: int = 0
+
+        self._high_water: int = 0
+        self._underruns: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """The maximum amount of frames the buffer holds."""
+        return self._capacity
+
+    @property
+    def fill_level(self) -> float:
+        """The fraction of the buffer's capacity currently filled, from `0.0` to `1.0`."""
+        return self._count / self._capacity
+
+    @property
+    def full(self) -> bool:
+        """If the buffer can't take another frame."""
+        return self._count == self._capacity
+
+    @property
+    def high_water(self) -> int:
+        """The largest amount of frames the buffer has held at once since it was last reset."""
+        return self._high_water
+
+    @property
+    def underruns(self) -> int:
+        """The amount of times a frame was wanted from the buffer while it was empty, since it was last reset."""
+        return self._underruns
+
+    def push(self, frame: Union[bytes, bytearray, memoryview]) -> bool:
+        """
+        Copy a frame into the next free slot.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        frame : bytes | bytearray | memoryview
+            The frame to store.
+
+        Returns
+        -------
+        bool
+            If the frame was stored - `False` if the buffer is full.
+
+        Raises
+        ------
+        ValueError
+            If the frame is larger than a slot.
+        """
+        if self._count == self._capacity:
+            return False
+
+        length: int = len(frame)
+
+        if length > self._slot_size:
+            error: str = f"Frame of {length} bytes exceeds the {self._slot_size} byte slot size"
+            raise ValueError(error)
+
+        slot: int = (self._head + self._count) % self._capacity
+        start: int = slot * self._slot_size
+
+        self._view[start : start + length] = frame
+        self._lengths[slot] = length
+        self._count += 1
+
+        if self._count > self._high_water:
+            self._high_water = self._count
+
+        return True
+
+    def pop(self) -> Union[memoryview, None]:
+        """
+        Take the oldest frame out of the buffer.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Returns
+        -------
+        memoryview | None
+            A view of the frame, valid until its slot is reused - `None` if the buffer is empty.
+        """
+        if not self._count:
+            return None
+
+        slot: int = self._head
+        start: int = slot * self._slot_size
+
+        self._head = (slot + 1) % self._capacity
+        self._count -= 1
+
+        return self._view[start : start + self._lengths[slot]]
+
+    def record_underrun(self) -> None:
+        """
+        Record that a frame was due while the buffer was empty.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._underruns += 1
+
+    def clear(self) -> None:
+        """
+        Drop every frame in the buffer, keeping its statistics.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._head = 0
+        self._count = 0
+
+    def reset(self) -> None:
+        """
+        Drop every frame in the buffer and reset its statistics.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self.clear()
+
+        self._high_water = 0
+        self._underruns = 0
@@ -0,0 +1,567 @@
+from __future__ import annotations
+
+from hikariwave.audio.opus import OpusEncoder
+from hikariwave.audio.source.cached import CachedAudioSource
+from hikariwave.audio.source.file import FileAudioSource
+from hikariwave.internal import constants
+from typing import AsyncGenerator, Generator, Union
+
+import aiohttp
+import asyncio
+import hashlib
+import logging
+import msgspec
+import os
+import subprocess
+import tempfile
+import typing
+
+__all__: typing.Sequence[str] = (
+    "OpusCache",
+    "WebCache",
+)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.cache")
+
+_EXTENSION: typing.Final[str] = ".hwop"
+_HASH_CHUNK_SIZE: typing.Final[int] = 1024 * 1024
+
+_WEB_EXTENSION: typing.Final[str] = ".hwweb"
+_WEB_METADATA_EXTENSION: typing.Final[str] = ".json"
+_WEB_CHUNK_SIZE: typing.Final[int] = 1024 * 16
+
+
+def _evict(directory: str, extension: str, max_size: int, keep: str, companions: tuple[str, ...] = ()) -> None:
+    entries: list[tuple[float, int, str]] = []
+
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(extension):
+            continue
+
+        status: os.stat_result = entry.stat()
+        entries.append((status.st_mtime, status.st_size, entry.path))
+
+    total: int = sum(size for _, size, _ in entries)
+
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+
+        if path == keep:
+            continue
+
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+
+        for companion in companions:
+            try:
+                os.remove(path[: -len(extension)] + companion)
+            except OSError:
+                pass
+
+        total -= size
+
+        _logger.debug("Evicted %s from the cache", path)
+
+
+def _touch(path: str) -> bool:
+    try:
+        os.utime(path)
+    except OSError:
+        return False
+
+    return True
+
+
+class OpusCache:
+    """
+    Size-bounded, on-disk cache of pre-encoded Opus tracks.
+
+    Each source file is decoded and Opus-encoded once, then stored in a cache file that can be played back
+    through `CachedAudioSource` without any decoding or encoding. Entries are keyed by the source's path,
+    modification time and size - or by a hash of its contents - and the least recently used entries are
+    evicted once the cache grows beyond its byte budget.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_size: int = 512 * 1024 * 1024,
+        key_by_content: bool = False,
+    ) -> None:
+        """
+        Create a new Opus track cache.
+
+        Parameters
+        ----------
+        directory : str
+            The directory that cache files are stored in - It is created if it doesn't exist.
+        max_size : int
+            The maximum combined size (in bytes) of all cache files before the least recently used are evicted.
+        key_by_content : bool
+            If entries should be keyed by a hash of the source file's contents instead of its path, modification time and size.
+        """
+        self._directory: str = directory
+        self._max_size: int = max_size
+        self._key_by_content: bool = key_by_content
+
+        self._pending: dict[str, asyncio.Task[str]] = {}
+
+        os.makedirs(self._directory, exist_ok=True)
+
+    def _hash_contents(self, filepath: str) -> str:
+        digest = hashlib.sha256()
+
+        with open(filepath, "rb") as file:
+            while chunk := file.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    async def _key(self, filepath: str) -> str:
+        if self._key_by_content:
+            return await asyncio.to_thread(self._hash_contents, filepath)
+
+        status: os.stat_result = os.stat(filepath)
+        identity: str = f"{os.path.abspath(filepath)}\0{status.st_mtime_ns}\0{status.st_size}"
+
+        return hashlib.sha256(identity.encode("UTF-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + _EXTENSION)
+
+    def _encode(self, filepath: str) -> Generator[bytes, None, None]:
+        encoder: OpusEncoder = OpusEncoder()
+        frame_total: int = constants.FRAME_SIZE * constants.CHANNELS * 2
+
+        process: subprocess.Popen[bytes] = subprocess.Popen(
+            FileAudioSource(filepath)._arguments(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+        try:
+            while process.stdout and (frame := process.stdout.read(frame_total)):
+                if len(frame) < frame_total:
+                    frame += b"\x00" * (frame_total - len(frame))
+
+                yield encoder.encode(frame)
+        finally:
+            process.kill()
+            process.wait()
+
+    def _build(self, filepath: str, destination: str) -> None:
+        frame_count: int = CachedAudioSource.write(destination, self._encode(filepath))
+
+        if not frame_count:
+            os.remove(destination)
+
+            error: str = f"No audio could be decoded from {filepath}"
+            raise RuntimeError(error)
+
+        _logger.debug("Cached %s frames of %s at %s", frame_count, filepath, destination)
+
+        _evict(self._directory, _EXTENSION, self._max_size, destination)
+
+    async def lookup(self, filepath: str) -> Union[str, None]:
+        """
+        Find the cache file of a source file, marking it as recently used.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the source file.
+
+        Returns
+        -------
+        str | None
+            The path to the cache file, or `None` if the source file hasn't been cached yet.
+        """
+        path: str = self._path(await self._key(filepath))
+
+        if not _touch(path):
+            return None
+
+        return path
+
+    async def store(self, filepath: str) -> str:
+        """
+        Encode a source file into the cache, if it isn't already cached.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the source file.
+
+        Returns
+        -------
+        str
+            The path to the cache file.
+        """
+        path: str = self._path(await self._key(filepath))
+
+        if os.path.exists(path):
+            return path
+
+        task: Union[asyncio.Task[str], None] = self._pending.get(path, None)
+
+        if not task:
+            task = asyncio.create_task(self._store(filepath, path))
+            self._pending[path] = task
+
+        return await asyncio.shield(task)
+
+    async def _store(self, filepath: str, path: str) -> str:
+        try:
+            await asyncio.to_thread(self._build, filepath, path)
+        finally:
+            self._pending.pop(path, None)
+
+        return path
+
+    def schedule(self, filepath: str) -> asyncio.Task[Union[str, None]]:
+        """
+        Encode a source file into the cache in the background.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the source file.
+
+        Returns
+        -------
+        asyncio.Task[str | None]
+            The background task, resolving to the path of the cache file or `None` if caching failed.
+        """
+        async def store() -> Union[str, None]:
+            try:
+                return await self.store(filepath)
+            except Exception as e:
+                _logger.warning("Failed to cache %s: %s", filepath, e)
+                return None
+
+        return asyncio.create_task(store())
+
+
+class _WebEntry(msgspec.Struct):
+    url: str
+    etag: Union[str, None] = None
+    last_modified: Union[str, None] = None
+
+
+class _WebDownload:
+    """
+    A single download, written to a temporary file that every reader of its URL streams from.
+
+    It is registered as soon as a play of its URL starts, before the request is made, so plays that start
+    while it is revalidated wait for it instead of making requests of their own.
+    """
+
+    def __init__(self) -> None:
+        self._path: str = ""
+        self._opened: asyncio.Event = asyncio.Event()
+        self._joining: int = 0
+        self._size: int = 0
+        self._changed: asyncio.Event = asyncio.Event()
+        self._done: bool = False
+        self._error: Union[BaseException, None] = None
+        self._readers: int = 0
+        self._task: Union[asyncio.Task[None], None] = None
+
+    def open(self, path: str, task: asyncio.Task[None]) -> None:
+        self._path = path
+        self._task = task
+        self._opened.set()
+
+    def abandon(self) -> None:
+        self._opened.set()
+
+    async def join(self) -> bool:
+        # Counted until it starts reading, so the download isn't stopped while the last reader is replaced
+        self._joining += 1
+
+        try:
+            await self._opened.wait()
+        finally:
+            self._joining -= 1
+
+        return bool(self._path)
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def advance(self, size: int) -> None:
+        self._size += size
+        self._notify()
+
+    def finish(self, *, error: Union[BaseException, None] = None) -> None:
+        self._error = error
+        self._done = True
+        self._notify()
+
+    async def read(self) -> AsyncGenerator[bytes, None]:
+        self._readers += 1
+        file: Union[typing.BinaryIO, None] = None
+
+        try:
+            file = open(self._path, "rb")
+            offset: int = 0
+
+            while True:
+                while offset < self._size:
+                    chunk: bytes = await asyncio.to_thread(file.read, min(_WEB_CHUNK_SIZE, self._size - offset))
+                    offset += len(chunk)
+
+                    yield chunk
+
+                if self._error:
+                    raise self._error
+
+                if self._done:
+                    return
+
+                await self._changed.wait()
+        finally:
+            if file:
+                file.close()
+
+            self._readers -= 1
+
+            if not self._readers and not self._joining and not self._done and self._task:
+                self._task.cancel()
+
+
+def _append(file: typing.BinaryIO, chunk: bytes) -> None:
+    file.write(chunk)
+    file.flush()
+
+
+async def _read_file(path: str) -> AsyncGenerator[bytes, None]:
+    with open(path, "rb") as file:
+        while chunk := await asyncio.to_thread(file.read, _WEB_CHUNK_SIZE):
+            yield chunk
+
+
+class WebCache:
+    """
+    Size-bounded, on-disk cache of downloaded web audio.
+
+    Responses are written to disk while they stream to FFmpeg, and entries are keyed by URL and revalidated
+    against their `ETag`/`Last-Modified` with a conditional request on every play - a `304 Not Modified`
+    is served from disk. Responses without either validator aren't cached, and stream straight to their
+    play. Concurrent plays of the same URL share one download, read back from its file on disk, which stops
+    once every play of it has stopped. The least recently used entries are evicted once the cache grows
+    beyond its byte budget.
+    """
+
+    def __init__(self, directory: str, *, max_size: int = 512 * 1024 * 1024) -> None:
+        """
+        Create a new web audio cache.
+
+        Parameters
+        ----------
+        directory : str
+            The directory that cache files are stored in - It is created if it doesn't exist.
+        max_size : int
+            The maximum combined size (in bytes) of all cached bodies before the least recently used are evicted.
+        """
+        self._directory: str = directory
+        self._max_size: int = max_size
+
+        self._pending: dict[str, _WebDownload] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+        os.makedirs(self._directory, exist_ok=True)
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        base: str = os.path.join(self._directory, hashlib.sha256(url.encode("UTF-8")).hexdigest())
+        return base + _WEB_EXTENSION, base + _WEB_METADATA_EXTENSION
+
+    def _entry(self, url: str) -> Union[_WebEntry, None]:
+        body, metadata = self._paths(url)
+
+        if not os.path.exists(body):
+            return None
+
+        try:
+            with open(metadata, "rb") as file:
+                entry: _WebEntry = msgspec.json.decode(file.read(), type=_WebEntry)
+        except (OSError, msgspec.DecodeError):
+            return None
+
+        return entry if entry.url == url else None
+
+    def _commit(self, entry: _WebEntry) -> None:
+        body, metadata = self._paths(entry.url)
+
+        with open(metadata, "wb") as file:
+            file.write(msgspec.json.encode(entry))
+
+        _logger.debug("Cached %s at %s", entry.url, body)
+
+        _evict(self._directory, _WEB_EXTENSION, self._max_size, body, (_WEB_METADATA_EXTENSION,))
+
+    async def _download(
+        self,
+        response: aiohttp.ClientResponse,
+        file: typing.BinaryIO,
+        entry: _WebEntry,
+        download: _WebDownload,
+    ) -> None:
+        temporary: str = download._path
+
+        try:
+            try:
+                async for chunk in response.content.iter_chunked(_WEB_CHUNK_SIZE):
+                    await asyncio.to_thread(_append, file, chunk)
+                    download.advance(len(chunk))
+            finally:
+                response.release()
+                file.close()
+        except asyncio.CancelledError:
+            error: str = f"Download of {entry.url} was stopped"
+            download.finish(error=RuntimeError(error))
+            raise
+        except Exception as e:
+            download.finish(error=e)
+        else:
+            self._release(download, entry.url)
+            body: str = self._paths(entry.url)[0]
+
+            try:
+                os.replace(temporary, body)
+            except OSError as e:
+                download.finish()
+                _logger.warning("Failed to cache %s: %s", entry.url, e)
+                return
+
+            # Switched along with the rename on the event loop, so a play that is still joining opens the cached copy
+            download._path = body
+            download.finish()
+
+            try:
+                await asyncio.to_thread(self._commit, entry)
+            except OSError as e:
+                _logger.warning("Failed to cache %s: %s", entry.url, e)
+        finally:
+            self._release(download, entry.url)
+
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def _release(self, download: _WebDownload, url: str) -> None:
+        # A finished download leaves `_pending` before being committed, so later plays revalidate the cached copy
+        if self._pending.get(url, None) is download:
+            del self._pending[url]
+
+    def _abandon(self, download: _WebDownload, url: str) -> None:
+        self._release(download, url)
+        download.abandon()
+
+    async def stream(self, url: str, session: aiohttp.ClientSession) -> AsyncGenerator[bytes, None]:
+        """
+        Stream the body of a URL, from disk if the cached copy is still valid.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        url : str
+            The URL to stream.
+        session : aiohttp.ClientSession
+            The session to download or revalidate the URL through.
+
+        Returns
+        -------
+        AsyncGenerator[bytes, None]
+            The body of the URL, in chunks - A shared download stops once every reader of it has stopped.
+        """
+        download: Union[_WebDownload, None] = self._pending.get(url, None)
+
+        while download:
+            if await download.join():
+                async for chunk in download.read():
+                    yield chunk
+
+                return
+
+            # The play it was registered for didn't share a download, so the URL is requested again
+            download = self._pending.get(url, None)
+
+        download = _WebDownload()
+        self._pending[url] = download
+
+        body: str = self._paths(url)[0]
+        response: Union[aiohttp.ClientResponse, None] = None
+
+        try:
+            entry: Union[_WebEntry, None] = await asyncio.to_thread(self._entry, url)
+            headers: dict[str, str] = {}
+
+            if entry and entry.etag:
+                headers["If-None-Match"] = entry.etag
+
+            if entry and entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+            response = await session.get(url, headers=headers)
+
+            if response.status == 304 and entry and _touch(body):
+                response.release()
+                response = None
+
+                self._abandon(download, url)
+                _logger.debug("Serving %s from the web cache", url)
+
+                async for chunk in _read_file(body):
+                    yield chunk
+
+                return
+
+            if response.status != 200:
+                error: str = f"Failed to fetch audio: HTTP {response.status}"
+                raise RuntimeError(error)
+
+            entry = _WebEntry(
+                url,
+                response.headers.get("ETag", None),
+                response.headers.get("Last-Modified", None),
+            )
+
+            if not (entry.etag or entry.last_modified):
+                self._abandon(download, url)
+
+                async for chunk in response.content.iter_chunked(_WEB_CHUNK_SIZE):
+                    yield chunk
+
+                return
+
+            descriptor, temporary = await asyncio.to_thread(
+                tempfile.mkstemp,
+                ".tmp",
+                os.path.basename(body) + ".",
+                self._directory,
+            )
+            file: typing.BinaryIO = os.fdopen(descriptor, "wb")
+
+            task: asyncio.Task[None] = asyncio.create_task(self._download(response, file, entry, download))
+            download.open(temporary, task)
+            response = None
+
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        finally:
+            if response:
+                response.release()
+
+            if not download._path:
+                self._abandon(download, url)
+
+        async for chunk in download.read():
+            yield chunk
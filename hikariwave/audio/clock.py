@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from hikariwave.internal import constants
+from typing import Union
+
+import asyncio
+import enum
+import time
+import typing
+
+__all__: typing.Sequence[str] = (
+    "FrameClock",
+    "LateFramePolicy",
+)
+
+
+class LateFramePolicy(str, enum.Enum):
+    """Late Frame Policy.
+
+    How a frame clock should behave when it falls behind its schedule.
+    """
+
+    BURST = "burst"
+    """Send late frames back-to-back, without sleeping, until the schedule is caught up."""
+
+    SKIP = "skip"
+    """Drop frames that are more than one frame period late so playback stays aligned with real time."""
+
+
+class FrameClock:
+    """
+    Deadline-based clock that paces frames against a fixed `time.perf_counter()` origin.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, policy: LateFramePolicy = LateFramePolicy.BURST) -> None:
+        """
+        Create a new frame clock.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        policy : LateFramePolicy
+            How the clock should behave when it falls behind its schedule.
+        """
+        self._policy: LateFramePolicy = policy
+        self._period: float = constants.FRAME_LENGTH / 1000
+
+        self._origin: Union[float, None] = None
+        self._frames: int = 0
+        self._skipped: int = 0
+        self._max_lag: float = 0.0
+
+    @property
+    def policy(self) -> LateFramePolicy:
+        """The late-frame policy of this clock."""
+        return self._policy
+
+    @property
+    def frames(self) -> int:
+        """The amount of frame periods that have elapsed since the clock started."""
+        return self._frames
+
+    @property
+    def skipped(self) -> int:
+        """The amount of frames that have been dropped under `LateFramePolicy.SKIP`."""
+        return self._skipped
+
+    @property
+    def deadline(self) -> float:
+        """The `time.perf_counter()` value that the current frame should be sent at."""
+        if self._origin is None:
+            return time.perf_counter()
+
+        return self._origin + self._frames * self._period
+
+    @property
+    def lag(self) -> float:
+        """How far (in seconds) the clock is currently behind its schedule."""
+        if self._origin is None:
+            return 0.0
+
+        return max(0.0, time.perf_counter() - self.deadline)
+
+    @property
+    def max_lag(self) -> float:
+        """The largest lag (in seconds) observed since the clock started."""
+        return self._max_lag
+
+    def start(self) -> None:
+        """
+        Start, or restart, the clock from the current time.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._origin = time.perf_counter()
+        self._frames = 0
+        self._skipped = 0
+        self._max_lag = 0.0
+
+    def advance(self) -> None:
+        """
+        Move the clock on to the next frame deadline.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._frames += 1
+
+    def should_skip(self) -> bool:
+        """
+        Check if the current frame is too late to be sent and should be dropped.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Returns
+        -------
+        bool
+            If the policy is `LateFramePolicy.SKIP` and the current frame is more than one frame period late.
+        """
+        if self._policy is not LateFramePolicy.SKIP or self._origin is None:
+            return False
+
+        if time.perf_counter() - self.deadline < self._period:
+            return False
+
+        self._skipped += 1
+        return True
+
+    async def wait(self) -> None:
+        """
+        Sleep until the deadline of the current frame.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        if self._origin is None:
+            self.start()
+
+        delay: float = self.deadline - time.perf_counter()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+            return
+
+        self._max_lag = max(self._max_lag, -delay)
+
+        # Yield to the event loop even when running late so bursts can't starve it
+        await asyncio.sleep(0)
@@ -1,22 +1,95 @@
 from __future__ import annotations
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from hikariwave.internal import constants
-from nacl.bindings import crypto_aead_xchacha20poly1305_ietf_encrypt
-from nacl.bindings import crypto_secretbox
-from nacl.bindings import crypto_secretbox_NONCEBYTES
-from nacl.utils import random as nacl_random
-from typing import Generator
+from nacl._sodium import ffi as _sodium_ffi  # type: ignore[reportMissingTypeStubs]
+from nacl._sodium import lib as _sodium_lib  # type: ignore[reportMissingTypeStubs]
+from typing import Union
 
+import struct
 import typing
 
 __all__: typing.Sequence[str] = ("EncryptionMode",)
 
+_AES_GCM_TAG_SIZE: typing.Final[int] = 16
+_POLY1305_TAG_SIZE: typing.Final[int] = 16
+_HAS_ENCRYPT_INTO: typing.Final[bool] = hasattr(AESGCM, "encrypt_into")
+_HAS_DECRYPT_INTO: typing.Final[bool] = hasattr(AESGCM, "decrypt_into")
+_NONCE_SUFFIX_SIZE: typing.Final[int] = 4
+_PACKET_BUFFER_SIZE: typing.Final[int] = 2048
+
+_COUNTER_32: typing.Final[struct.Struct] = struct.Struct(">I")
+_COUNTER_96: typing.Final[struct.Struct] = struct.Struct(">IQ")
+_COUNTER_192: typing.Final[struct.Struct] = struct.Struct(">QQQ")
+
+_MASK_32: typing.Final[int] = 0xFFFF_FFFF
+_MASK_64: typing.Final[int] = 0xFFFF_FFFF_FFFF_FFFF
+
+
+class _Pointer(typing.Protocol):
+    """A cffi pointer into a buffer."""
+
+    def __add__(self, offset: int, /) -> _Pointer: ...
+
+
+class _FFI(typing.Protocol):
+    """The part of libsodium's cffi interface that is used here."""
+
+    NULL: _Pointer
+
+    def from_buffer(self, buffer: Union[bytes, bytearray, memoryview], /) -> _Pointer: ...
+
+
+class _Lib(typing.Protocol):
+    """The libsodium functions that are called directly, skipping PyNaCl's copies of their input and output."""
+
+    def crypto_aead_xchacha20poly1305_ietf_encrypt(
+        self,
+        c: _Pointer,
+        clen_p: _Pointer,
+        m: Union[bytes, _Pointer],
+        mlen: int,
+        ad: _Pointer,
+        adlen: int,
+        nsec: _Pointer,
+        npub: _Pointer,
+        k: bytes,
+        /,
+    ) -> int: ...
+
+    def crypto_aead_xchacha20poly1305_ietf_decrypt(
+        self,
+        m: _Pointer,
+        mlen_p: _Pointer,
+        nsec: _Pointer,
+        c: _Pointer,
+        clen: int,
+        ad: _Pointer,
+        adlen: int,
+        npub: _Pointer,
+        k: bytes,
+        /,
+    ) -> int: ...
+
+    def crypto_secretbox_easy(self, c: _Pointer, m: Union[bytes, _Pointer], mlen: int, n: _Pointer, k: bytes, /) -> int: ...
+
+    def randombytes(self, buf: _Pointer, size: int, /) -> None: ...
+
+
+ffi: typing.Final[_FFI] = typing.cast("_FFI", _sodium_ffi)
+lib: typing.Final[_Lib] = typing.cast("_Lib", _sodium_lib)
+
 
 class EncryptionMode:
     """
     Container class for all supported packet encryption modes.
 
+    Every mode assembles its packet into a buffer owned by this instance and returns a `memoryview` over it,
+    which is only valid until the next call to any encryption method of the same instance.
+
+    Received packets are opened into a second buffer, which is only valid until the next call to any `open_`
+    method - Packets can be opened on the event loop while others are sealed in a worker thread.
+
     Warning
     -------
     This is an internal object and should not be instantiated.
@@ -45,49 +118,116 @@ class EncryptionMode:
             raise ValueError(error)
 
         self._secret_key: bytes = secret_key
+        self._aes_gcm: AESGCM = AESGCM(secret_key)
 
-        self._nonce_lite_generator: Generator[bytes, None, None] = (
-            self._generate_nonce_lite()
-        )
-        self._nonce_rndm_generator: Generator[bytes, None, None] = (
-            self._generate_nonce_random()
-        )
-        self._nonce_strd_generator: Generator[bytes, None, None] = (
-            self._generate_nonce_standard()
-        )
-        self._nonce_xcha_generator: Generator[bytes, None, None] = (
-            self._generate_nonce_xchacha()
-        )
+        self._buffer: bytearray = bytearray(_PACKET_BUFFER_SIZE)
+        self._view: memoryview = memoryview(self._buffer)
+        self._pointer: _Pointer = ffi.from_buffer(self._buffer)
+
+        self._nonce_lite: bytearray = bytearray(24)
+        self._nonce_lite_rtpsize: bytearray = bytearray(24)
+        self._nonce_rndm: bytearray = bytearray(24)
+        self._nonce_strd: bytearray = bytearray(12)
+        self._nonce_xcha: bytearray = bytearray(24)
+        self._nonce_xsalsa: bytearray = bytearray(24)
 
-    def _generate_nonce_lite(self) -> Generator[bytes, None, None]:
-        counter: int = 0
+        self._nonce_lite_pointer: _Pointer = ffi.from_buffer(self._nonce_lite)
+        self._nonce_lite_rtpsize_pointer: _Pointer = ffi.from_buffer(self._nonce_lite_rtpsize)
+        self._nonce_rndm_pointer: _Pointer = ffi.from_buffer(self._nonce_rndm)
+        self._nonce_xcha_pointer: _Pointer = ffi.from_buffer(self._nonce_xcha)
+        self._nonce_xsalsa_pointer: _Pointer = ffi.from_buffer(self._nonce_xsalsa)
 
-        while True:
-            yield b"\x00" * 20 + counter.to_bytes(4, "big")
+        self._counter_lite: int = 0
+        self._counter_lite_rtpsize: int = 0
+        self._counter_strd: int = 0
+        self._counter_xcha: int = 0
 
-            counter = (counter + 1) % (constants.BIT_32)
+        self._opened: bytearray = bytearray(_PACKET_BUFFER_SIZE)
+        self._opened_view: memoryview = memoryview(self._opened)
+        self._opened_pointer: _Pointer = ffi.from_buffer(self._opened)
 
-    def _generate_nonce_random(self) -> Generator[bytes, None, None]:
-        while True:
-            yield nacl_random(crypto_secretbox_NONCEBYTES)
+        self._nonce_open_aes: bytearray = bytearray(12)
+        self._nonce_open_xcha: bytearray = bytearray(24)
+        self._nonce_open_xcha_pointer: _Pointer = ffi.from_buffer(self._nonce_open_xcha)
 
-    def _generate_nonce_standard(self) -> Generator[bytes, None, None]:
-        counter: int = 0
+    def _reserve(self, size: int) -> memoryview:
+        if size > len(self._buffer):
+            self._buffer = bytearray(size * 2)
+            self._view = memoryview(self._buffer)
+            self._pointer = ffi.from_buffer(self._buffer)
 
-        while True:
-            yield counter.to_bytes(12, "big")
+        return self._view
 
-            counter = (counter + 1) % (2**96)
+    def _reserve_opened(self, size: int) -> memoryview:
+        if size > len(self._opened):
+            self._opened = bytearray(size * 2)
+            self._opened_view = memoryview(self._opened)
+            self._opened_pointer = ffi.from_buffer(self._opened)
 
-    def _generate_nonce_xchacha(self) -> Generator[bytes, None, None]:
-        counter: int = 0
+        return self._opened_view
 
-        while True:
-            yield counter.to_bytes(24, "big")
+    def _next_nonce_lite(self) -> bytearray:
+        _COUNTER_32.pack_into(self._nonce_lite, 20, self._counter_lite)
+        self._counter_lite = (self._counter_lite + 1) & _MASK_32
 
-            counter = (counter + 1) % (2**192)
+        return self._nonce_lite
 
-    def aead_aes256_gcm(self, header: bytes, data: bytes) -> bytes:
+    def _next_nonce_lite_rtpsize(self) -> bytearray:
+        _COUNTER_32.pack_into(self._nonce_lite_rtpsize, 0, self._counter_lite_rtpsize)
+        self._counter_lite_rtpsize = (self._counter_lite_rtpsize + 1) & _MASK_32
+
+        return self._nonce_lite_rtpsize
+
+    def _next_nonce_standard(self) -> bytearray:
+        counter: int = self._counter_strd
+
+        _COUNTER_96.pack_into(self._nonce_strd, 0, counter >> 64, counter & _MASK_64)
+        self._counter_strd = (counter + 1) % (2**96)
+
+        return self._nonce_strd
+
+    def _next_nonce_xchacha(self) -> bytearray:
+        counter: int = self._counter_xcha
+
+        _COUNTER_192.pack_into(
+            self._nonce_xcha,
+            0,
+            counter >> 128,
+            (counter >> 64) & _MASK_64,
+            counter & _MASK_64,
+        )
+        self._counter_xcha = (counter + 1) % (2**192)
+
+        return self._nonce_xcha
+
+    def _seal_secretbox(
+        self,
+        header: Union[bytes, bytearray, memoryview],
+        data: Union[bytes, memoryview],
+        nonce: _Pointer,
+        suffix: Union[bytes, bytearray, memoryview],
+    ) -> memoryview:
+        header_size: int = len(header)
+        data_size: int = len(data)
+        ciphertext_end: int = header_size + _POLY1305_TAG_SIZE + data_size
+        packet_size: int = ciphertext_end + len(suffix)
+
+        view: memoryview = self._reserve(packet_size)
+        view[:header_size] = header
+
+        lib.crypto_secretbox_easy(
+            self._pointer + header_size,
+            data if isinstance(data, bytes) else ffi.from_buffer(data),
+            data_size,
+            nonce,
+            self._secret_key,
+        )
+
+        view[ciphertext_end:packet_size] = suffix
+
+        return view[:packet_size]
+
+    def aead_aes256_gcm(self, header: Union[bytes, bytearray, memoryview], data: Union[bytes, memoryview]) -> memoryview:
         """
         Encrypts audio data using AEAD AES-256-GCM with an incrementing 12-byte nonce.
 
@@ -98,69 +238,192 @@ class EncryptionMode:
 
         Parameters
         ----------
-        header : bytes
+        header : bytes | bytearray | memoryview
             The RTP header used in this encryption.
-        data : bytes
+        data : bytes | memoryview
             The data to encrypt.
 
         Returns
         -------
-        bytes
-            The encrypted audio data.
+        memoryview
+            The encrypted audio data, valid until the next encryption call.
         """
-        nonce: bytes = next(self._nonce_strd_generator)
-        ciphertext: bytes = AESGCM(self._secret_key).encrypt(nonce, data, header)
+        nonce: bytearray = self._next_nonce_standard()
+
+        header_size: int = len(header)
+        ciphertext_end: int = header_size + len(data) + _AES_GCM_TAG_SIZE
+        packet_size: int = ciphertext_end + 12
+
+        view: memoryview = self._reserve(packet_size)
+        view[:header_size] = header
+
+        if _HAS_ENCRYPT_INTO:
+            self._aes_gcm.encrypt_into(nonce, data, header, view[header_size:ciphertext_end])
+        else:
+            view[header_size:ciphertext_end] = self._aes_gcm.encrypt(nonce, data, header)
 
-        return header + ciphertext + nonce
+        view[ciphertext_end:packet_size] = nonce
 
-    def aead_aes256_gcm_rtpsize(self, header: bytes, data: bytes) -> bytes:
+        return view[:packet_size]
+
+    def aead_aes256_gcm_rtpsize(self, header: Union[bytes, bytearray, memoryview], data: Union[bytes, memoryview]) -> memoryview:
         """
         Encrypts audio data using AEAD AES-256-GCM with a nonce derived from the first 12 bytes of the RTP header.
 
         Parameters
         ----------
-        header : bytes
+        header : bytes | bytearray | memoryview
             The RTP header used in this encryption.
-        data : bytes
+        data : bytes | memoryview
             The data to encrypt.
 
         Returns
         -------
-        bytes
-            The encrypted audio data.
+        memoryview
+            The encrypted audio data, valid until the next encryption call.
         """
-        nonce: bytes = header[:12]
-        ciphertext = AESGCM(self._secret_key).encrypt(nonce, data, header)
+        header_size: int = len(header)
+        packet_size: int = header_size + len(data) + _AES_GCM_TAG_SIZE
+
+        view: memoryview = self._reserve(packet_size)
+        view[:header_size] = header
 
-        return header + ciphertext
+        if _HAS_ENCRYPT_INTO:
+            self._aes_gcm.encrypt_into(view[:12], data, header, view[header_size:packet_size])
+        else:
+            view[header_size:packet_size] = self._aes_gcm.encrypt(view[:12], data, header)
 
-    def aead_xchacha20_poly1305_rtpsize(self, header: bytes, data: bytes) -> bytes:
+        return view[:packet_size]
+
+    def aead_xchacha20_poly1305_rtpsize(self, header: Union[bytes, bytearray, memoryview], data: Union[bytes, memoryview]) -> memoryview:
         """
         Encrypts audio data using AEAD AES-XChaCha20-Poly1305 with a 24-byte, incrementing nonce.
 
         Parameters
         ----------
-        header : bytes
+        header : bytes | bytearray | memoryview
             The RTP header used in this encryption.
-        data : bytes
+        data : bytes | memoryview
             The data to encrypt.
 
         Returns
         -------
-        bytes
-            The encrypted audio data.
+        memoryview
+            The encrypted audio data, valid until the next encryption call.
         """
-        nonce: bytes = next(self._nonce_xcha_generator)
-        ciphertext: bytes = crypto_aead_xchacha20poly1305_ietf_encrypt(
-            data,
-            header,
-            nonce,
+        nonce: bytearray = self._next_nonce_xchacha()
+
+        header_size: int = len(header)
+        data_size: int = len(data)
+        nonce_end: int = header_size + 24
+        packet_size: int = nonce_end + data_size + _POLY1305_TAG_SIZE
+
+        view: memoryview = self._reserve(packet_size)
+        view[:header_size] = header
+        view[header_size:nonce_end] = nonce
+
+        lib.crypto_aead_xchacha20poly1305_ietf_encrypt(
+            self._pointer + nonce_end,
+            ffi.NULL,
+            data if isinstance(data, bytes) else ffi.from_buffer(data),
+            data_size,
+            self._pointer,
+            header_size,
+            ffi.NULL,
+            self._nonce_xcha_pointer,
             self._secret_key,
         )
 
-        return header + nonce + ciphertext
+        return view[:packet_size]
+
+    def open_aead_aes256_gcm_rtpsize(self, packet: Union[bytes, memoryview], header_size: int) -> Union[memoryview, None]:
+        """
+        Decrypts a received packet that was encrypted using AEAD AES-256-GCM, with its 4 byte nonce counter appended to the end of the packet.
+
+        Parameters
+        ----------
+        packet : bytes | memoryview
+            The received packet.
+        header_size : int
+            The size of the packet's unencrypted part - The RTP header, including the 4 byte preamble of its extension if it has one.
+
+        Returns
+        -------
+        memoryview | None
+            The decrypted data, valid until the next decryption call - `None` if the packet failed authentication.
+        """
+        view: memoryview = memoryview(packet)
+        ciphertext_end: int = len(view) - _NONCE_SUFFIX_SIZE
+        data_size: int = ciphertext_end - header_size - _AES_GCM_TAG_SIZE
+
+        if data_size < 0:
+            return None
+
+        self._nonce_open_aes[:_NONCE_SUFFIX_SIZE] = view[ciphertext_end:]
+        opened: memoryview = self._reserve_opened(data_size)
+
+        try:
+            if _HAS_DECRYPT_INTO:
+                self._aes_gcm.decrypt_into(
+                    self._nonce_open_aes,
+                    view[header_size:ciphertext_end],
+                    view[:header_size],
+                    opened[:data_size],
+                )
+            else:
+                opened[:data_size] = self._aes_gcm.decrypt(
+                    self._nonce_open_aes,
+                    view[header_size:ciphertext_end],
+                    view[:header_size],
+                )
+        except InvalidTag:
+            return None
+
+        return opened[:data_size]
+
+    def open_aead_xchacha20_poly1305_rtpsize(self, packet: Union[bytes, memoryview], header_size: int) -> Union[memoryview, None]:
+        """
+        Decrypts a received packet that was encrypted using AEAD XChaCha20-Poly1305, with its 4 byte nonce counter appended to the end of the packet.
+
+        Parameters
+        ----------
+        packet : bytes | memoryview
+            The received packet.
+        header_size : int
+            The size of the packet's unencrypted part - The RTP header, including the 4 byte preamble of its extension if it has one.
+
+        Returns
+        -------
+        memoryview | None
+            The decrypted data, valid until the next decryption call - `None` if the packet failed authentication.
+        """
+        view: memoryview = memoryview(packet)
+        ciphertext_end: int = len(view) - _NONCE_SUFFIX_SIZE
+        data_size: int = ciphertext_end - header_size - _POLY1305_TAG_SIZE
+
+        if data_size < 0:
+            return None
+
+        self._nonce_open_xcha[:_NONCE_SUFFIX_SIZE] = view[ciphertext_end:]
+        opened: memoryview = self._reserve_opened(data_size)
+        pointer: _Pointer = ffi.from_buffer(view)
+
+        if lib.crypto_aead_xchacha20poly1305_ietf_decrypt(
+            self._opened_pointer,
+            ffi.NULL,
+            ffi.NULL,
+            pointer + header_size,
+            ciphertext_end - header_size,
+            pointer,
+            header_size,
+            self._nonce_open_xcha_pointer,
+            self._secret_key,
+        ):
+            return None
+
+        return opened[:data_size]
 
-    def xsalsa20_poly1305(self, header: bytes, data: bytes) -> bytes:
+    def xsalsa20_poly1305(self, header: Union[bytes, bytearray, memoryview], data: Union[bytes, memoryview]) -> memoryview:
         """
         Encrypts audio data using XSalsa20-Poly1305 with a nonce derived from the RTP header.
 
@@ -171,22 +434,21 @@ class EncryptionMode:
 
         Parameters
         ----------
-        header : bytes
+        header : bytes | bytearray | memoryview
             The RTP header used in this encryption.
-        data : bytes
+        data : bytes | memoryview
             The data to encrypt.
 
         Returns
         -------
-        bytes
-            The encrypted audio data.
+        memoryview
+            The encrypted audio data, valid until the next encryption call.
         """
-        nonce: bytes = header.ljust(24, b"\x00")
-        ciphertext: bytes = crypto_secretbox(data, nonce, self._secret_key)
+        self._nonce_xsalsa[: len(header)] = header
 
-        return header + ciphertext
+        return self._seal_secretbox(header, data, self._nonce_xsalsa_pointer, b"")
 
-    def xsalsa20_poly1305_lite(self, header: bytes, data: bytes) -> bytes:
+    def xsalsa20_poly1305_lite(self, header: Union[bytes, bytearray, memoryview], data: Union[bytes, memoryview]) -> memoryview:
         """
         Encrypts audio data using XSalsa20-Poly1305 with a 24 byte nonce composed of 20 null bytes followed by a 4 byte counter.
 
@@ -197,22 +459,21 @@ class EncryptionMode:
 
         Parameters
         ----------
-        header : bytes
+        header : bytes | bytearray | memoryview
             The RTP header used in this encryption.
-        data : bytes
+        data : bytes | memoryview
             The data to encrypt.
 
         Returns
         -------
-        bytes
-            The encrypted audio data.
+        memoryview
+            The encrypted audio data, valid until the next encryption call.
         """
-        nonce: bytes = next(self._nonce_lite_generator)
-        ciphertext: bytes = crypto_secretbox(data, nonce, self._secret_key)
+        self._next_nonce_lite()
 
-        return header + ciphertext
+        return self._seal_secretbox(header, data, self._nonce_lite_pointer, b"")
 
-    def xsalsa20_poly1305_lite_rtpsize(self, header: bytes, data: bytes) -> bytes:
+    def xsalsa20_poly1305_lite_rtpsize(self, header: Union[bytes, bytearray, memoryview], data: Union[bytes, memoryview]) -> memoryview:
         """
         Encrypts audio data using XSalsa20-Poly1305-Lite with a 24 byte nonce composed of a 4 byte incrementing prefix and 20 trailing null bytes.
 
@@ -223,25 +484,21 @@ class EncryptionMode:
 
         Parameters
         ----------
-        header : bytes
+        header : bytes | bytearray | memoryview
             The RTP header used in this encryption.
-        data : bytes
+        data : bytes | memoryview
             The data to encrypt.
 
         Returns
         -------
-        bytes
-            The encrypted audio data.
+        memoryview
+            The encrypted audio data, valid until the next encryption call.
         """
-        full_nonce: bytes = next(self._nonce_strd_generator)
-        lite_nonce: bytes = full_nonce[:4]
-        nonce: bytes = lite_nonce + b"\x00" * 20
-
-        ciphertext: bytes = crypto_secretbox(data, nonce, self._secret_key)
+        nonce: bytearray = self._next_nonce_lite_rtpsize()
 
-        return header + ciphertext + lite_nonce
+        return self._seal_secretbox(header, data, self._nonce_lite_rtpsize_pointer, memoryview(nonce)[:4])
 
-    def xsalsa20_poly1305_suffix(self, header: bytes, data: bytes) -> bytes:
+    def xsalsa20_poly1305_suffix(self, header: Union[bytes, bytearray, memoryview], data: Union[bytes, memoryview]) -> memoryview:
         """
         Encrypts audio data using XSalsa20-Poly1305 using a random 24 byte nonce appended to the end of the encrypted packet.
 
@@ -252,17 +509,16 @@ class EncryptionMode:
 
         Parameters
         ----------
-        header : bytes
+        header : bytes | bytearray | memoryview
             The RTP header used in this encryption.
-        data : bytes
+        data : bytes | memoryview
             The data to encrypt.
 
         Returns
         -------
-        bytes
-            The encrypted audio data.
+        memoryview
+            The encrypted audio data, valid until the next encryption call.
         """
-        nonce: bytes = next(self._nonce_rndm_generator)
-        ciphertext: bytes = crypto_secretbox(data, nonce, self._secret_key)
+        lib.randombytes(self._nonce_rndm_pointer, 24)
 
-        return header + ciphertext + nonce
+        return self._seal_secretbox(header, data, self._nonce_rndm_pointer, self._nonce_rndm)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from hikariwave.internal import constants
+from typing import Union
+
+import logging
+import numpy
+import typing
+
+__all__: typing.Sequence[str] = ("GainStage",)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.gain")
+
+_FRAME_SAMPLES: typing.Final[int] = constants.FRAME_SIZE * constants.CHANNELS
+_RAMP: typing.Final[numpy.ndarray] = numpy.repeat(
+    numpy.arange(1, constants.FRAME_SIZE + 1, dtype=numpy.float32) / constants.FRAME_SIZE,
+    constants.CHANNELS,
+)
+"""Per-sample progress through one frame, from just above `0.0` to exactly `1.0`, repeated for every channel."""
+
+
+class GainStage:
+    """
+    Volume control for 16-bit PCM frames, applied between decoding and Opus encoding.
+
+    At unity gain frames are returned untouched without any computation. A volume change is ramped linearly
+    across the next frame instead of applied in one step, so live changes don't click. Saturation is only
+    computed when the gain is above unity, since attenuated samples can't overflow.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, volume: float = 1.0) -> None:
+        """
+        Create a new gain stage.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        volume : float
+            The starting volume, as a multiplier of the source's amplitude.
+        """
+        self._current: float = volume
+        self._target: float = volume
+
+        self._work: numpy.ndarray = numpy.zeros(_FRAME_SAMPLES, numpy.float32)
+        self._ramp: numpy.ndarray = numpy.zeros(_FRAME_SAMPLES, numpy.float32)
+        self._output: numpy.ndarray = numpy.zeros(_FRAME_SAMPLES, numpy.int16)
+
+    @property
+    def volume(self) -> float:
+        """The volume being applied, as a multiplier of the source's amplitude - `1.0` leaves audio unchanged."""
+        return self._target
+
+    @volume.setter
+    def volume(self, volume: float) -> None:
+        if volume < 0.0:
+            error: str = f"Volume must not be negative, got {volume}"
+            raise ValueError(error)
+
+        self._target = float(volume)
+
+        _logger.debug("Volume set to %s", volume)
+
+    @property
+    def bypassed(self) -> bool:
+        """If frames currently pass through untouched, because the gain is settled at unity."""
+        return self._current == self._target == 1.0
+
+    def process(self, frame: Union[bytes, memoryview]) -> Union[bytes, memoryview]:
+        """
+        Apply the current volume to a full PCM frame.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        frame : bytes | memoryview
+            The 16-bit PCM frame to scale.
+
+        Returns
+        -------
+        bytes | memoryview
+            The frame itself at unity gain, otherwise a view of the stage's own output, valid until the next call.
+        """
+        current: float = self._current
+        target: float = self._target
+
+        if current == target == 1.0 or len(frame) != _FRAME_SAMPLES * 2:
+            return frame
+
+        samples: numpy.ndarray = numpy.frombuffer(frame, numpy.int16)
+
+        if current == target:
+            numpy.multiply(samples, numpy.float32(target), out=self._work)
+        else:
+            numpy.multiply(_RAMP, numpy.float32(target - current), out=self._ramp)
+            numpy.add(self._ramp, numpy.float32(current), out=self._ramp)
+            numpy.multiply(samples, self._ramp, out=self._work)
+
+            self._current = target
+
+        if max(current, target) > 1.0:
+            numpy.minimum(self._work, 32767.0, out=self._work)
+            numpy.maximum(self._work, -32768.0, out=self._work)
+
+        numpy.copyto(self._output, self._work, casting="unsafe")
+
+        return self._output.data.cast("B")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import ctypes
 import os
 import sys
 
 from hikariwave.internal import constants
+from typing import Union
 
 script_dir: str = os.path.dirname(os.path.abspath(__file__))
 bin_dir: str = os.path.join(script_dir, "bin")
@@ -35,9 +37,19 @@ class OpusEncoder:
             "lowdelay": opuslib.APPLICATION_RESTRICTED_LOWDELAY,
         }.get(application, opuslib.APPLICATION_AUDIO)
 
-    def encode(self, pcm_frame: bytes) -> bytes:
+    def encode(self, pcm_frame: Union[bytes, bytearray, memoryview]) -> bytes:
         if len(pcm_frame) != constants.FRAME_SIZE * constants.CHANNELS * 2:
             error: str = f"PCM frame must be {constants.FRAME_SIZE * constants.CHANNELS * 2} bytes"
             raise ValueError(error)
 
-        return self._encoder.encode(pcm_frame, constants.FRAME_SIZE)
+        pcm_data: bytes
+
+        if isinstance(pcm_frame, bytes):
+            pcm_data = pcm_frame
+        elif isinstance(pcm_frame, memoryview) and pcm_frame.readonly:
+            pcm_data = bytes(pcm_frame)
+        else:
+            # opuslib casts its input to a pointer, which only works for bytes and ctypes arrays - Its annotation only admits bytes
+            pcm_data = typing.cast("bytes", (ctypes.c_char * len(pcm_frame)).from_buffer(pcm_frame))
+
+        return self._encoder.encode(pcm_data, constants.FRAME_SIZE)
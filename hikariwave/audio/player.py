@@ -1,22 +1,95 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from hikariwave.audio.buffer import FrameRingBuffer
+from hikariwave.audio.clock import LateFramePolicy
 from hikariwave.audio.opus import OpusEncoder
-from hikariwave.header import Header
+from hikariwave.audio.pump import FramePump
 from hikariwave.internal import constants
+from typing import Union
+from typing_extensions import override
 
 import asyncio
+import logging
 import typing
 
 if typing.TYPE_CHECKING:
+    from hikariwave.audio.encryption import EncryptionMode
+    from hikariwave.audio.gain import GainStage
+    from hikariwave.audio.scheduler import PlaybackScheduler
+    from hikariwave.audio.silence import SilenceDetector
     from hikariwave.audio.source.base import AudioSource
-    from hikariwave.connection import VoiceConnection
-    
-    from typing import Callable
+    from hikariwave.header import RTPHeader
 
-__all__: typing.Sequence[str] = ("AudioPlayer",)
+    from typing import AsyncGenerator
 
+__all__: typing.Sequence[str] = (
+    "AudioPlayer",
+    "PlayerConnection",
+)
 
-class AudioPlayer:
+_logger: logging.Logger = logging.getLogger("hikariwave.player")
+
+_EncryptionMethod = typing.Callable[[Union[bytes, bytearray, memoryview], Union[bytes, memoryview]], memoryview]
+"""An `EncryptionMode` method, sealing an RTP header and its payload into a packet."""
+
+_LOOKAHEAD_FRAMES: typing.Final[int] = 3
+_SILENCE_FRAME: typing.Final[bytes] = b"\xF8\xFF\xFE"
+_SILENCE_FRAMES: typing.Final[int] = 5
+
+
+class PlayerConnection(typing.Protocol):
+    """
+    The media half of a voice connection that an `AudioPlayer` streams to - A `VoiceConnection`, or a shard worker's copy of one.
+
+    Warning
+    -------
+    This is an internal object and should not be implemented.
+    """
+
+    @property
+    def _ssrc(self) -> Union[int, None]:
+        """The SSRC that the connection's packets are sent under."""
+        ...
+
+    @property
+    def _header(self) -> Union[RTPHeader, None]:
+        """The RTP header of the connection's next packet."""
+        ...
+
+    @property
+    def _transport(self) -> Union[asyncio.DatagramTransport, None]:
+        """The UDP transport that packets are sent through."""
+        ...
+
+    @property
+    def _mode(self) -> Union[str, None]:
+        """The name of the encryption mode negotiated with Discord."""
+        ...
+
+    @property
+    def _encryption(self) -> Union[EncryptionMode, None]:
+        """The encryption that seals the connection's packets."""
+        ...
+
+    @property
+    def _gain(self) -> GainStage:
+        """The gain applied to frames before they are encoded."""
+        ...
+
+    @property
+    def _silence(self) -> Union[SilenceDetector, None]:
+        """The detector that suppresses silent frames - If `None`, every frame is sent."""
+        ...
+
+    async def _set_speaking(self, speaking: bool) -> None:
+        """Tell Discord whether the connection is speaking."""
+        ...
+
+
+class AudioPlayer(FramePump):
     """
     Handler class meant to control and handle the playing of audio for each connection.
 
@@ -25,7 +98,16 @@ class AudioPlayer:
     This is an internal object and should not be instantiated.
     """
 
-    def __init__(self, connection: VoiceConnection) -> None:
+    def __init__(
+        self,
+        connection: PlayerConnection,
+        scheduler: Union[PlaybackScheduler, None] = None,
+        *,
+        late_frame_policy: LateFramePolicy = LateFramePolicy.BURST,
+        executor: Union[Executor, None] = None,
+        lookahead: int = _LOOKAHEAD_FRAMES,
+        queue: Union[deque[AudioSource], None] = None,
+    ) -> None:
         """
         Instantiate a new audio player.
 
@@ -35,59 +117,408 @@ class AudioPlayer:
 
         Parameters
         ----------
-        connection : VoiceConnection
+        connection : PlayerConnection
             The connection that this player will interface with.
+        scheduler : PlaybackScheduler | None
+            The shared scheduler that should tick this player - If `None`, the player paces itself.
+        late_frame_policy : LateFramePolicy
+            How the player should behave when it falls behind its send schedule, if it paces itself.
+        executor : concurrent.futures.Executor | None
+            The executor that encodes and encrypts packets off the event loop - If `None`, both happen on the event loop.
+        lookahead : int
+            The amount of frames read ahead of the one being sent - The capacity of the player's ring buffer.
+        queue : deque[AudioSource] | None
+            The sources to play after the current one, which the player consumes from the left - If `None`, the player keeps a queue of its own.
         """
-        self._connection: VoiceConnection = connection
+        super().__init__(scheduler, late_frame_policy, lookahead)
 
-        self._sequence: int = 0
-        self._timestamp: int = 0
+        self._connection: PlayerConnection = connection
+        self._executor: Union[Executor, None] = executor
 
         self._encoder: OpusEncoder = OpusEncoder()
         self._playing: bool = False
 
-        self._encryption_mode: Callable[[bytes, bytes], bytes] = getattr(
+        self._payloads: Union[FrameRingBuffer, None] = FrameRingBuffer(lookahead) if executor else None
+        self._preparing: Union[Future[tuple[bytes, bytes, _EncryptionMethod]], None] = None
+        self._frames_skipped: int = 0
+        self._started: bool = False
+
+        self._source: Union[AudioSource, None] = None
+        self._generation: int = 0
+        self._unsent: int = 0
+
+        self._queue: deque[AudioSource] = queue if queue is not None else deque()
+        self._primed: Union[tuple[AudioSource, AsyncGenerator[bytes, None], asyncio.Future[bytes]], None] = None
+        self._skips: int = 0
+
+        self._quiet: bool = False
+        self._speaking: Union[asyncio.Future[None], None] = None
+
+        self._encryption_mode: _EncryptionMethod = getattr(
             self._connection._encryption,
             self._connection._mode if self._connection._mode else '',
         )
 
-    async def _send_packet(self, frame: bytes, encode_to_opus: bool) -> None:
-        if not frame or not self._connection._transport:
-            return
+    @property
+    def lag(self) -> float:
+        """How far (in seconds) this player is currently behind its send schedule."""
+        if self._scheduler:
+            return self._scheduler.lag
+
+        return self._clock.lag
+
+    @property
+    def max_lag(self) -> float:
+        """The largest lag (in seconds) this player's clock has observed."""
+        if self._scheduler:
+            return self._scheduler.max_lag
+
+        return self._clock.max_lag
+
+    @property
+    def frames_skipped(self) -> int:
+        """The amount of frames dropped for being late during the current source."""
+        return self._frames_skipped
+
+    @property
+    def buffer(self) -> FrameRingBuffer:
+        """The read-ahead buffer between the current source and the send schedule."""
+        return self._frames
 
-        if encode_to_opus:
-            if (frame_length := len(frame)) < (frame_total := constants.FRAME_SIZE * 4):
-                frame += b"\x00" * (frame_total - frame_length)
+    @property
+    def queue(self) -> deque[AudioSource]:
+        """The sources waiting to be played after the current one."""
+        return self._queue
 
-            frame = self._encoder.encode(frame)
-    
-        rtp_header: bytes = Header.create_rtp(
-            self._sequence,
-            self._timestamp,
-            self._connection._ssrc if self._connection._ssrc else 0,
+    @property
+    def queue_depth(self) -> int:
+        """The amount of frames currently read ahead of the one being sent."""
+        return len(self._frames)
+
+    @property
+    def underruns(self) -> int:
+        """The amount of ticks that found no frame to send after playback of the current source had started."""
+        return self._frames.underruns
+
+    @property
+    def quiet(self) -> bool:
+        """If transmission is currently suppressed because the current source is silent."""
+        return self._quiet
+
+    def _flush(self) -> None:
+        if self._executor:
+            self._unsent += len(self._frames)
+
+        self._frames.clear()
+
+        if self._payloads is not None:
+            self._payloads.clear()
+
+        self._generation += 1
+        self._started = False
+        self._frames_wanted.set()
+
+    async def _settle(self) -> None:
+        # A cancelled await doesn't stop a packet already being prepared, which must finish before the next starts
+        if self._preparing and not self._preparing.done():
+            await asyncio.wait((asyncio.wrap_future(self._preparing),))
+
+    def _rebind(self) -> None:
+        self._encryption_mode = getattr(
+            self._connection._encryption,
+            self._connection._mode if self._connection._mode else '',
         )
 
-        encrypted_packet: bytes = self._encryption_mode(rtp_header, frame)
+        if self._payloads is None:
+            return
+
+        for _ in range(len(self._frames)):
+            packet: Union[memoryview, None] = self._frames.pop()
+            payload: Union[memoryview, None] = self._payloads.pop()
+
+            if packet is None or payload is None:
+                break
+
+            self._frames.push(self._reseal(packet, payload) if packet else b"")
+            self._payloads.push(payload)
+
+    def _reseal(self, packet: Union[bytes, memoryview], payload: Union[bytes, memoryview]) -> bytes:
+        header_size: int = len(self._connection._header.view) if self._connection._header else 12
+        header: bytearray = bytearray(packet[:header_size])
+        header[8:12] = (self._connection._ssrc if self._connection._ssrc else 0).to_bytes(4, "big")
+
+        return bytes(self._encryption_mode(header, payload))
+
+    def _next_frame(self) -> Union[memoryview, None]:
+        frame: Union[memoryview, None] = self._frames.pop()
+
+        if self._payloads is not None:
+            self._payloads.pop()
+
+        if frame is None:
+            if self._exhausted or not self._playing:
+                self._finish()
+            elif self._started:
+                self._frames.record_underrun()
+
+            return None
+
+        self._started = True
+        self._frame_taken()
+
+        return frame
+
+    def _encode(self, frame: Union[bytes, memoryview]) -> bytes:
+        frame_total: int = constants.FRAME_SIZE * constants.CHANNELS * 2
+
+        if (frame_length := len(frame)) < frame_total:
+            frame = bytes(frame) + b"\x00" * (frame_total - frame_length)
+
+        return self._encoder.encode(self._connection._gain.process(frame))
+
+    def _prepare(self, frame: Union[bytes, memoryview], encode_to_opus: bool) -> tuple[bytes, bytes, _EncryptionMethod]:
+        encryption_mode: _EncryptionMethod = self._encryption_mode
+        header: Union[RTPHeader, None] = self._connection._header
+
+        if not header:
+            return b"", b"", encryption_mode
+
+        if not frame:
+            header.skip()
+            return b"", b"", encryption_mode
+
+        payload: bytes = self._encode(frame) if encode_to_opus else bytes(frame)
+        packet: bytes = bytes(encryption_mode(header.view, payload))
+        header.advance()
+
+        return payload, packet, encryption_mode
+
+    def _send_packet(self, frame: Union[bytes, memoryview]) -> None:
+        header: Union[RTPHeader, None] = self._connection._header
+
+        if not frame or not header or not self._connection._transport:
+            return
+
+        encrypted_packet: memoryview = self._encryption_mode(header.view, frame)
         self._connection._transport.sendto(encrypted_packet)
 
-        self._sequence = (self._sequence + 1) % constants.BIT_16
-        self._timestamp = (self._timestamp + constants.FRAME_SIZE) % (constants.BIT_32)
+        header.advance()
+
+    def _skip_packet(self) -> None:
+        if self._connection._header and not self._executor:
+            self._connection._header.skip()
+
+    @override
+    def _tick(self) -> None:
+        if not self._connection._transport:
+            self._finish()
+            return
+
+        frame: Union[memoryview, None] = self._next_frame()
 
-        await asyncio.sleep(constants.FRAME_LENGTH / 1000)
+        if frame is None:
+            return
+
+        if not frame:
+            if not self._quiet:
+                self._announce(False)
+
+            self._skip_packet()
+            return
+
+        if self._quiet:
+            self._announce(True)
+
+        if self._executor:
+            if frame:
+                self._connection._transport.sendto(frame)
+        else:
+            self._send_packet(frame)
+
+    def _announce(self, speaking: bool) -> None:
+        self._quiet = not speaking
+        self._speaking = asyncio.ensure_future(self._connection._set_speaking(speaking))
+
+    @override
+    def _skip_tick(self) -> None:
+        if self._next_frame() is None:
+            return
+
+        self._skip_packet()
+        self._frames_skipped += 1
+
+    def _prime(self) -> None:
+        if self._primed or not self._queue:
+            return
+
+        source: AudioSource = self._queue[0]
+        frames: AsyncGenerator[bytes, None] = source.decode() # type: ignore
+
+        self._primed = (source, frames, asyncio.ensure_future(frames.__anext__()))
+
+    async def _unprime(self) -> None:
+        if not self._primed:
+            return
+
+        _, frames, first = self._primed
+        self._primed = None
+
+        first.cancel()
+
+        try:
+            await first
+        except (asyncio.CancelledError, StopAsyncIteration, Exception):
+            pass
+
+        await frames.aclose()
+
+    async def _next_source(self) -> Union[tuple[AudioSource, AsyncGenerator[bytes, None]], None]:
+        if not self._queue:
+            await self._unprime()
+            return None
+
+        source: AudioSource = self._queue.popleft()
+
+        if not self._primed or self._primed[0] is not source:
+            await self._unprime()
+            return source, source.decode() # type: ignore
+
+        _, frames, first = self._primed
+        self._primed = None
+
+        async def resume() -> AsyncGenerator[bytes, None]:
+            try:
+                yield await first
+            except StopAsyncIteration:
+                return
+
+            try:
+                async for frame in frames:
+                    yield frame
+            finally:
+                await frames.aclose()
+
+        return source, resume()
+
+    async def _push(self, frame: Union[bytes, memoryview], encode_to_opus: bool, finished: asyncio.Future[None]) -> bool:
+        payload: bytes = b""
+
+        if self._executor:
+            generation: int = self._generation
+            await self._settle()
+
+            if self._unsent and self._connection._header:
+                self._connection._header.rewind(self._unsent)
+                self._unsent = 0
+
+            self._preparing = self._executor.submit(self._prepare, frame, encode_to_opus)
+            payload, frame, encryption_mode = await asyncio.wrap_future(self._preparing)
+
+            if finished.done():
+                return False
+
+            if generation != self._generation:
+                self._unsent += 1 if frame else 0
+                return True
+
+            if frame and encryption_mode is not self._encryption_mode:
+                frame = self._reseal(frame, payload)
+        elif encode_to_opus and frame:
+            frame = self._encode(frame)
 
-    async def _playback(self, source: AudioSource, encode_to_opus: bool) -> None:
         try:
-            async for pcm_frame in source.decode(): # type: ignore
-                if not self._playing or not self._connection._transport:
+            if self._frames.push(frame) and self._payloads is not None:
+                self._payloads.push(payload)
+        except ValueError as e:
+            _logger.warning("Dropped frame: %s", e)
+
+        await self._wait_for_room()
+
+        return True
+
+    async def _feed_source(
+        self,
+        frames: AsyncGenerator[bytes, None],
+        encode_to_opus: bool,
+        finished: asyncio.Future[None],
+        use_queue: bool,
+    ) -> bool:
+        silence: Union[SilenceDetector, None] = self._connection._silence if encode_to_opus else None
+        skips: int = self._skips
+        trailer: int = 0
+
+        async for frame in frames:
+            if not self._playing or finished.done():
+                return False
+
+            if skips != self._skips:
+                return True
+
+            if use_queue and self._queue and not self._primed:
+                self._prime()
+
+            if silence:
+                if not silence.suppressing:
+                    trailer = _SILENCE_FRAMES
+
+                if silence.suppress(frame):
+                    # The first suppressed frames are sent as Opus silence, so the stream ends without a gap in its timing
+                    if trailer:
+                        trailer -= 1
+
+                        if not await self._push(_SILENCE_FRAME, False, finished):
+                            return False
+
+                        continue
+
+                    frame = b""
+
+            if not await self._push(frame, encode_to_opus, finished):
+                return False
+
+        return True
+
+    async def _feed(
+        self,
+        source: AudioSource,
+        encode_to_opus: bool,
+        finished: asyncio.Future[None],
+        use_queue: bool,
+    ) -> None:
+        frames: AsyncGenerator[bytes, None] = source.decode() # type: ignore
+
+        try:
+            while await self._feed_source(frames, encode_to_opus, finished, use_queue) and use_queue:
+                await frames.aclose()
+
+                following: Union[tuple[AudioSource, AsyncGenerator[bytes, None]], None] = await self._next_source()
+
+                if not following:
                     break
 
-                await self._send_packet(pcm_frame, encode_to_opus) # type: ignore
+                source, frames = following
+                encode_to_opus = not source.encoded
+                self._source = source
         except (StopIteration, StopAsyncIteration):
-            return
+            pass
+        finally:
+            await frames.aclose()
+
+            if use_queue:
+                await self._unprime()
 
-    async def play(self, source: AudioSource, encode_to_opus: bool = True) -> None:
+            if self._finished is finished:
+                self._exhausted = True
+
+    async def play(
+        self,
+        source: AudioSource,
+        encode_to_opus: Union[bool, None] = None,
+        *,
+        use_queue: bool = True,
+    ) -> None:
         """
-        Play the selected audio source and stream it to the connection.
+        Play the selected audio source and stream it to the connection, followed by every queued source.
 
         Warning
         -------
@@ -97,15 +528,76 @@ class AudioPlayer:
         ----------
         source : AudioSource
             The audio source to stream from.
-        encode_to_opus : bool
-            If this source should encode into Opus before encryption.
+        encode_to_opus : bool | None
+            If this source should encode into Opus before encryption - If `None`, sources that are not already encoded are encoded.
+        use_queue : bool
+            If queued sources should be played after this one - Their decoding starts before the current source ends, so tracks join without a gap.
+
+        Raises
+        ------
+        Exception
+            Whatever a source, or the encoding of its frames, raised - Playback stops as soon as it does.
         """
+        if encode_to_opus is None:
+            encode_to_opus = not source.encoded
+
         if self._playing:
             await self.stop()
 
         self._playing = True
+        self._source = source
+        self._exhausted = False
+        self._frames.reset()
+
+        if self._payloads is not None:
+            self._payloads.clear()
+        self._frames_skipped = 0
+
+        if self._connection._silence:
+            self._connection._silence.reset()
+        self._started = False
+        finished: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._finished = finished
 
-        await self._playback(source, encode_to_opus)
+        await self._pump(self._feed(source, encode_to_opus, finished, use_queue), finished)
+
+    def seek(self, seconds: float) -> None:
+        """
+        Move playback of the current source to a new position, dropping every frame read ahead of it.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        seconds : float
+            The position to move to, from the start of the source.
+
+        Raises
+        ------
+        NotImplementedError
+            If the current source can't seek.
+        """
+        if not self._source or not self._playing:
+            return
+
+        self._source.seek(seconds)
+        self._flush()
+
+    def skip(self) -> None:
+        """
+        End the current source immediately, moving on to the next queued source.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        if not self._playing:
+            return
+
+        self._skips += 1
+        self._flush()
 
     async def stop(self) -> None:
         """
@@ -116,3 +608,10 @@ class AudioPlayer:
         This is an internal method and should not be called.
         """
         self._playing = False
+        self._frames.clear()
+
+        if self._payloads is not None:
+            self._payloads.clear()
+
+        self._frames_wanted.set()
+        self._finish()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from hikariwave.audio.buffer import FrameRingBuffer
+from hikariwave.audio.clock import FrameClock
+from hikariwave.audio.clock import LateFramePolicy
+from typing import Union
+
+import asyncio
+import typing
+
+if typing.TYPE_CHECKING:
+    from hikariwave.audio.scheduler import PlaybackScheduler
+
+    from typing import Coroutine
+
+__all__: typing.Sequence[str] = ("FramePump",)
+
+
+class FramePump:
+    """
+    Base of the objects that stream frames on the frame clock - `AudioPlayer` and `Broadcast`.
+
+    A feeder task reads frames ahead into a ring buffer, waiting whenever it is full, and every frame period
+    the pump is ticked to send the next one - Either by its own clock, or by a shared `PlaybackScheduler`.
+    A feeder that fails finishes the pump with its exception.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(
+        self,
+        scheduler: Union[PlaybackScheduler, None],
+        late_frame_policy: LateFramePolicy,
+        lookahead: int,
+    ) -> None:
+        """
+        Create a new frame pump.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        scheduler : PlaybackScheduler | None
+            The shared scheduler that should tick this pump - If `None`, the pump paces itself.
+        late_frame_policy : LateFramePolicy
+            How the pump should behave when it falls behind its send schedule, if it paces itself.
+        lookahead : int
+            The amount of frames read ahead of the one being sent - The capacity of the pump's ring buffer.
+        """
+        self._scheduler: Union[PlaybackScheduler, None] = scheduler
+        self._clock: FrameClock = FrameClock(late_frame_policy)
+
+        self._frames: FrameRingBuffer = FrameRingBuffer(lookahead)
+        self._frames_wanted: asyncio.Event = asyncio.Event()
+        self._exhausted: bool = False
+        self._finished: Union[asyncio.Future[None], None] = None
+
+    def _finish(self) -> None:
+        if self._finished and not self._finished.done():
+            self._finished.set_result(None)
+
+    def _tick(self) -> None:
+        raise NotImplementedError
+
+    def _skip_tick(self) -> None:
+        raise NotImplementedError
+
+    def _frame_taken(self) -> None:
+        if len(self._frames) <= self._frames.capacity // 2:
+            self._frames_wanted.set()
+
+    async def _wait_for_room(self) -> None:
+        if self._frames.full:
+            self._frames_wanted.clear()
+            await self._frames_wanted.wait()
+
+    async def _pace(self, finished: asyncio.Future[None]) -> None:
+        self._clock.start()
+
+        while not finished.done():
+            await self._clock.wait()
+
+            if self._clock.should_skip():
+                self._skip_tick()
+            else:
+                self._tick()
+
+            self._clock.advance()
+
+    async def _pump(self, feeder: Coroutine[typing.Any, typing.Any, None], finished: asyncio.Future[None]) -> None:
+        """
+        Tick this pump while a feeder fills its buffer, until it finishes.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        feeder : Coroutine[typing.Any, typing.Any, None]
+            The coroutine that reads frames into the buffer - It should set `_exhausted` once it runs out of frames.
+        finished : asyncio.Future[None]
+            The future that completes once the pump should stop.
+
+        Raises
+        ------
+        Exception
+            Whatever the feeder raised.
+        """
+        async def feed() -> None:
+            try:
+                await feeder
+            except Exception as e:
+                if not finished.done():
+                    finished.set_exception(e)
+
+        feeding: asyncio.Task[None] = asyncio.create_task(feed())
+        pacer: Union[asyncio.Task[None], None] = None
+
+        if self._scheduler:
+            self._scheduler.register(self)
+        else:
+            pacer = asyncio.create_task(self._pace(finished))
+
+        try:
+            await finished
+        finally:
+            if self._scheduler and self._finished is finished:
+                self._scheduler.unregister(self)
+
+            for task in (feeding, pacer):
+                if task:
+                    task.cancel()
+                    await asyncio.wait((task,))
+
+            # Only does anything if the feeder was stopped before it started
+            feeder.close()
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+from hikariwave.audio.buffer import FrameRingBuffer
+from typing import Union
+
+import asyncio
+import hikari
+import logging
+import struct
+import typing
+
+if typing.TYPE_CHECKING:
+    from hikariwave.audio.encryption import EncryptionMode
+
+    from typing import Callable
+
+__all__: typing.Sequence[str] = ("AudioReceiver",)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.receive")
+
+_RTP_HEADER_SIZE: typing.Final[int] = 12
+_RTP_FIELDS: typing.Final[struct.Struct] = struct.Struct(">H4xI")
+"""The sequence and SSRC of an RTP header, unpacked from its third byte."""
+_OPUS_PAYLOAD_TYPE: typing.Final[int] = 0x78
+_TRAILER_SIZE: typing.Final[int] = 20
+"""The authentication tag and nonce suffix that follow the encrypted data of every supported mode."""
+_MAX_PACKET_SIZE: typing.Final[int] = 1500
+"""Packets beyond a standard MTU aren't sent by Discord, and would not fit a frame slot."""
+_SEQUENCE_HALF: typing.Final[int] = 0x8000
+_CAPACITY: typing.Final[int] = 50
+
+
+class _Stream:
+    """The frames received from a single SSRC."""
+
+    def __init__(self, capacity: int) -> None:
+        self._frames: FrameRingBuffer = FrameRingBuffer(capacity, _MAX_PACKET_SIZE)
+        self._sequence: int = 0
+
+
+class AudioReceiver:
+    """
+    Receives the audio other users send to a connection's channel, as Opus frames buffered per user.
+
+    Each packet is parsed and decrypted straight from its datagram, then demultiplexed by SSRC into a ring
+    buffer per stream, so nothing is kept per packet beyond the copy of its payload. SSRCs are mapped to
+    users from the `SPEAKING` payloads Discord sends as users start talking - Frames that arrive before
+    their user is known are kept, and can be read once it is.
+
+    Frames are read in order of arrival. Late and duplicate packets are dropped, and when a user's frames
+    aren't read for longer than the buffer holds, the oldest are overwritten.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, capacity: int = _CAPACITY) -> None:
+        """
+        Create a new audio receiver.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        capacity : int
+            The amount of frames buffered per user before the oldest are overwritten.
+        """
+        self._capacity: int = capacity
+
+        self._open: Union[Callable[[bytes, int], Union[memoryview, None]], None] = None
+        self._streams: dict[int, _Stream] = {}
+        self._users: dict[int, hikari.Snowflake] = {}
+        self._ssrcs: dict[hikari.Snowflake, int] = {}
+        self._connected: set[hikari.Snowflake] = set()
+        self._arrived: asyncio.Event = asyncio.Event()
+
+        self._packets_received: int = 0
+        self._packets_dropped: int = 0
+        self._packets_lost: int = 0
+        self._frames_overwritten: int = 0
+
+    @property
+    def users(self) -> tuple[hikari.Snowflake, ...]:
+        """The users known to be connected to the channel."""
+        return tuple(self._connected)
+
+    @property
+    def speakers(self) -> tuple[hikari.Snowflake, ...]:
+        """The users that have frames waiting to be read."""
+        return tuple(
+            user_id
+            for ssrc, user_id in self._users.items()
+            if ssrc in self._streams and len(self._streams[ssrc]._frames)
+        )
+
+    @property
+    def packets_received(self) -> int:
+        """The amount of Opus packets received from the voice server."""
+        return self._packets_received
+
+    @property
+    def packets_dropped(self) -> int:
+        """The amount of received packets that were discarded - Malformed, failed authentication, or arrived after a later packet of their stream."""
+        return self._packets_dropped
+
+    @property
+    def packets_lost(self) -> int:
+        """The amount of packets that never arrived, going by the gaps in each stream's sequence."""
+        return self._packets_lost
+
+    @property
+    def frames_overwritten(self) -> int:
+        """The amount of frames that were overwritten before they were read."""
+        return self._frames_overwritten
+
+    def user(self, ssrc: int) -> Union[hikari.Snowflake, None]:
+        """
+        Get the user that sends audio under an SSRC.
+
+        Parameters
+        ----------
+        ssrc : int
+            The SSRC to look up.
+
+        Returns
+        -------
+        hikari.Snowflake | None
+            The ID of the user - `None` if the SSRC isn't mapped to a user yet.
+        """
+        return self._users.get(ssrc, None)
+
+    def ssrc(self, user_id: hikari.Snowflake) -> Union[int, None]:
+        """
+        Get the SSRC that a user sends audio under.
+
+        Parameters
+        ----------
+        user_id : hikari.Snowflake
+            The ID of the user to look up.
+
+        Returns
+        -------
+        int | None
+            The SSRC - `None` if the user hasn't spoken yet.
+        """
+        return self._ssrcs.get(user_id, None)
+
+    def read(self, user_id: hikari.Snowflake) -> Union[memoryview, None]:
+        """
+        Take the oldest unread Opus frame that a user sent.
+
+        Parameters
+        ----------
+        user_id : hikari.Snowflake
+            The ID of the user to read from.
+
+        Returns
+        -------
+        memoryview | None
+            A view of the frame, valid until as many frames again have arrived from the user - `None` if no frame is waiting.
+        """
+        ssrc: Union[int, None] = self._ssrcs.get(user_id, None)
+
+        if ssrc is None:
+            return None
+
+        stream: Union[_Stream, None] = self._streams.get(ssrc, None)
+
+        if stream is None:
+            return None
+
+        return stream._frames.pop()
+
+    async def wait(self) -> None:
+        """Wait until any user has a frame waiting to be read."""
+        while not self.speakers:
+            self._arrived.clear()
+            await self._arrived.wait()
+
+    def _receive(self, packet: bytes) -> None:
+        size: int = len(packet)
+
+        if size < _RTP_HEADER_SIZE or size > _MAX_PACKET_SIZE or packet[1] & 0x7F != _OPUS_PAYLOAD_TYPE:
+            return
+
+        if self._open is None:
+            return
+
+        self._packets_received += 1
+
+        first: int = packet[0]
+        header_size: int = _RTP_HEADER_SIZE + (first & 0x0F) * 4
+        extension_size: int = 0
+
+        if first & 0x10:
+            header_size += 4
+
+        if first & 0xC0 != 0x80 or header_size + _TRAILER_SIZE > size:
+            self._packets_dropped += 1
+            return
+
+        if first & 0x10:
+            extension_size = (packet[header_size - 2] << 8 | packet[header_size - 1]) * 4
+
+        data: Union[memoryview, None] = self._open(packet, header_size)
+
+        if data is None:
+            self._packets_dropped += 1
+            return
+
+        end: int = len(data)
+
+        if first & 0x20 and end:
+            end -= data[end - 1]
+
+        if extension_size > end:
+            self._packets_dropped += 1
+            return
+
+        sequence, ssrc = _RTP_FIELDS.unpack_from(packet, 2)
+        stream: Union[_Stream, None] = self._streams.get(ssrc, None)
+
+        if stream is None:
+            stream = self._streams[ssrc] = _Stream(self._capacity)
+        else:
+            gap: int = (sequence - stream._sequence) & 0xFFFF
+
+            if not gap or gap >= _SEQUENCE_HALF:
+                self._packets_dropped += 1
+                return
+
+            self._packets_lost += gap - 1
+
+        stream._sequence = sequence
+        frames: FrameRingBuffer = stream._frames
+
+        if frames.full:
+            frames.pop()
+            self._frames_overwritten += 1
+
+        frames.push(data[extension_size:end])
+        self._arrived.set()
+
+    def _rebind(self, encryption: EncryptionMode, mode: str) -> None:
+        """
+        Open packets with a new session's encryption, forgetting the SSRCs of any previous voice server.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        encryption : EncryptionMode
+            The new session's encryption.
+        mode : str
+            The encryption mode the session negotiated.
+        """
+        if self._open is not None:
+            self._streams.clear()
+            self._users.clear()
+            self._ssrcs.clear()
+
+        self._open = getattr(encryption, "open_" + mode, None)
+
+        if self._open is None:
+            _logger.warning("Audio can't be received with encryption mode %s", mode)
+
+    def _speaking(self, user_id: hikari.Snowflake, ssrc: int) -> None:
+        """
+        Map an SSRC to the user that sends audio under it.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        user_id : hikari.Snowflake
+            The ID of the user.
+        ssrc : int
+            The SSRC the user sends audio under.
+        """
+        previous_ssrc: Union[int, None] = self._ssrcs.get(user_id, None)
+
+        if previous_ssrc is not None and previous_ssrc != ssrc:
+            self._users.pop(previous_ssrc, None)
+            self._streams.pop(previous_ssrc, None)
+
+        previous_user: Union[hikari.Snowflake, None] = self._users.get(ssrc, None)
+
+        if previous_user is not None and previous_user != user_id:
+            self._ssrcs.pop(previous_user, None)
+
+        self._users[ssrc] = user_id
+        self._ssrcs[user_id] = ssrc
+        self._connected.add(user_id)
+
+        if ssrc in self._streams and len(self._streams[ssrc]._frames):
+            self._arrived.set()
+
+    def _clients_connect(self, user_ids: typing.Sequence[hikari.Snowflake]) -> None:
+        """
+        Record users that connected to the channel.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        user_ids : typing.Sequence[hikari.Snowflake]
+            The IDs of the users.
+        """
+        self._connected.update(user_ids)
+
+    def _client_disconnect(self, user_id: hikari.Snowflake) -> None:
+        """
+        Forget a user that disconnected from the channel, along with its unread frames.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        user_id : hikari.Snowflake
+            The ID of the user.
+        """
+        self._connected.discard(user_id)
+
+        ssrc: Union[int, None] = self._ssrcs.pop(user_id, None)
+
+        if ssrc is None:
+            return
+
+        self._users.pop(ssrc, None)
+        self._streams.pop(ssrc, None)
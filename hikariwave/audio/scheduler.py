@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from hikariwave.audio.clock import FrameClock
+from hikariwave.audio.clock import LateFramePolicy
+from typing import Union
+
+import asyncio
+import logging
+import typing
+
+__all__: typing.Sequence[str] = (
+    "PlaybackScheduler",
+    "Tickable",
+)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.scheduler")
+
+
+class Tickable(typing.Protocol):
+    """
+    Anything a `PlaybackScheduler` can drive - Audio players and broadcasts.
+
+    Warning
+    -------
+    This is an internal object and should not be implemented.
+    """
+
+    def _tick(self) -> None:
+        """Send the next frame."""
+        ...
+
+    def _skip_tick(self) -> None:
+        """Drop the next frame, since the tick is too late to send it."""
+        ...
+
+    def _finish(self) -> None:
+        """Finish playback, since ticking failed."""
+        ...
+
+
+class PlaybackScheduler:
+    """
+    Process-wide ticker that drives every registered audio player and broadcast from a single frame clock.
+
+    Once per frame period, the scheduler asks each registered player to send its next frame, so the amount
+    of timer wakeups stays constant no matter how many connections are playing.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, late_frame_policy: LateFramePolicy = LateFramePolicy.BURST) -> None:
+        """
+        Create a new playback scheduler.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        late_frame_policy : LateFramePolicy
+            How the scheduler should behave when a tick falls behind its schedule.
+        """
+        self._clock: FrameClock = FrameClock(late_frame_policy)
+        self._players: dict[Tickable, None] = {}
+        self._task: Union[asyncio.Task[None], None] = None
+
+        self._ticks: int = 0
+
+    @property
+    def lag(self) -> float:
+        """How far (in seconds) the scheduler is currently behind its tick schedule."""
+        return self._clock.lag
+
+    @property
+    def max_lag(self) -> float:
+        """The largest lag (in seconds) observed since the scheduler last started ticking."""
+        return self._clock.max_lag
+
+    @property
+    def players(self) -> int:
+        """The amount of players currently registered with the scheduler."""
+        return len(self._players)
+
+    @property
+    def ticks(self) -> int:
+        """The total amount of ticks the scheduler has run."""
+        return self._ticks
+
+    @property
+    def ticks_skipped(self) -> int:
+        """The amount of ticks dropped under `LateFramePolicy.SKIP` since the scheduler last started ticking."""
+        return self._clock.skipped
+
+    async def _run(self) -> None:
+        self._clock.start()
+
+        _logger.debug("Playback scheduler started")
+
+        try:
+            while self._players:
+                await self._clock.wait()
+
+                skip: bool = self._clock.should_skip()
+
+                for player in tuple(self._players):
+                    try:
+                        if skip:
+                            player._skip_tick()
+                        else:
+                            player._tick()
+                    except Exception:
+                        _logger.exception("Player failed to tick, finishing its playback")
+
+                        self.unregister(player)
+                        player._finish()
+
+                self._clock.advance()
+                self._ticks += 1
+        finally:
+            self._task = None
+
+            _logger.debug("Playback scheduler stopped")
+
+    def register(self, player: Tickable) -> None:
+        """
+        Register a player so it is ticked once per frame period.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        player : Tickable
+            The player or broadcast to drive.
+        """
+        self._players[player] = None
+
+        if not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    def unregister(self, player: Tickable) -> None:
+        """
+        Stop ticking a player.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        player : Tickable
+            The player or broadcast to stop driving.
+        """
+        self._players.pop(player, None)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from hikariwave.internal import constants
+from typing import Union
+
+import logging
+import numpy
+import typing
+
+__all__: typing.Sequence[str] = ("SilenceDetector",)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.silence")
+
+_FRAME_SAMPLES: typing.Final[int] = constants.FRAME_SIZE * constants.CHANNELS
+_FULL_SCALE: typing.Final[float] = 32768.0
+
+
+class SilenceDetector:
+    """
+    Per-frame energy detection on 16-bit PCM, deciding which frames don't need to be transmitted at all.
+
+    A frame is silent when its RMS level is below the threshold. Once audio has stayed silent for the
+    hangover period, frames are suppressed until a frame above the threshold arrives, so short pauses
+    between words or notes are still transmitted.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, threshold: float = -60.0, hangover: int = 10) -> None:
+        """
+        Create a new silence detector.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        threshold : float
+            The RMS level (in dBFS) below which a frame is silent.
+        hangover : int
+            The amount of consecutive silent frames that are still transmitted before suppression starts.
+        """
+        self._threshold: float = threshold
+        self._hangover: int = hangover
+
+        amplitude: float = _FULL_SCALE * 10 ** (threshold / 20)
+        self._energy_threshold: float = amplitude * amplitude
+
+        self._work: numpy.ndarray = numpy.zeros(_FRAME_SAMPLES, numpy.float32)
+        self._run: int = 0
+
+        self._frames_suppressed: int = 0
+        self._suppressions: int = 0
+
+    @property
+    def threshold(self) -> float:
+        """The RMS level (in dBFS) below which a frame is silent."""
+        return self._threshold
+
+    @property
+    def suppressing(self) -> bool:
+        """If frames are currently being suppressed."""
+        return self._run > self._hangover
+
+    @property
+    def frames_suppressed(self) -> int:
+        """The amount of frames that weren't encoded because they were silent - Past the first few of each stretch, sent as Opus silence, they weren't sent either."""
+        return self._frames_suppressed
+
+    @property
+    def suppressions(self) -> int:
+        """The amount of times transmission stopped for a stretch of silence."""
+        return self._suppressions
+
+    def silent(self, frame: Union[bytes, memoryview]) -> bool:
+        """
+        Check if a PCM frame's RMS level is below the threshold.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        frame : bytes | memoryview
+            The 16-bit PCM frame to measure.
+
+        Returns
+        -------
+        bool
+            If the frame is silent.
+        """
+        samples: numpy.ndarray = numpy.frombuffer(frame, numpy.int16)
+        length: int = len(samples)
+
+        if not length:
+            return True
+
+        work: numpy.ndarray = self._work[:length]
+        numpy.copyto(work, samples)
+
+        return float(numpy.dot(work, work)) < self._energy_threshold * length
+
+    def suppress(self, frame: Union[bytes, memoryview]) -> bool:
+        """
+        Measure the next PCM frame of a stream and decide if it should be suppressed.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        frame : bytes | memoryview
+            The 16-bit PCM frame to measure.
+
+        Returns
+        -------
+        bool
+            If the frame should not be transmitted.
+        """
+        if not self.silent(frame):
+            if self._run > self._hangover:
+                _logger.debug("Audio resumed after %s suppressed frames", self._run - self._hangover)
+
+            self._run = 0
+            return False
+
+        self._run += 1
+
+        if self._run <= self._hangover:
+            return False
+
+        if self._run == self._hangover + 1:
+            self._suppressions += 1
+
+        self._frames_suppressed += 1
+        return True
+
+    def reset(self) -> None:
+        """
+        Forget the current stretch of silence, so the next stream starts transmitting.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._run = 0
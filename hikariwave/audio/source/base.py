@@ -2,8 +2,19 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from hikariwave.internal import constants
 from typing import AsyncGenerator
 
+import asyncio
+import typing
+
+__all__: typing.Sequence[str] = (
+    "AudioSource",
+    "read_frames",
+)
+
+_FRAME_TOTAL: typing.Final[int] = constants.FRAME_SIZE * constants.CHANNELS * 2
+
 
 class AudioSource(ABC):
     """Base audio source implementation.
@@ -13,6 +24,36 @@ class AudioSource(ABC):
     This is an internal object and should not be instantiated manually.
     """
 
+    @property
+    def encoded(self) -> bool:
+        """If this source yields ready-to-send Opus packets instead of PCM frames."""
+        return False
+
+    @property
+    def seekable(self) -> bool:
+        """If this source supports `seek`."""
+        return False
+
+    def seek(self, seconds: float) -> None:
+        """Move playback of this source to a new position, taking effect from the next frame it yields.
+
+        Warning
+        -------
+        This is an internal method and should not be called manually.
+
+        Parameters
+        ----------
+        seconds : float
+            The position to move to, from the start of the audio.
+
+        Raises
+        ------
+        NotImplementedError
+            If this source can't seek.
+        """
+        error: str = f"{type(self).__name__} does not support seeking"
+        raise NotImplementedError(error)
+
     @abstractmethod
     async def decode(self) -> AsyncGenerator[bytes, None]:
         """Yields PCM frames of this source over a generator.
@@ -21,3 +62,48 @@ class AudioSource(ABC):
         -------
         This is an internal method and should not be called manually.
         """
+
+
+async def read_frames(stream: asyncio.StreamReader) -> AsyncGenerator[memoryview, None]:
+    """
+    Split a raw PCM stream into exact frames, no matter how its reads are fragmented.
+
+    The stream is read in `constants.BLOCK_SIZE` blocks into one reusable buffer, and each yielded frame is a
+    `memoryview` of that buffer - it is only valid until the generator is resumed. Only the final frame of
+    the stream is zero-padded, if it is short.
+
+    Warning
+    -------
+    This is an internal method and should not be called.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        The stream of 48kHz, stereo, signed 16-bit PCM audio to read.
+
+    Yields
+    ------
+    memoryview
+        The next frame of `constants.FRAME_SIZE` samples per channel - Valid only until the generator resumes, so it must be copied to be kept.
+    """
+    buffer: bytearray = bytearray(_FRAME_TOTAL + constants.BLOCK_SIZE)
+    view: memoryview = memoryview(buffer)
+    filled: int = 0
+
+    while content := await stream.read(constants.BLOCK_SIZE):
+        view[filled : filled + len(content)] = content
+        filled += len(content)
+
+        start: int = 0
+
+        while filled - start >= _FRAME_TOTAL:
+            yield view[start : start + _FRAME_TOTAL]
+            start += _FRAME_TOTAL
+
+        if start:
+            view[: filled - start] = view[start:filled]
+            filled -= start
+
+    if filled:
+        view[filled:_FRAME_TOTAL] = bytes(_FRAME_TOTAL - filled)
+        yield view[:_FRAME_TOTAL]
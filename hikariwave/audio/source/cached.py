@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from array import array
+from hikariwave.audio.source.base import AudioSource
+from hikariwave.internal import constants
+from typing import AsyncGenerator, Iterable, Union
+from typing_extensions import override
+
+import mmap
+import os
+import struct
+import typing
+
+__all__: typing.Sequence[str] = ("CachedAudioSource",)
+
+_MAGIC: typing.Final[bytes] = b"HWOP"
+_VERSION: typing.Final[int] = 1
+_HEADER: typing.Final[struct.Struct] = struct.Struct("<4sHI")
+
+
+class CachedAudioSource(AudioSource):
+    """
+    Pre-encoded audio source implementation, streaming Opus packets from a cache file through `mmap`.
+
+    A cache file is made of a small header, an index of `frame count + 1` packet offsets, and the packets
+    themselves laid out back-to-back, so every packet is a zero-copy slice of the mapping.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        """
+        Instantiate a cached audio source.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the cache file that should be streamed.
+        """
+        self._filepath: str = filepath
+        self._seek: Union[int, None] = None
+
+    @property
+    @override
+    def encoded(self) -> bool:
+        return True
+
+    @property
+    @override
+    def seekable(self) -> bool:
+        return True
+
+    @override
+    def seek(self, seconds: float) -> None:
+        self._seek = max(0, round(seconds * 1000 / constants.FRAME_LENGTH))
+
+    @staticmethod
+    def write(filepath: str, packets: Iterable[bytes]) -> int:
+        """
+        Write Opus packets into a new cache file.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the cache file to create - The file is written under a temporary name and moved into place once complete.
+        packets : Iterable[bytes]
+            The Opus packets to store, in playback order.
+
+        Returns
+        -------
+        int
+            The amount of frames written.
+        """
+        offsets: array[int] = array("I", [0])
+        data: bytearray = bytearray()
+
+        for packet in packets:
+            data += packet
+            offsets.append(len(data))
+
+        frame_count: int = len(offsets) - 1
+        temporary: str = f"{filepath}.{os.getpid()}.tmp"
+
+        with open(temporary, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, frame_count))
+            file.write(offsets.tobytes())
+            file.write(data)
+
+        os.replace(temporary, filepath)
+        return frame_count
+
+    @override
+    async def decode(self) -> AsyncGenerator[memoryview, None]: # type: ignore
+        with open(self._filepath, "rb") as file:
+            mapping: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view: memoryview = memoryview(mapping)
+        magic, version, frame_count = _HEADER.unpack_from(view)
+
+        if magic != _MAGIC or version != _VERSION:
+            error: str = f"{self._filepath} is not a supported Opus cache file"
+            raise ValueError(error)
+
+        index_end: int = _HEADER.size + (frame_count + 1) * 4
+        offsets: memoryview = view[_HEADER.size : index_end].cast("I")
+        packets: memoryview = view[index_end:]
+
+        frame: int = 0
+
+        while frame < frame_count:
+            if self._seek is not None:
+                frame, self._seek = min(self._seek, frame_count), None
+                continue
+
+            yield packets[offsets[frame] : offsets[frame + 1]]
+            frame += 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from hikariwave.audio.source.base import AudioSource
+from hikariwave.audio.source.base import read_frames
 from hikariwave.internal import constants
 from typing import AsyncGenerator, Union
 from typing_extensions import override
@@ -32,6 +33,16 @@ class FileAudioSource(AudioSource):
         """
         self._filepath: str = filepath
         self._process: Union[asyncio.subprocess.Process, None] = None
+        self._seek: Union[float, None] = None
+
+    @property
+    @override
+    def seekable(self) -> bool:
+        return True
+
+    @override
+    def seek(self, seconds: float) -> None:
+        self._seek = max(0.0, seconds)
 
     async def _cleanup(self) -> None:
         if not self._process:
@@ -39,15 +50,17 @@ class FileAudioSource(AudioSource):
 
         try:
             self._process.kill()
-            await self._process.wait()
+            await self._process.communicate()
         except:
             pass
 
         self._process = None
 
-    async def _start(self) -> None:
-        self._process = await asyncio.create_subprocess_exec(
+    def _arguments(self, offset: float = 0.0) -> list[str]:
+        return [
             "ffmpeg",
+            "-ss",
+            str(offset),
             "-i",
             self._filepath,
             "-f",
@@ -61,21 +74,35 @@ class FileAudioSource(AudioSource):
             "-loglevel",
             "error",
             "pipe:1",
+        ]
+
+    async def _start(self, offset: float = 0.0) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            *self._arguments(offset),
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.DEVNULL,
         )
 
     @override
-    async def decode(self) -> AsyncGenerator[bytes, None]: # type: ignore
-        if not self._process:
-            await self._start()
+    async def decode(self) -> AsyncGenerator[memoryview, None]: # type: ignore
+        offset: float = 0.0
+
+        try:
+            while True:
+                if not self._process:
+                    await self._start(offset)
+
+                if self._process and self._process.stdout:
+                    async for frame in read_frames(self._process.stdout):
+                        if self._seek is not None:
+                            break
 
-        while self._process and self._process.stdout:
-            content: bytes = await self._process.stdout.read(constants.FRAME_SIZE * 4)
+                        yield frame
 
-            if content:
-                yield content
-            else:
-                break
+                if self._seek is None:
+                    return
 
-        await self._cleanup()
+                offset, self._seek = self._seek, None
+                await self._cleanup()
+        finally:
+            await self._cleanup()
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from hikariwave.audio.source.base import AudioSource
+from hikariwave.internal import constants
+from typing import AsyncGenerator, Union
+from typing_extensions import override
+
+import logging
+import numpy
+import typing
+
+__all__: typing.Sequence[str] = ("MixerAudioSource",)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.mixer")
+
+_FRAME_SAMPLES: typing.Final[int] = constants.FRAME_SIZE * constants.CHANNELS
+_INT16_MIN: typing.Final[numpy.int32] = numpy.int32(-32768)
+_INT16_MAX: typing.Final[numpy.int32] = numpy.int32(32767)
+
+
+class MixerAudioSource(AudioSource):
+    """
+    Mixing audio source implementation, summing the PCM frames of any number of sources into one stream.
+
+    Frames are accumulated as 32-bit integers and saturated back into 16-bit samples, so loud overlaps clip
+    instead of wrapping around. While only one input is active its frames are passed through untouched.
+    Inputs can be added and removed while the mixer is playing, and finished inputs are removed automatically.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, *sources: AudioSource, keep_alive: bool = False) -> None:
+        """
+        Create a new mixing audio source.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        *sources : AudioSource
+            The PCM sources to start mixing.
+        keep_alive : bool
+            If the mixer should keep yielding silence once every input has finished, so inputs can still be added - If `False`, the mixer ends with its last input.
+        """
+        self._keep_alive: bool = keep_alive
+        self._sources: dict[AudioSource, None] = {}
+        self._changed: bool = False
+        self._finished: bool = False
+
+        for source in sources:
+            self.add(source)
+
+    @property
+    def sources(self) -> tuple[AudioSource, ...]:
+        """The sources currently being mixed."""
+        return tuple(self._sources)
+
+    @property
+    def finished(self) -> bool:
+        """If the mixer has stopped playing - Sources added afterwards are never mixed in."""
+        return self._finished
+
+    @property
+    def keep_alive(self) -> bool:
+        """If the mixer keeps yielding silence once every input has finished."""
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, keep_alive: bool) -> None:
+        self._keep_alive = keep_alive
+
+    def add(self, source: AudioSource) -> None:
+        """
+        Start mixing a source in, from its next frame onwards.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        source : AudioSource
+            The PCM source to mix in.
+
+        Raises
+        ------
+        ValueError
+            If the source yields Opus packets instead of PCM frames.
+        """
+        if source.encoded:
+            error: str = f"{type(source).__name__} yields Opus packets and can't be mixed"
+            raise ValueError(error)
+
+        self._sources[source] = None
+        self._changed = True
+
+    def remove(self, source: AudioSource) -> None:
+        """
+        Stop mixing a source in.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        source : AudioSource
+            The source to remove - Nothing happens if it isn't being mixed.
+        """
+        if source not in self._sources:
+            return
+
+        del self._sources[source]
+        self._changed = True
+
+    async def _synchronize(self, inputs: dict[AudioSource, AsyncGenerator[bytes, None]]) -> None:
+        self._changed = False
+
+        for source in tuple(inputs):
+            if source not in self._sources:
+                await inputs.pop(source).aclose()
+
+        for source in self._sources:
+            if source not in inputs:
+                inputs[source] = source.decode() # type: ignore
+
+    @override
+    async def decode(self) -> AsyncGenerator[Union[bytes, memoryview], None]: # type: ignore
+        inputs: dict[AudioSource, AsyncGenerator[bytes, None]] = {}
+        frames: list[Union[bytes, memoryview]] = []
+
+        accumulator: numpy.ndarray = numpy.zeros(_FRAME_SAMPLES, numpy.int32)
+        output: numpy.ndarray = numpy.zeros(_FRAME_SAMPLES, numpy.int16)
+        silence: bytes = bytes(_FRAME_SAMPLES * 2)
+
+        try:
+            while True:
+                if self._changed:
+                    await self._synchronize(inputs)
+
+                frames.clear()
+
+                for source, frames_of in tuple(inputs.items()):
+                    try:
+                        frames.append(await frames_of.__anext__())
+                    except StopAsyncIteration:
+                        del inputs[source]
+                        self._sources.pop(source, None)
+
+                if not frames:
+                    if self._changed:
+                        continue
+
+                    if not self._keep_alive:
+                        return
+
+                    yield silence
+                    continue
+
+                if len(frames) == 1:
+                    yield frames[0]
+                    continue
+
+                accumulator.fill(0)
+
+                for frame in frames:
+                    samples: numpy.ndarray = numpy.frombuffer(frame, numpy.int16)
+
+                    if len(samples) == _FRAME_SAMPLES:
+                        numpy.add(accumulator, samples, out=accumulator)
+                    else:
+                        accumulator[: len(samples)] += samples
+
+                numpy.minimum(accumulator, _INT16_MAX, out=accumulator)
+                numpy.maximum(accumulator, _INT16_MIN, out=accumulator)
+                numpy.copyto(output, accumulator, casting="unsafe")
+
+                yield output.data.cast("B")
+        finally:
+            self._finished = True
+
+            for frames_of in inputs.values():
+                await frames_of.aclose()
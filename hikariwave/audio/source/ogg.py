@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+from hikariwave.audio.source.base import AudioSource
+from hikariwave.internal import constants
+from typing import AsyncGenerator, Generator, Union
+from typing_extensions import override
+
+import asyncio
+import logging
+import os
+import struct
+import typing
+
+__all__: typing.Sequence[str] = (
+    "OggOpusAudioSource",
+    "OggOpusDemuxer",
+    "packet_samples",
+)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.ogg")
+
+_CAPTURE_PATTERN: typing.Final[bytes] = b"OggS"
+_PAGE_HEADER: typing.Final[struct.Struct] = struct.Struct("<4sBBqIIIB")
+_OPUS_HEAD: typing.Final[bytes] = b"OpusHead"
+_OPUS_TAGS: typing.Final[bytes] = b"OpusTags"
+_PASSTHROUGH_EXTENSIONS: typing.Final[tuple[str, ...]] = (".opus", ".ogg")
+
+# Samples per frame at 48kHz, indexed by the TOC configuration number (RFC 6716, section 3.1)
+_FRAME_SAMPLES: typing.Final[tuple[int, ...]] = (
+    (480, 960, 1920, 2880) * 3  # SILK-only
+    + (480, 960) * 2  # Hybrid
+    + (120, 240, 480, 960) * 4  # CELT-only
+)
+
+
+def packet_samples(packet: Union[bytes, memoryview]) -> int:
+    """
+    Get the duration of an Opus packet, in samples per channel at 48kHz.
+
+    Parameters
+    ----------
+    packet : bytes | memoryview
+        The Opus packet.
+
+    Returns
+    -------
+    int
+        The amount of samples per channel the packet decodes to - `0` if the packet is malformed.
+    """
+    if not packet:
+        return 0
+
+    toc: int = packet[0]
+    code: int = toc & 0x03
+
+    if code == 0:
+        frames: int = 1
+    elif code != 3:
+        frames = 2
+    elif len(packet) > 1:
+        frames = packet[1] & 0x3F
+    else:
+        return 0
+
+    return frames * _FRAME_SAMPLES[toc >> 3]
+
+
+class OggOpusDemuxer:
+    """
+    Streaming Ogg page parser that extracts raw Opus packets from an Ogg Opus bitstream.
+
+    Data can be fed in arbitrarily sized chunks - pages and packets that are split across chunks, and packets
+    that span several pages, are reassembled. The `OpusHead` and `OpusTags` header packets are consumed and
+    every audio packet of the first logical stream is returned.
+
+    Leading packets that fall entirely within the stream's pre-skip are dropped. The rest of the pre-skip, shorter
+    than a packet, is played, since trimming part of a packet would mean decoding it.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a new Ogg Opus demuxer.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._buffer: bytearray = bytearray()
+        self._packet: bytearray = bytearray()
+        self._serial: Union[int, None] = None
+
+        self._headers: int = 0
+        self._pre_skip: int = 0
+        self._discard: int = 0
+        self._granule: int = 0
+        self._samples: int = 0
+
+    @property
+    def pre_skip(self) -> int:
+        """The amount of samples the decoder should discard from the start of the stream, as stated by `OpusHead`."""
+        return self._pre_skip
+
+    @property
+    def granule(self) -> int:
+        """The granule position of the most recently completed page."""
+        return self._granule
+
+    @property
+    def position(self) -> int:
+        """The playback position (in samples per channel at 48kHz) reached by the packets returned so far."""
+        return max(0, self._samples - self._pre_skip)
+
+    def _complete_packet(self) -> Union[bytes, None]:
+        packet: bytes = bytes(self._packet)
+        self._packet.clear()
+
+        if self._headers == 0:
+            if not packet.startswith(_OPUS_HEAD):
+                error: str = "Ogg stream does not contain Opus audio"
+                raise ValueError(error)
+
+            self._pre_skip = struct.unpack_from("<H", packet, 10)[0]
+            self._discard = self._pre_skip
+            self._headers += 1
+            return None
+
+        if self._headers == 1:
+            if packet.startswith(_OPUS_TAGS):
+                self._headers += 1
+                return None
+
+            self._headers += 1
+
+        samples: int = packet_samples(packet)
+        self._samples += samples
+
+        if samples <= self._discard:
+            self._discard -= samples
+            return None
+
+        self._discard = 0
+        return packet
+
+    def feed(self, data: Union[bytes, bytearray, memoryview]) -> Generator[bytes, None, None]:
+        """
+        Feed bitstream data into the demuxer, yielding every Opus packet it completes.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        data : bytes | bytearray | memoryview
+            The next chunk of the Ogg bitstream.
+
+        Yields
+        ------
+        bytes
+            The completed Opus audio packets, in order.
+
+        Raises
+        ------
+        ValueError
+            If the bitstream does not carry Opus audio.
+        """
+        buffer: bytearray = self._buffer
+        buffer += data
+        position: int = 0
+
+        try:
+            while len(buffer) - position >= _PAGE_HEADER.size:
+                if not buffer.startswith(_CAPTURE_PATTERN, position):
+                    resync: int = buffer.find(_CAPTURE_PATTERN, position + 1)
+
+                    if resync == -1:
+                        position = max(position, len(buffer) - 3)
+                        break
+
+                    position = resync
+                    continue
+
+                _, _, header_type, granule, serial, _, _, segments = _PAGE_HEADER.unpack_from(buffer, position)
+                body_start: int = position + _PAGE_HEADER.size + segments
+
+                if len(buffer) < body_start:
+                    break
+
+                lacing: bytearray = buffer[position + _PAGE_HEADER.size : body_start]
+                page_end: int = body_start + sum(lacing)
+
+                if len(buffer) < page_end:
+                    break
+
+                position = page_end
+
+                if self._serial is None:
+                    self._serial = serial
+                elif serial != self._serial:
+                    continue
+
+                if not header_type & 0x01:
+                    self._packet.clear()
+
+                offset: int = body_start
+
+                for value in lacing:
+                    self._packet += buffer[offset : offset + value]
+                    offset += value
+
+                    if value < 255:
+                        packet: Union[bytes, None] = self._complete_packet()
+
+                        if packet:
+                            yield packet
+
+                if granule != -1:
+                    self._granule = granule
+                    self._samples = granule
+        finally:
+            del buffer[:position]
+
+
+class OggOpusAudioSource(AudioSource):
+    """
+    Ogg Opus audio source implementation, streaming Opus packets straight out of FFmpeg's Ogg muxer.
+
+    Inputs that already carry Opus audio are remuxed without being decoded, and any other input is encoded
+    by FFmpeg's own `libopus` encoder - either way no PCM decoding or Opus encoding happens in Python.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, filepath: str, *, passthrough: Union[bool, None] = None) -> None:
+        """
+        Instantiate an Ogg Opus audio source.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the file that should be streamed.
+        passthrough : bool | None
+            If the input's Opus audio should be copied instead of re-encoded - If `None`, this is enabled for `.opus` and `.ogg` files.
+            Inputs that turn out not to be 20ms-framed Opus are re-encoded regardless, from the first packet that isn't.
+        """
+        self._filepath: str = filepath
+        self._passthrough: bool = (
+            passthrough
+            if passthrough is not None
+            else os.path.splitext(filepath)[1].lower() in _PASSTHROUGH_EXTENSIONS
+        )
+        self._process: Union[asyncio.subprocess.Process, None] = None
+        self._seek: Union[float, None] = None
+
+    @property
+    @override
+    def encoded(self) -> bool:
+        return True
+
+    @property
+    @override
+    def seekable(self) -> bool:
+        return True
+
+    @override
+    def seek(self, seconds: float) -> None:
+        self._seek = max(0.0, seconds)
+
+    def _arguments(self, passthrough: bool, offset: float = 0.0) -> list[str]:
+        codec: list[str] = (
+            ["-c:a", "copy"]
+            if passthrough
+            else [
+                "-c:a",
+                "libopus",
+                "-frame_duration",
+                str(constants.FRAME_LENGTH),
+                "-ar",
+                str(constants.SAMPLE_RATE),
+                "-ac",
+                str(constants.CHANNELS),
+            ]
+        )
+
+        return [
+            "ffmpeg",
+            "-ss",
+            str(offset),
+            "-i",
+            self._filepath,
+            "-map",
+            "0:a:0",
+            *codec,
+            "-f",
+            "ogg",
+            "-loglevel",
+            "error",
+            "pipe:1",
+        ]
+
+    async def _cleanup(self) -> None:
+        if not self._process:
+            return
+
+        try:
+            self._process.kill()
+            await self._process.communicate()
+        except:
+            pass
+
+        self._process = None
+
+    async def _start(self, passthrough: bool, offset: float = 0.0) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            *self._arguments(passthrough, offset),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+    @override
+    async def decode(self) -> AsyncGenerator[bytes, None]: # type: ignore
+        passthrough: bool = self._passthrough
+        offset: float = 0.0
+
+        while True:
+            await self._start(passthrough, offset)
+
+            demuxer: OggOpusDemuxer = OggOpusDemuxer()
+            sent: int = 0
+            fallback: bool = False
+
+            try:
+                while self._process and self._process.stdout and not fallback and self._seek is None:
+                    content: bytes = await self._process.stdout.read(constants.BLOCK_SIZE)
+
+                    if not content:
+                        break
+
+                    try:
+                        for packet in demuxer.feed(content):
+                            if self._seek is not None:
+                                break
+
+                            # Frames are sent as they are, so every copied packet must be exactly one frame long
+                            if passthrough and packet_samples(packet) != constants.FRAME_SIZE:
+                                fallback = True
+                                break
+
+                            sent += 1
+                            yield packet
+                    except ValueError:
+                        if not passthrough:
+                            raise
+
+                        fallback = True
+            finally:
+                await self._cleanup()
+
+            if self._seek is not None:
+                offset, self._seek = self._seek, None
+                continue
+
+            if not fallback:
+                return
+
+            _logger.debug("%s is not 20ms-framed Opus - Re-encoding with FFmpeg", self._filepath)
+            passthrough = False
+            offset += sent * constants.FRAME_LENGTH / 1000
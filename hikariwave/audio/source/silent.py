@@ -26,6 +26,11 @@ class SilentAudioSource(AudioSource):
 
         self._silent_pcm: bytes = b"\xF8\xFF\xFE"
 
+    @property
+    @override
+    def encoded(self) -> bool:
+        return True
+
     @override
     async def decode(self) -> AsyncGenerator[bytes, None]: # type: ignore
         for i in range(5):
@@ -4,10 +4,17 @@ import aiohttp
 import asyncio
 
 from hikariwave.audio.source.base import AudioSource
+from hikariwave.audio.source.base import read_frames
 from hikariwave.internal import constants
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Union
 from typing_extensions import override
 
+import typing
+
+if typing.TYPE_CHECKING:
+    from hikariwave.audio.cache import WebCache
+    from hikariwave.http import SessionPool
+
 
 class WebAudioSource(AudioSource):
     """
@@ -18,7 +25,13 @@ class WebAudioSource(AudioSource):
     This is an internal object and should not be instantiated.
     """
 
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        *,
+        http: Union[SessionPool, None] = None,
+        cache: Union[WebCache, None] = None,
+    ) -> None:
         """
         Create a new web audio source.
 
@@ -30,56 +43,101 @@ class WebAudioSource(AudioSource):
         ----------
         url : str
             The URL of an audio file.
+        http : SessionPool | None
+            The shared session that the audio file is downloaded through - If `None`, the source uses a session of its own.
+        cache : WebCache | None
+            The cache that the audio file is stored in and served from - If `None`, the audio file is downloaded on every play.
         """
         self._url: str = url
-
-    @override
-    async def decode(self) -> AsyncGenerator[bytes, None]: # type: ignore
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self._url) as response:
-                if response.status != 200:
-                    error: str = f"Failed to fetch audio: HTTP {response.status}"
-                    raise RuntimeError(error)
-
-                ffmpeg: asyncio.subprocess.Process = (
-                    await asyncio.create_subprocess_exec(
-                        "ffmpeg",
-                        "-i",
-                        "pipe:0",
-                        "-f",
-                        str(constants.PCM_FORMAT),
-                        "-ar",
-                        str(constants.SAMPLE_RATE),
-                        "-ac",
-                        str(constants.CHANNELS),
-                        "pipe:1",
-                        stdin=asyncio.subprocess.PIPE,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.DEVNULL,
-                    )
+        self._http: Union[SessionPool, None] = http
+        self._cache: Union[WebCache, None] = cache
+
+    async def _transcode(self, body: AsyncGenerator[bytes, None]) -> AsyncGenerator[memoryview, None]:
+        try:
+            first: bytes = await body.__anext__()
+        except StopAsyncIteration:
+            return
+
+        try:
+            ffmpeg: asyncio.subprocess.Process = (
+                await asyncio.create_subprocess_exec(
+                    "ffmpeg",
+                    "-i",
+                    "pipe:0",
+                    "-f",
+                    str(constants.PCM_FORMAT),
+                    "-ar",
+                    str(constants.SAMPLE_RATE),
+                    "-ac",
+                    str(constants.CHANNELS),
+                    "pipe:1",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
                 )
+            )
+        except BaseException:
+            await body.aclose()
+            raise
+
+        async def feed_ffmpeg() -> None:
+            try:
+                chunk: bytes = first
 
-                async def feed_ffmpeg() -> None:
-                    async for chunk in response.content.iter_chunked(1024 * 16):
-                        if not chunk or not ffmpeg.stdin:
-                            break
+                while chunk and ffmpeg.stdin:
+                    ffmpeg.stdin.write(chunk)
+                    await ffmpeg.stdin.drain()
 
-                        ffmpeg.stdin.write(chunk)
-                        await ffmpeg.stdin.drain()
+                    chunk = await body.__anext__()
+            except StopAsyncIteration:
+                ...
+            finally:
+                if ffmpeg.stdin:
+                    ffmpeg.stdin.close()
 
-                    if ffmpeg.stdin:
-                        ffmpeg.stdin.close()
+                await body.aclose()
 
-                asyncio.create_task(feed_ffmpeg())
+        feeder: asyncio.Task[None] = asyncio.create_task(feed_ffmpeg())
 
-                while ffmpeg.stdout:
-                    pcm: bytes = await ffmpeg.stdout.read(
-                        constants.FRAME_SIZE * constants.CHANNELS * 2,
-                    )
+        try:
+            if ffmpeg.stdout:
+                async for frame in read_frames(ffmpeg.stdout):
+                    yield frame
 
-                    if not pcm:
-                        break
+            await feeder
+            await ffmpeg.wait()
+        finally:
+            feeder.cancel()
+            await asyncio.wait((feeder,))
 
-                    yield pcm
+            if not feeder.cancelled():
+                feeder.exception()  # Already raised above, or irrelevant once playback stopped early
 
-                await ffmpeg.wait()
+            if ffmpeg.returncode is None:
+                ffmpeg.kill()
+                await ffmpeg.communicate()
+
+    async def _fetch(self, session: aiohttp.ClientSession) -> AsyncGenerator[bytes, None]:
+        async with session.get(self._url) as response:
+            if response.status != 200:
+                error: str = f"Failed to fetch audio: HTTP {response.status}"
+                raise RuntimeError(error)
+
+            async for chunk in response.content.iter_chunked(1024 * 16):
+                yield chunk
+
+    @override
+    async def decode(self) -> AsyncGenerator[memoryview, None]: # type: ignore
+        session: aiohttp.ClientSession = self._http.stream_session if self._http else aiohttp.ClientSession()
+        frames: AsyncGenerator[memoryview, None] = self._transcode(
+            self._cache.stream(self._url, session) if self._cache else self._fetch(session),
+        )
+
+        try:
+            async for frame in frames:
+                yield frame
+        finally:
+            await frames.aclose()
+
+            if not self._http:
+                await session.close()
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from hikariwave.audio.broadcast import Broadcast
+from hikariwave.audio.cache import OpusCache
+from hikariwave.audio.cache import WebCache
+from hikariwave.audio.clock import LateFramePolicy
+from hikariwave.audio.receive import AudioReceiver
+from hikariwave.audio.scheduler import PlaybackScheduler
+from hikariwave.audio.source.base import AudioSource
+from hikariwave.audio.source.cached import CachedAudioSource
 from hikariwave.audio.source.file import FileAudioSource
+from hikariwave.audio.source.ogg import OggOpusAudioSource
+from hikariwave.audio.source.web import WebAudioSource
 from hikariwave.connection import PendingConnection
 from hikariwave.connection import VoiceConnection
+from hikariwave.http import SessionPool
+from hikariwave.internal import constants
+from hikariwave.sharding import ShardPool
 from typing import Union
 
 import asyncio
 import hikari
 import hikariwave.error as errors
 import logging
+import math
 import typing
 
 
@@ -19,7 +34,20 @@ _logger: logging.Logger = logging.getLogger("hikariwave.client")
 class VoiceClient:
     """Voice client to interact with Discord's voice system."""
 
-    def __init__(self, bot: hikari.GatewayBot) -> None:
+    def __init__(
+        self,
+        bot: hikari.GatewayBot,
+        *,
+        late_frame_policy: LateFramePolicy = LateFramePolicy.BURST,
+        opus_cache: Union[OpusCache, None] = None,
+        web_cache: Union[WebCache, None] = None,
+        packet_workers: int = 0,
+        read_ahead: float = 0.5,
+        shards: int = 0,
+        http: Union[SessionPool, None] = None,
+        suppress_silence: bool = False,
+        receive_audio: bool = False,
+    ) -> None:
         """
         Create a new voice client to interact with Discord's voice system.
 
@@ -27,14 +55,112 @@ class VoiceClient:
         ----------
         bot : hikari.GatewayBot
             The Discord bot client to interface with.
+        late_frame_policy : LateFramePolicy
+            How playback should behave when it falls behind its send schedule - `BURST` catches up by sending late frames immediately, `SKIP` drops them.
+        opus_cache : OpusCache | None
+            The cache that played files are pre-encoded into - If provided, repeated plays of a file skip decoding and encoding entirely.
+        web_cache : WebCache | None
+            The cache that played URLs are downloaded into - If provided, repeated plays of an unchanged URL are served from disk.
+        packet_workers : int
+            The amount of worker threads that encode and encrypt packets off the event loop - If `0`, both happen on the event loop.
+        read_ahead : float
+            How much audio (in seconds) each connection buffers ahead of the frame being sent, to ride out stalls in its source.
+        shards : int
+            The amount of worker processes that connections' UDP sockets, encoding and encryption are sharded across - If `0`, everything stays in this process.
+        http : SessionPool | None
+            The pooled sessions shared by every voice websocket and web source - If `None`, a pool without limits is created.
+        suppress_silence : bool
+            If connections should stop transmitting, and drop their speaking flag, during silent stretches of decoded audio - Each connection reports its savings in `VoiceConnection.frames_suppressed`.
+        receive_audio : bool
+            If connections should receive the audio other users send to their channel - Discord only sends it to connections that joined with `deaf=False`, and it isn't received when sharding.
         """
         self.bot: hikari.GatewayBot = bot
         self.bot.subscribe(hikari.VoiceServerUpdateEvent, self._server_update)
         self.bot.subscribe(hikari.VoiceStateUpdateEvent, self._state_update)
+        self.bot.subscribe(hikari.StoppingEvent, self._stopping)
 
         self._pending_connections: dict[hikari.Snowflake, PendingConnection] = {}
         self._active_connections: dict[hikari.Snowflake, VoiceConnection] = {}
 
+        self._scheduler: PlaybackScheduler = PlaybackScheduler(late_frame_policy)
+        self._opus_cache: Union[OpusCache, None] = opus_cache
+        self._web_cache: Union[WebCache, None] = web_cache
+
+        self._executor: Union[ThreadPoolExecutor, None] = (
+            ThreadPoolExecutor(packet_workers, thread_name_prefix="hikariwave-packet")
+            if packet_workers > 0
+            else None
+        )
+        self._http: SessionPool = http if http else SessionPool()
+        self._lookahead: int = max(1, math.ceil(read_ahead * 1000 / constants.FRAME_LENGTH))
+        self._suppress_silence: bool = suppress_silence
+        self._receive_audio: bool = receive_audio
+
+        self._shards: Union[ShardPool, None] = (
+            ShardPool(shards, late_frame_policy=late_frame_policy)
+            if shards > 0
+            else None
+        )
+
+    @property
+    def scheduler(self) -> PlaybackScheduler:
+        """The process-wide scheduler that drives playback for every connection of this client."""
+        return self._scheduler
+
+    @property
+    def http(self) -> SessionPool:
+        """The pooled sessions shared by every voice websocket and web source of this client."""
+        return self._http
+
+    @property
+    def shards(self) -> Union[ShardPool, None]:
+        """The pool of worker processes that connections are sharded across, if sharding is enabled."""
+        return self._shards
+
+    @property
+    def heartbeat_latency(self) -> float:
+        """The average heartbeat round trip time (in seconds) across every connection that has been acknowledged - `nan` if none have."""
+        latencies: list[float] = [
+            connection.average_heartbeat_latency
+            for connection in self._active_connections.values()
+            if not math.isnan(connection.average_heartbeat_latency)
+        ]
+
+        if not latencies:
+            return math.nan
+
+        return sum(latencies) / len(latencies)
+
+    @property
+    def max_heartbeat_latency(self) -> float:
+        """The longest recent heartbeat round trip time (in seconds) of any connection - `nan` if none have been acknowledged."""
+        latencies: list[float] = [
+            connection.max_heartbeat_latency
+            for connection in self._active_connections.values()
+            if not math.isnan(connection.max_heartbeat_latency)
+        ]
+
+        if not latencies:
+            return math.nan
+
+        return max(latencies)
+
+    @property
+    def heartbeat_latencies(self) -> dict[hikari.Snowflake, float]:
+        """The latest heartbeat round trip time (in seconds) of each guild's connection - `nan` for connections not yet acknowledged."""
+        return {
+            guild_id: connection.heartbeat_latency
+            for guild_id, connection in self._active_connections.items()
+        }
+
+    @property
+    def join_times(self) -> dict[hikari.Snowflake, float]:
+        """How long (in seconds) each guild's connection took from the join request to being ready to send audio - `nan` for connections not yet ready."""
+        return {
+            guild_id: connection.join_time
+            for guild_id, connection in self._active_connections.items()
+        }
+
     async def _try_connection(self, guild_id: hikari.Snowflake) -> None:
         pending_connection: Union[PendingConnection, None] = self._pending_connections.get(
             guild_id,
@@ -60,16 +186,47 @@ class VoiceClient:
             pending_connection.token,
         )
 
-        self._active_connections[guild_id] = VoiceConnection(self.bot, self.bot.get_me().id, guild_id) # type: ignore
+        self._active_connections[guild_id] = VoiceConnection(
+            self.bot,
+            self.bot.get_me().id, # type: ignore
+            guild_id,
+            scheduler=self._scheduler,
+            executor=self._executor,
+            lookahead=self._lookahead,
+            shard=self._shards.assign(guild_id) if self._shards else None,
+            http=self._http,
+            suppress_silence=self._suppress_silence,
+            receive_audio=self._receive_audio,
+            join_started=pending_connection.started,
+        )
+        pending_connection.connection.set_result(self._active_connections[guild_id])
+
         await self._active_connections[guild_id].connect(
             pending_connection.endpoint,
             pending_connection.session_id,
             pending_connection.token,
         )
 
+    async def _stopping(self, _: hikari.StoppingEvent) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+        await self._http.close()
+
+        if self._shards:
+            await self._shards.close()
+
     async def _server_update(self, event: hikari.VoiceServerUpdateEvent) -> None:
         if event.guild_id in self._active_connections:
-            return  # Handle later, changed voice servers
+            if not event.raw_endpoint:
+                return
+
+            try:
+                await self._active_connections[event.guild_id].migrate(event.raw_endpoint, event.token)
+            except errors.ConnectionTimeoutError as e:
+                _logger.warning("Failed to migrate GUILD: %s - %s", event.guild_id, e)
+
+            return
 
         if event.guild_id not in self._pending_connections:
             return
@@ -117,6 +274,8 @@ class VoiceClient:
         *,
         mute: bool = False,
         deaf: bool = True,
+        wait: bool = False,
+        timeout: Union[float, None] = None,
     ) -> None:
         """
         Connect to a voice channel.
@@ -131,16 +290,23 @@ class VoiceClient:
             If the bot should join muted.
         deaf : bool
             If the bot should join deafened.
+        wait : bool
+            If this method should only return once the connection is ready to send audio.
+        timeout : float | None
+            The longest time (in seconds) to wait for the connection to be ready, if waiting - If `None`, waits indefinitely.
 
         Raises
         ------
         ConnectionAlreadyEstablishedError
             If the bot is currently in another voice channel.
+        ConnectionTimeoutError
+            If waiting, and the connection wasn't ready within the timeout - The join is abandoned, leaving the channel.
         """
         if guild_id in self._active_connections:
             return
 
-        self._pending_connections[guild_id] = PendingConnection()
+        pending_connection: PendingConnection = PendingConnection()
+        self._pending_connections[guild_id] = pending_connection
         await self.bot.update_voice_state(
             guild_id,
             channel_id,
@@ -156,6 +322,71 @@ class VoiceClient:
             deaf,
         )
 
+        if not wait:
+            return
+
+        try:
+            await pending_connection.wait(timeout)
+        except errors.ConnectionTimeoutError:
+            # Otherwise the join would still finish after the caller gave up on it
+            if self._pending_connections.get(guild_id, None) is pending_connection or guild_id in self._active_connections:
+                await self.disconnect(guild_id)
+
+            raise
+
+    async def connect_many(
+        self,
+        channels: typing.Mapping[hikari.Snowflake, hikari.Snowflake],
+        *,
+        mute: bool = False,
+        deaf: bool = True,
+        concurrency: int = 10,
+        timeout: Union[float, None] = None,
+    ) -> dict[hikari.Snowflake, Union[float, Exception]]:
+        """
+        Connect to many voice channels at once, with a bounded amount of joins in flight.
+
+        Parameters
+        ----------
+        channels : typing.Mapping[hikari.Snowflake, hikari.Snowflake]
+            The ID of the channel to connect to, for the ID of each guild that contains it.
+        mute : bool
+            If the bot should join muted.
+        deaf : bool
+            If the bot should join deafened.
+        concurrency : int
+            The maximum amount of joins in flight at once.
+        timeout : float | None
+            The longest time (in seconds) each join may take to become ready to send audio - If `None`, waits indefinitely.
+
+        Returns
+        -------
+        dict[hikari.Snowflake, float | Exception]
+            How long (in seconds) each guild took to become ready to send audio, or the error its join failed with.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def join(guild_id: hikari.Snowflake, channel_id: hikari.Snowflake) -> Union[float, Exception]:
+            async with semaphore:
+                try:
+                    await self.connect(guild_id, channel_id, mute=mute, deaf=deaf, wait=True, timeout=timeout)
+                    connection: Union[VoiceConnection, None] = self._active_connections.get(guild_id, None)
+
+                    if not connection:
+                        error: str = "Connection was disconnected before it was established"
+                        raise errors.ConnectionNotEstablishedError(error)
+
+                    return connection.join_time
+                except Exception as e:
+                    _logger.warning("Failed to connect to GUILD: %s - %s", guild_id, e)
+                    return e
+
+        results: list[Union[float, Exception]] = await asyncio.gather(
+            *(join(guild_id, channel_id) for guild_id, channel_id in channels.items())
+        )
+
+        return dict(zip(channels, results))
+
     async def disconnect(self, guild_id: hikari.Snowflake) -> None:
         """
         Disconnect from a voice channel.
@@ -170,6 +401,15 @@ class VoiceClient:
         ConnectionNotEstablishedError
             If the bot is not currently connected to a channel in the guild provided.
         """
+        pending_connection: Union[PendingConnection, None] = self._pending_connections.pop(guild_id, None)
+
+        if pending_connection:
+            pending_connection.connection.cancel()
+
+            if guild_id not in self._active_connections:
+                await self.bot.update_voice_state(guild_id, None)
+                return
+
         if guild_id not in self._active_connections:
             error: str = "No active connection to this guild was found at disconnect"
             raise errors.ConnectionNotEstablishedError(error)
@@ -177,13 +417,65 @@ class VoiceClient:
         await self._active_connections[guild_id].close()
         del self._active_connections[guild_id]
 
+        if self._shards:
+            self._shards.release(guild_id)
+
         await self.bot.update_voice_state(guild_id, None)
 
         _logger.info("Disconnected from GUILD: %s", guild_id)
 
+    async def disconnect_all(self, *, concurrency: int = 10) -> None:
+        """
+        Disconnect from every voice channel, with a bounded amount of disconnects in flight.
+
+        Parameters
+        ----------
+        concurrency : int
+            The maximum amount of disconnects in flight at once.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def leave(guild_id: hikari.Snowflake) -> None:
+            async with semaphore:
+                try:
+                    await self.disconnect(guild_id)
+                except Exception as e:
+                    _logger.warning("Failed to disconnect from GUILD: %s - %s", guild_id, e)
+
+        await asyncio.gather(
+            *(leave(guild_id) for guild_id in {*self._pending_connections, *self._active_connections})
+        )
+
+    async def _connection(self, guild_id: hikari.Snowflake, error: str) -> VoiceConnection:
+        pending_connection: Union[PendingConnection, None] = self._pending_connections.get(guild_id, None)
+
+        if pending_connection:
+            return await pending_connection.wait()
+
+        connection: Union[VoiceConnection, None] = self._active_connections.get(guild_id, None)
+
+        if not connection:
+            raise errors.ConnectionNotEstablishedError(error)
+
+        return connection
+
+    async def _file_source(self, filepath: str) -> AudioSource:
+        if self._opus_cache:
+            cached: Union[str, None] = await self._opus_cache.lookup(filepath)
+
+            if cached:
+                return CachedAudioSource(cached)
+
+            self._opus_cache.schedule(filepath)
+
+        if filepath.lower().endswith((".opus", ".ogg")):
+            return OggOpusAudioSource(filepath)
+
+        return FileAudioSource(filepath)
+
     async def play_file(self, guild_id: hikari.Snowflake, filepath: str) -> None:
         """
-        Play audio from a source file.
+        Play audio from a source file, replacing whatever is currently playing.
 
         Parameters
         ----------
@@ -197,14 +489,273 @@ class VoiceClient:
         ConnectionNotEstablishedError
             If the guild currently does not have an active connection.
         """
-        while guild_id in self._pending_connections:
-            await asyncio.sleep(0.01)
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't stream file to a connection that doesn't exist.",
+        )
 
-        connection: Union[VoiceConnection, None] = self._active_connections.get(guild_id, None)
+        await connection.play(await self._file_source(filepath))
 
-        if not connection:
-            error: str = "Can't stream file to a connection that doesn't exist."
-            raise errors.ConnectionNotEstablishedError(error)
+    async def play_url(self, guild_id: hikari.Snowflake, url: str) -> None:
+        """
+        Play audio from a URL, replacing whatever is currently playing.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+        url : str
+            The URL of the audio file.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't stream URL to a connection that doesn't exist.",
+        )
+
+        await connection.play(WebAudioSource(url, http=self._http, cache=self._web_cache))
+
+    async def broadcast_file(self, filepath: str) -> Broadcast:
+        """
+        Create a broadcast of a source file, which any amount of guilds can listen to at once while it's only decoded and encoded once.
+
+        The broadcast starts once its first guild listens to it, and ends with its file or when it's stopped.
+
+        Parameters
+        ----------
+        filepath : str
+            The filepath to the source file.
+
+        Returns
+        -------
+        Broadcast
+            The broadcast, to pass to `play_broadcast`.
+        """
+        return Broadcast(
+            await self._file_source(filepath),
+            self._scheduler,
+            lookahead=self._lookahead,
+        )
+
+    def broadcast_url(self, url: str) -> Broadcast:
+        """
+        Create a broadcast of a URL, which any amount of guilds can listen to at once while it's only downloaded, decoded and encoded once.
+
+        The broadcast starts once its first guild listens to it, and ends with its audio or when it's stopped.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the audio file.
+
+        Returns
+        -------
+        Broadcast
+            The broadcast, to pass to `play_broadcast`.
+        """
+        return Broadcast(
+            WebAudioSource(url, http=self._http, cache=self._web_cache),
+            self._scheduler,
+            lookahead=self._lookahead,
+        )
+
+    async def play_broadcast(self, guild_id: hikari.Snowflake, broadcast: Broadcast) -> None:
+        """
+        Listen to a broadcast in a guild, replacing whatever is currently playing - The guild joins wherever the broadcast currently is.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+        broadcast : Broadcast
+            The broadcast to listen to.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        TypeError
+            If the connection streams from a shard process, which can't listen to a broadcast.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't stream broadcast to a connection that doesn't exist.",
+        )
+
+        await connection.listen(broadcast)
+
+    async def enqueue_file(self, guild_id: hikari.Snowflake, filepath: str) -> None:
+        """
+        Queue audio from a source file to play straight after the guild's current queue, or now if nothing is playing.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+        filepath : str
+            The filepath to the source file.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't queue file in a connection that doesn't exist.",
+        )
+
+        connection.enqueue(await self._file_source(filepath))
+
+    async def enqueue_url(self, guild_id: hikari.Snowflake, url: str) -> None:
+        """
+        Queue audio from a URL to play straight after the guild's current queue, or now if nothing is playing.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+        url : str
+            The URL of the audio file.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't queue URL in a connection that doesn't exist.",
+        )
+
+        connection.enqueue(WebAudioSource(url, http=self._http, cache=self._web_cache))
+
+    async def mix_file(self, guild_id: hikari.Snowflake, filepath: str) -> None:
+        """
+        Overlay audio from a source file on top of the audio mixed in a guild, or play it now if nothing is playing.
+
+        Only audio started through this method can be overlaid - Anything else that is playing is replaced.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+        filepath : str
+            The filepath to the source file.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        TypeError
+            If the connection streams from a shard process, which can't mix.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't mix file in a connection that doesn't exist.",
+        )
+
+        connection.mix(FileAudioSource(filepath))
+
+    async def skip(self, guild_id: hikari.Snowflake) -> None:
+        """
+        Skip the audio currently playing in a guild, moving straight on to the next queued audio.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't skip in a connection that doesn't exist.",
+        )
+
+        connection.skip()
+
+    async def seek(self, guild_id: hikari.Snowflake, seconds: float) -> None:
+        """
+        Move playback in a guild to a new position.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+        seconds : float
+            The position to move to, from the start of the audio.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        NotImplementedError
+            If the audio currently playing can't seek, such as audio streamed from a URL.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't seek in a connection that doesn't exist.",
+        )
+
+        connection.seek(seconds)
+
+    async def set_volume(self, guild_id: hikari.Snowflake, volume: float) -> None:
+        """
+        Change the volume audio is played at in a guild, ramping smoothly into the new volume.
+
+        Only audio decoded to PCM is affected - Ogg Opus files and files served from the Opus cache play unchanged.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+        volume : float
+            The new volume, as a multiplier of each source's amplitude - `1.0` leaves audio unchanged.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        ValueError
+            If the volume is negative.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't change volume in a connection that doesn't exist.",
+        )
+
+        connection.set_volume(volume)
+
+    async def receiver(self, guild_id: hikari.Snowflake) -> Union[AudioReceiver, None]:
+        """
+        Get the receiver of the audio other users send to a guild's channel.
+
+        Parameters
+        ----------
+        guild_id : hikari.Snowflake
+            The ID of the guild that a current connection exists in.
+
+        Returns
+        -------
+        AudioReceiver | None
+            The receiver - `None` if the client doesn't receive audio, or the connection is sharded.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the guild currently does not have an active connection.
+        """
+        connection: VoiceConnection = await self._connection(
+            guild_id,
+            "Can't receive audio from a connection that doesn't exist.",
+        )
 
-        source: FileAudioSource = FileAudioSource(filepath)
-        await connection.play(source)
\ No newline at end of file
+        return connection.receiver
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from hikariwave import voice
+from hikariwave.audio.broadcast import Broadcast
+from hikariwave.audio.clock import LateFramePolicy
 from hikariwave.audio.encryption import EncryptionMode
+from hikariwave.audio.gain import GainStage
 from hikariwave.audio.player import AudioPlayer
+from hikariwave.audio.receive import AudioReceiver
+from hikariwave.audio.scheduler import PlaybackScheduler
+from hikariwave.audio.silence import SilenceDetector
 from hikariwave.audio.source.base import AudioSource
+from hikariwave.audio.source.mixer import MixerAudioSource
 from hikariwave.audio.source.silent import SilentAudioSource
+from hikariwave.header import RTPHeader
 from hikariwave.internal import constants
 from hikariwave.protocol import VoiceClientProtocol
 from typing import Union
@@ -15,10 +25,15 @@ import asyncio
 import hikari
 import hikariwave.error as errors
 import logging
+import math
+import random
 import time
 import typing
 
 if typing.TYPE_CHECKING:
+    from hikariwave.http import SessionPool
+    from hikariwave.sharding import Shard
+
     from typing import Callable
 
 __all__: typing.Sequence[str] = (
@@ -28,6 +43,29 @@ __all__: typing.Sequence[str] = (
 
 _logger: logging.Logger = logging.getLogger("hikariwave.connection")
 
+_LATENCY_WINDOW: typing.Final[int] = 20
+"""The amount of heartbeat round trips the rolling latency statistics cover."""
+_FATAL_CLOSE_CODES: typing.Final[frozenset[int]] = frozenset((4004, 4006, 4014, 4021, 4022))
+"""Websocket close codes after which the session can't be resumed."""
+_RESUME_BACKOFF_MAX: typing.Final[float] = 5.0
+"""The longest wait (in seconds) between consecutive failed attempts to resume."""
+_MIGRATION_TIMEOUT: typing.Final[float] = 10.0
+"""The longest time (in seconds) a new voice server may take to become ready before migrating to it is abandoned."""
+
+
+def _create_future() -> asyncio.Future[typing.Any]:
+    return asyncio.get_running_loop().create_future()
+
+
+def _log_playback_error(task: asyncio.Task[None]) -> None:
+    if task.cancelled():
+        return
+
+    exception: Union[BaseException, None] = task.exception()
+
+    if exception:
+        _logger.error("Playback failed", exc_info=exception)
+
 
 @dataclass
 class PendingConnection:
@@ -42,6 +80,51 @@ class PendingConnection:
     token: Union[str, None] = field(default=None)
     """The token provided by Discord that should be used to identify when connecting."""
 
+    connection: asyncio.Future[VoiceConnection] = field(default_factory=_create_future)
+    """Resolves with the connection once Discord has provided everything needed to open it."""
+
+    started: float = field(default_factory=time.perf_counter)
+    """The `time.perf_counter()` time the join was requested at."""
+
+    async def wait(self, timeout: Union[float, None] = None) -> VoiceConnection:
+        """
+        Wait until this pending connection is open and ready to send audio.
+
+        Parameters
+        ----------
+        timeout : float | None
+            The longest time (in seconds) to wait - If `None`, waits indefinitely.
+
+        Returns
+        -------
+        VoiceConnection
+            The connection, ready to send audio.
+
+        Raises
+        ------
+        ConnectionNotEstablishedError
+            If the connection was disconnected before it was established.
+        ConnectionTimeoutError
+            If the connection wasn't ready within the timeout.
+        """
+        async def ready() -> VoiceConnection:
+            connection: VoiceConnection = await asyncio.shield(self.connection)
+            await connection._ready_to_send.wait()
+
+            return connection
+
+        try:
+            return await asyncio.wait_for(ready(), timeout)
+        except asyncio.TimeoutError:
+            error: str = f"Connection wasn't ready to send audio within {timeout} seconds"
+            raise errors.ConnectionTimeoutError(error) from None
+        except asyncio.CancelledError:
+            if not self.connection.cancelled():
+                raise
+
+            error = "Connection was disconnected before it was established"
+            raise errors.ConnectionNotEstablishedError(error) from None
+
 
 class VoiceConnection:
     """
@@ -52,7 +135,22 @@ class VoiceConnection:
     This is an internal object and should not be instantiated.
     """
 
-    def __init__(self, bot: hikari.GatewayBot, bot_id: hikari.Snowflake, guild_id: hikari.Snowflake) -> None:
+    def __init__(
+        self,
+        bot: hikari.GatewayBot,
+        bot_id: hikari.Snowflake,
+        guild_id: hikari.Snowflake,
+        *,
+        scheduler: Union[PlaybackScheduler, None] = None,
+        late_frame_policy: LateFramePolicy = LateFramePolicy.BURST,
+        executor: Union[Executor, None] = None,
+        lookahead: int = 3,
+        shard: Union[Shard, None] = None,
+        http: Union[SessionPool, None] = None,
+        suppress_silence: bool = False,
+        receive_audio: bool = False,
+        join_started: Union[float, None] = None,
+    ) -> None:
         """Instantiate a new active voice connection.
 
         Warning
@@ -68,84 +166,333 @@ class VoiceConnection:
             The ID of the bot provided.
         guild_id : hikari.Snowflake
             The ID of the guild that this connection is responsible for.
+        scheduler : PlaybackScheduler | None
+            The shared scheduler that should drive this connection's players - If `None`, players pace themselves.
+        late_frame_policy : LateFramePolicy
+            How this connection's players should behave when they fall behind their send schedule, if they pace themselves.
+        executor : concurrent.futures.Executor | None
+            The executor that this connection's players encode and encrypt packets in - If `None`, both happen on the event loop.
+        lookahead : int
+            The amount of frames this connection's players read ahead of the one being sent.
+        shard : Shard | None
+            The worker process that should own this connection's UDP socket and playback - If `None`, both stay in this process.
+        http : SessionPool | None
+            The shared session that this connection's websocket is opened through - If `None`, the connection uses a session of its own.
+        suppress_silence : bool
+            If silent stretches of audio should stop being transmitted, along with the speaking flag, until audio returns.
+        receive_audio : bool
+            If the audio other users send to the channel should be received - Not available when a shard owns the UDP socket.
+        join_started : float | None
+            The `time.perf_counter()` time the join to this connection's channel was requested at - If `None`, the time this connection is created at.
         """
         self._bot: hikari.GatewayBot = bot
         self._bot_id: hikari.Snowflake = bot_id
         self._guild_id: hikari.Snowflake = guild_id
+        self._scheduler: Union[PlaybackScheduler, None] = scheduler
+        self._late_frame_policy: LateFramePolicy = late_frame_policy
+        self._executor: Union[Executor, None] = executor
+        self._lookahead: int = lookahead
+        self._shard: Union[Shard, None] = shard
+        self._http: Union[SessionPool, None] = http
 
         self._endpoint: Union[str, None] = None
         self._session_id: Union[str, None] = None
         self._token: Union[str, None] = None
 
-        self._websocket: Union[aiohttp.ClientWebSocketResponse, None] = None
+        self._websocket: Union[aiohttp.ClientWebSocketResponse[bool], None] = None
+        self._websocket_task: Union[asyncio.Task[None], None] = None
         self._ws_sequence: int = 0
         self._running: bool = False
 
         self._heartbeat_task: Union[asyncio.Task[None], None] = None
         self._heartbeat_interval: float = 0.0
-        self._heartbeat_last_sent: float = time.time()
-        self._heartbeat_latency: float = 0.0
+        self._heartbeat_last_sent: float = time.perf_counter()
+        self._heartbeat_nonce: Union[int, None] = None
+        self._heartbeat_latency: float = math.nan
+        self._heartbeat_latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._heartbeats_missed: int = 0
+
+        self._resume_started: Union[float, None] = None
+        self._resume_time: float = math.nan
+        self._resumes: int = 0
+
+        self._migration: Union[asyncio.Future[None], None] = None
+        self._migration_started: float = 0.0
+        self._migration_time: float = math.nan
+        self._migrations: int = 0
 
         self._ssrc: Union[int, None] = None
         self._ip: Union[str, None] = None
         self._port: Union[int, None] = None
         self._mode: Union[voice.EncryptionType, None] = None
 
-        self._timestamp: Union[int, None] = None
-        self._sequence: Union[int, None] = None
+        self._header: Union[RTPHeader, None] = None
 
         self._protocol: Union[asyncio.DatagramProtocol, None] = None
         self._transport: Union[asyncio.DatagramTransport, None] = None
 
+        self._next_ssrc: Union[int, None] = None
+        self._next_transport: Union[tuple[asyncio.DatagramTransport, asyncio.DatagramProtocol], None] = None
+
         self._external_address_discovered: asyncio.Event = asyncio.Event()
         self._external_ip: Union[str, None] = None
         self._external_port: Union[int, None] = None
 
         self._secret_key: Union[bytes, None] = None
         self._ready_to_send: asyncio.Event = asyncio.Event()
+        self._join_started: float = join_started if join_started is not None else time.perf_counter()
+        self._join_time: float = math.nan
 
         self._encryption: Union[EncryptionMode, None] = None
+        self._gain: GainStage = GainStage()
+        self._silence: Union[SilenceDetector, None] = SilenceDetector() if suppress_silence else None
+        self._speaking: bool = False
+        self._receiver: Union[AudioReceiver, None] = AudioReceiver() if receive_audio and not shard else None
         self._player: Union[AudioPlayer, None] = None
+        self._playback: Union[asyncio.Task[None], None] = None
+        self._mixer: Union[tuple[MixerAudioSource, asyncio.Task[None]], None] = None
+        self._broadcast: Union[Broadcast, None] = None
+        self._queue: deque[AudioSource] = deque()
+
+    @property
+    def lag(self) -> float:
+        """How far (in seconds) the current player is behind its send schedule, or `0.0` if nothing is playing."""
+        if not self._player:
+            return 0.0
+
+        return self._player.lag
+
+    @property
+    def player(self) -> Union[AudioPlayer, None]:
+        """The player streaming audio to this connection, if anything has been played yet."""
+        return self._player
+
+    @property
+    def receiver(self) -> Union[AudioReceiver, None]:
+        """The receiver of the audio other users send to this connection's channel, if receiving is enabled."""
+        return self._receiver
+
+    @property
+    def queue(self) -> tuple[AudioSource, ...]:
+        """The sources waiting to be played after the current one, in order."""
+        return tuple(self._queue)
+
+    @property
+    def broadcast(self) -> Union[Broadcast, None]:
+        """The broadcast this connection is listening to, if any."""
+        return self._broadcast
+
+    @property
+    def frames_suppressed(self) -> int:
+        """The amount of silent frames that were neither encoded, encrypted nor sent - Always `0` unless silence is suppressed."""
+        if not self._silence:
+            return 0
+
+        return self._silence.frames_suppressed
+
+    @property
+    def volume(self) -> float:
+        """The volume audio is played at, as a multiplier of each source's amplitude."""
+        return self._gain.volume
+
+    @property
+    def heartbeat_latency(self) -> float:
+        """The round trip time (in seconds) of the latest acknowledged heartbeat - `nan` until one is acknowledged."""
+        return self._heartbeat_latency
+
+    @property
+    def average_heartbeat_latency(self) -> float:
+        """The average round trip time (in seconds) of recently acknowledged heartbeats - `nan` until one is acknowledged."""
+        if not self._heartbeat_latencies:
+            return math.nan
+
+        return sum(self._heartbeat_latencies) / len(self._heartbeat_latencies)
+
+    @property
+    def max_heartbeat_latency(self) -> float:
+        """The longest round trip time (in seconds) of recently acknowledged heartbeats - `nan` until one is acknowledged."""
+        if not self._heartbeat_latencies:
+            return math.nan
+
+        return max(self._heartbeat_latencies)
+
+    @property
+    def heartbeats_missed(self) -> int:
+        """The amount of heartbeats that weren't acknowledged before the next one was due."""
+        return self._heartbeats_missed
+
+    @property
+    def resume_time(self) -> float:
+        """How long (in seconds) the latest resume took, from the websocket dropping to `RESUMED` - `nan` if the session never resumed."""
+        return self._resume_time
+
+    @property
+    def resumes(self) -> int:
+        """The amount of times the session was resumed after its websocket dropped."""
+        return self._resumes
+
+    @property
+    def migration_time(self) -> float:
+        """How long (in seconds) the latest voice server migration took, from the new server being assigned to audio switching over - `nan` if the connection never migrated."""
+        return self._migration_time
+
+    @property
+    def migrations(self) -> int:
+        """The amount of times the connection moved to a new voice server."""
+        return self._migrations
+
+    @property
+    def ready(self) -> bool:
+        """If this connection has received its session description and can send audio."""
+        return self._ready_to_send.is_set()
+
+    @property
+    def join_time(self) -> float:
+        """How long (in seconds) this connection took from the join request to being ready to send audio - `nan` until it's ready."""
+        return self._join_time
+
+    async def wait_until_ready(self, timeout: Union[float, None] = None) -> None:
+        """
+        Wait until this connection has received its session description and can send audio.
+
+        Parameters
+        ----------
+        timeout : float | None
+            The longest time (in seconds) to wait - If `None`, waits indefinitely.
+
+        Raises
+        ------
+        ConnectionTimeoutError
+            If the connection wasn't ready within the timeout.
+        """
+        try:
+            await asyncio.wait_for(self._ready_to_send.wait(), timeout)
+        except asyncio.TimeoutError:
+            error: str = f"Connection wasn't ready to send audio within {timeout} seconds"
+            raise errors.ConnectionTimeoutError(error) from None
 
     async def _heartbeat_loop(self) -> None:
-        while self._running and self._websocket:
-            await asyncio.sleep(self._heartbeat_interval)
+        await asyncio.sleep(self._heartbeat_interval * random.random())
+
+        while self._running and self._websocket and not self._websocket.closed:
+            if self._heartbeat_nonce is not None:
+                self._heartbeats_missed += 1
 
+                _logger.warning("Heartbeat to SESSION_ID: %s was not acknowledged - Resuming", self._session_id)
+
+                await self._websocket.close(code=4000)
+                return
+
+            nonce: int = int(time.time() * 1000)
             heartbeat: voice.VoicePayload[voice.Heartbeat] = voice.VoicePayload(
                 op=voice.VoiceCode.HEARTBEAT,
                 d=voice.Heartbeat(
-                    int(time.time() * 1000),
+                    nonce,
                     self._ws_sequence,
                 ),
             )
 
-            await self._websocket.send_str(voice.encode(heartbeat).decode("UTF-8"))
-            self._heartbeat_last_sent = time.time()
+            try:
+                await self._websocket.send_frame(voice.encode(heartbeat), aiohttp.WSMsgType.TEXT)
+            except ConnectionResetError:
+                return
+
+            self._heartbeat_nonce = nonce
+            self._heartbeat_last_sent = time.perf_counter()
+
+            await asyncio.sleep(self._heartbeat_interval)
+
+    def _heartbeat_acknowledged(self, nonce: int) -> None:
+        if nonce != self._heartbeat_nonce:
+            return
+
+        self._heartbeat_nonce = None
+        self._heartbeat_latency = time.perf_counter() - self._heartbeat_last_sent
+        self._heartbeat_latencies.append(self._heartbeat_latency)
+
+        _logger.debug("Heartbeat acknowledged in %.2fms", self._heartbeat_latency * 1000)
 
     async def _set_speaking(self, speaking: bool) -> None:
-        if not self._websocket:
+        if not self._websocket or speaking == self._speaking:
             return
 
+        self._speaking = speaking
+
         payload = voice.VoicePayload(
             voice.VoiceCode.SPEAKING,
             voice.Speaking(
                 voice.SpeakingType.MICROPHONE if speaking else voice.SpeakingType.NONE,
-                0,
                 self._ssrc if self._ssrc else 0,
             ),
         )
 
-        await self._websocket.send_str(voice.encode(payload).decode("UTF-8"))
+        await self._websocket.send_frame(voice.encode(payload), aiohttp.WSMsgType.TEXT)
 
         _logger.debug("Set speaking mode to %s", str(speaking).upper())
 
     async def _websocket_handler(self) -> None:
+        if self._http:
+            await self._websocket_session(self._http.websocket_session)
+            return
+
         async with aiohttp.ClientSession() as session:
-            self._websocket = await session.ws_connect(
-                f"wss://{self._endpoint}/?v={constants.WEBSOCKET_VERSION}",
-            )
+            await self._websocket_session(session)
+
+    async def _websocket_session(self, session: aiohttp.ClientSession) -> None:
+        resume: bool = False
+        attempts: int = 0
+
+        while self._running:
+            try:
+                close_code: Union[int, None] = await self._websocket_connection(session, resume)
+            except (aiohttp.ClientError, ConnectionError, asyncio.TimeoutError) as e:
+                _logger.debug("Voice websocket failed - %s", e)
+                close_code = None
+            except Exception as e:
+                _logger.error(e)
+                return
+
+            if not self._running:
+                return
+
+            if self._websocket_task and asyncio.current_task() is not self._websocket_task:
+                return
+
+            if close_code in _FATAL_CLOSE_CODES:
+                _logger.warning("Connection with SESSION_ID: %s can't be resumed - Closed with code %s", self._session_id, close_code)
+                return
 
-            identify = voice.VoicePayload(
+            if self._resume_started is None:
+                self._resume_started = time.perf_counter()
+                attempts = 0
+
+            resume = self._secret_key is not None
+            attempts += 1
+
+            if attempts > 1:
+                await asyncio.sleep(min(_RESUME_BACKOFF_MAX, 0.25 * 2 ** (attempts - 2)))
+
+            _logger.debug("Reconnecting to SESSION_ID: %s - Attempt %s, closed with code %s", self._session_id, attempts, close_code)
+
+    async def _websocket_connection(self, session: aiohttp.ClientSession, resume: bool) -> Union[int, None]:
+        websocket: aiohttp.ClientWebSocketResponse[bool] = await session.ws_connect(
+            f"wss://{self._endpoint}/?v={constants.WEBSOCKET_VERSION}",
+        )
+        self._websocket = websocket
+
+        if resume:
+            payload: voice.VoicePayload[typing.Any] = voice.VoicePayload(
+                voice.VoiceCode.RESUME,
+                voice.Resume(
+                    self._guild_id,
+                    self._session_id if self._session_id else '',
+                    self._token if self._token else '',
+                    self._ws_sequence,
+                ),
+            )
+        else:
+            self._speaking = False
+            payload = voice.VoicePayload(
                 voice.VoiceCode.IDENTIFY,
                 voice.Identify(
                     self._guild_id,
@@ -155,36 +502,55 @@ class VoiceConnection:
                 ),
             )
 
-            await self._websocket.send_str(voice.encode(identify).decode("UTF-8"))
+        await websocket.send_frame(voice.encode(payload), aiohttp.WSMsgType.TEXT)
 
-            try:
-                async for message in self._websocket:
-                    if message.type == aiohttp.WSMsgType.TEXT:
-                        await self._websocket_message(message)
-                    elif message.type in [aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR]:
-                        _logger.debug(f"Connection flagged to close by websocket")
-            except Exception as e:
-                _logger.error(e)
-            finally:
-                _logger.debug("Connection with SESSION_ID: %s closed", self._session_id)
+        try:
+            async for message in websocket:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    await self._websocket_message(message.data)
+                elif message.type in [aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR]:
+                    _logger.debug("Connection flagged to close by websocket")
+        finally:
+            _logger.debug("Connection with SESSION_ID: %s closed with code %s", self._session_id, websocket.close_code)
 
-    async def _websocket_message(self, message: aiohttp.WSMessage) -> None:
-        payload = voice.decode(message.data)
+        return websocket.close_code
+
+    async def _websocket_message(self, message: Union[str, bytes]) -> None:
+        payload = voice.decode(message)
 
         if payload.op == voice.VoiceCode.UNKNOWN:
             return
 
+        if payload.seq is not None:
+            self._ws_sequence = payload.seq
+
         data = payload.d
 
+        if isinstance(data, voice.HeartbeatAcknowledgement):
+            self._heartbeat_acknowledged(data.timestamp)
+            return
+
+        if isinstance(data, voice.Hello):
+            self._heartbeat_interval = data.heartbeat_interval / 1000
+            self._heartbeat_nonce = None
+
+            if self._heartbeat_task:
+                self._heartbeat_task.cancel()
+
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+            _logger.debug("Received `HELLO` payload - Heartbeating every %.2fs", self._heartbeat_interval)
+            return
+
         if isinstance(data, voice.Ready):
             _logger.debug("Received `READY` payload - Discovering IP")
 
-            self._ssrc = data.ssrc
+            self._next_ssrc = data.ssrc
             self._ip = data.ip
             self._port = data.port
 
             for mode in data.modes:
-                encryption_mode: Union[Callable[[bytes, bytes], bytes], None] = getattr(
+                encryption_mode: Union[Callable[[bytes, bytes], memoryview], None] = getattr(
                     EncryptionMode,
                     mode,
                     None,
@@ -198,6 +564,20 @@ class VoiceConnection:
                 error: str = "No supported encryption mode was found"
                 raise errors.EncryptionModeNotSupportedError(error)
 
+            self._external_address_discovered.clear()
+
+            if self._shard:
+                self._external_ip, self._external_port = await self._shard.attach(
+                    self._guild_id,
+                    data.ssrc,
+                    self._ip,
+                    self._port,
+                    self._gain.volume,
+                )
+                self._external_address_discovered.set()
+
+                _logger.debug("External IP discovered by shard %s - %s:%s", self._shard.index, self._external_ip, self._external_port)
+
             loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
 
             def on_ip_discovered(ip: str, port: int) -> None:
@@ -207,10 +587,18 @@ class VoiceConnection:
 
                 _logger.debug("External IP discovered - %s:%s", ip, port)
 
-            self._transport, self._protocol = await loop.create_datagram_endpoint(
-                lambda: VoiceClientProtocol(self._ssrc if self._ssrc else 0, on_ip_discovered),
-                remote_addr=(self._ip, self._port),
-            )
+            if not self._shard:
+                if self._next_transport:
+                    self._next_transport[0].close()
+
+                self._next_transport = await loop.create_datagram_endpoint(
+                    lambda: VoiceClientProtocol(
+                        data.ssrc,
+                        on_ip_discovered,
+                        self._receiver._receive if self._receiver else None,
+                    ),
+                    remote_addr=(self._ip, self._port),
+                )
 
             await self._external_address_discovered.wait()
 
@@ -229,22 +617,89 @@ class VoiceConnection:
             if not self._websocket:
                 return
 
-            await self._websocket.send_str(
-                voice.encode(select_protocol).decode("UTF-8"),
-            )
+            await self._websocket.send_frame(voice.encode(select_protocol), aiohttp.WSMsgType.TEXT)
             return
 
         if isinstance(data, voice.Resumed):
-            _logger.debug("Session resumed after disconnect")
+            if self._resume_started is not None:
+                self._resume_time = time.perf_counter() - self._resume_started
+                self._resume_started = None
+
+            self._resumes += 1
+
+            _logger.debug("Session resumed after disconnect in %.2fms", self._resume_time * 1000)
             return
 
         if isinstance(data, voice.SessionDescription):
             self._secret_key = bytes(data.secret_key)
-            self._encryption = EncryptionMode(self._secret_key)
+
+            if self._player:
+                await self._player._settle()
+
+            self._switch_session(EncryptionMode(self._secret_key))
+
+            if self._shard and self._mode:
+                self._shard.session(self._guild_id, self._mode, self._secret_key)
+
+            if not self._ready_to_send.is_set():
+                self._join_time = time.perf_counter() - self._join_started
+
             self._ready_to_send.set()
 
             _logger.debug("Session secret key received")
 
+            if self._migration and not self._migration.done():
+                self._migration.set_result(None)
+
+            if self._playback and not self._playback.done() and not (self._player and self._player.quiet):
+                await self._set_speaking(True)
+
+            return
+
+        if not self._receiver:
+            return
+
+        if isinstance(data, voice.Speaking):
+            if isinstance(data.user_id, hikari.Snowflake):
+                self._receiver._speaking(data.user_id, data.ssrc)
+
+            return
+
+        if isinstance(data, voice.ClientsConnect):
+            self._receiver._clients_connect(data.user_ids)
+            return
+
+        if isinstance(data, voice.ClientDisconnect):
+            self._receiver._client_disconnect(data.user_id)
+
+    def _switch_session(self, encryption: EncryptionMode) -> None:
+        self._encryption = encryption
+
+        if self._next_ssrc is not None:
+            self._ssrc = self._next_ssrc
+            self._next_ssrc = None
+
+            if self._header:
+                self._header.ssrc = self._ssrc
+            else:
+                self._header = RTPHeader(self._ssrc)
+
+        if self._next_transport:
+            if self._transport:
+                self._transport.close()
+
+            self._transport, self._protocol = self._next_transport
+            self._next_transport = None
+
+        if self._player:
+            self._player._rebind()
+
+        if self._broadcast:
+            self._broadcast.subscribe(self)
+
+        if self._receiver and self._mode:
+            self._receiver._rebind(encryption, self._mode)
+
     async def close(self) -> None:
         """Close this connection and all subsequent tasks, websockets, and packet transports.
 
@@ -255,8 +710,16 @@ class VoiceConnection:
         """
         self._running = False
 
+        if self._migration and not self._migration.done():
+            self._migration.cancel()
+
         await self.stop()
 
+        if self._playback:
+            self._playback.cancel()
+            await asyncio.wait((self._playback,))
+            self._playback = None
+
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
 
@@ -271,13 +734,25 @@ class VoiceConnection:
             await self._websocket.close()
             self._websocket = None
 
+        if self._websocket_task:
+            self._websocket_task.cancel()
+            await asyncio.wait((self._websocket_task,))
+            self._websocket_task = None
+
         if self._transport:
             self._transport.close()
             self._transport = None
 
+        if self._next_transport:
+            self._next_transport[0].close()
+            self._next_transport = None
+
+        if self._shard:
+            self._shard.detach(self._guild_id)
+
     async def connect(self, endpoint: str, session_id: str, token: str) -> None:
         """
-        Connect to an endpoint with a session ID and token.
+        Connect to an endpoint with a session ID and token, running the websocket in a background task.
 
         Warning
         -------
@@ -290,11 +765,209 @@ class VoiceConnection:
 
         self._running = True
 
-        await self._websocket_handler()
+        self._websocket_task = asyncio.create_task(self._websocket_handler())
+
+    async def migrate(self, endpoint: str, token: str, timeout: float = _MIGRATION_TIMEOUT) -> None:
+        """
+        Move to a new voice server without interrupting playback.
+
+        The new websocket and UDP socket are set up while audio keeps flowing to the current server. Once the
+        new server has sent its session description, the socket, SSRC and encryption are swapped between two
+        frames, and the current player carries on with its source, encoder and read-ahead.
+
+        Warning
+        -------
+        - This method should only be called internally.
+        - Calling this method may cause issues.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint of the new voice server.
+        token : str
+            The token provided by Discord that should be used to identify with the new voice server.
+        timeout : float
+            The longest time (in seconds) the new voice server may take to become ready before the migration is abandoned.
+
+        Raises
+        ------
+        ConnectionTimeoutError
+            If the new voice server wasn't ready within the timeout - The connection stays on its current server.
+        """
+        if endpoint == self._endpoint and token == self._token:
+            return
+
+        if self._migration and not self._migration.done():
+            self._migration.cancel()
+
+        previous_endpoint: Union[str, None] = self._endpoint
+        previous_token: Union[str, None] = self._token
+        previous_websocket: Union[aiohttp.ClientWebSocketResponse[bool], None] = self._websocket
+        previous_task: Union[asyncio.Task[None], None] = self._websocket_task
+
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+        _logger.debug("Migrating SESSION_ID: %s from %s to %s", self._session_id, previous_endpoint, endpoint)
+
+        migration: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._migration = migration
+        self._migration_started = time.perf_counter()
+
+        self._endpoint = endpoint
+        self._token = token
+        self._websocket_task = asyncio.create_task(self._websocket_handler())
+
+        try:
+            await asyncio.wait_for(asyncio.shield(migration), timeout)
+        except asyncio.TimeoutError:
+            migration.cancel()
+        except asyncio.CancelledError:
+            if not migration.cancelled():
+                raise
+
+        if migration.cancelled():
+            if not self._running:
+                return
+
+            if self._migration is not migration:
+                await self._retire_websocket(previous_task, previous_websocket)
+                return
+
+            await self._abandon_migration(previous_endpoint, previous_token, previous_websocket, previous_task)
+
+            error: str = f"Voice server at {endpoint} wasn't ready within {timeout} seconds"
+            raise errors.ConnectionTimeoutError(error)
+
+        self._migration_time = time.perf_counter() - self._migration_started
+        self._migrations += 1
+
+        await self._retire_websocket(previous_task, previous_websocket)
+
+        _logger.debug("Migrated SESSION_ID: %s to %s in %.2fms", self._session_id, endpoint, self._migration_time * 1000)
+
+    async def _retire_websocket(
+        self,
+        task: Union[asyncio.Task[None], None],
+        websocket: Union[aiohttp.ClientWebSocketResponse[bool], None],
+    ) -> None:
+        if task:
+            task.cancel()
+            await asyncio.wait((task,))
+
+        if websocket and not websocket.closed:
+            await websocket.close()
+
+    async def _abandon_migration(
+        self,
+        endpoint: Union[str, None],
+        token: Union[str, None],
+        websocket: Union[aiohttp.ClientWebSocketResponse[bool], None],
+        task: Union[asyncio.Task[None], None],
+    ) -> None:
+        await self._retire_websocket(
+            self._websocket_task if self._websocket_task is not task else None,
+            self._websocket if self._websocket is not websocket else None,
+        )
+
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+
+        if self._next_transport:
+            self._next_transport[0].close()
+            self._next_transport = None
+
+        self._next_ssrc = None
+        self._endpoint = endpoint
+        self._token = token
+        self._websocket = websocket
+        self._websocket_task = task
+        self._heartbeat_nonce = None
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+        _logger.warning("Abandoned migration of SESSION_ID: %s - Staying on %s", self._session_id, endpoint)
+
+    async def _play_queue(self, source: AudioSource) -> None:
+        await self._ready_to_send.wait()
+        await self._set_speaking(True)
+
+        current: Union[AudioSource, None] = source
+
+        if self._shard:
+            try:
+                while current:
+                    await self._shard.play(self._guild_id, current)
+                    current = self._queue.popleft() if self._queue else None
+            finally:
+                await self._set_speaking(False)
+
+            return
+
+        if not self._player:
+            self._player = AudioPlayer(
+                self,
+                self._scheduler,
+                late_frame_policy=self._late_frame_policy,
+                executor=self._executor,
+                lookahead=self._lookahead,
+                queue=self._queue,
+            )
+
+        try:
+            while current:
+                await self._player.play(current)
+
+                if not self._player.quiet:
+                    await self._player.play(SilentAudioSource(), False, use_queue=False)
+
+                current = self._queue.popleft() if self._queue else None
+        finally:
+            await self._set_speaking(False)
+
+    async def _listen(self, broadcast: Broadcast) -> None:
+        await self._ready_to_send.wait()
+        await self._set_speaking(True)
+
+        self._broadcast = broadcast
+        broadcast.subscribe(self)
+
+        try:
+            await broadcast.wait()
+        finally:
+            broadcast.unsubscribe(self)
+            self._broadcast = None
+
+        if not self._player:
+            self._player = AudioPlayer(
+                self,
+                self._scheduler,
+                late_frame_policy=self._late_frame_policy,
+                executor=self._executor,
+                lookahead=self._lookahead,
+                queue=self._queue,
+            )
+
+        await self._player.play(SilentAudioSource(), False, use_queue=False)
+        await self._set_speaking(False)
+
+    async def _mix(self, mixer: MixerAudioSource, previous: Union[asyncio.Task[None], None]) -> None:
+        if previous and not previous.done():
+            previous.cancel()
+            await asyncio.wait((previous,))
+
+        await self._play_queue(mixer)
+
+    async def _wait_playback(self, playback: asyncio.Task[None]) -> None:
+        await asyncio.wait((playback,))
+
+        # Cancelled when replaced by another playback or stopped, which isn't an error of this one
+        if not playback.cancelled():
+            playback.result()
 
     async def play(self, source: AudioSource) -> None:
         """
-        Play audio from a given source.
+        Play audio from a given source, replacing whatever is currently playing, then play through the queue.
         
         Warning
         -------
@@ -305,18 +978,178 @@ class VoiceConnection:
         source : AudioSource
             The source in which the audio will be framed.
         """
-        await self._ready_to_send.wait()
-        await self._set_speaking(True)
+        if self._playback and not self._playback.done():
+            self._playback.cancel()
+            await asyncio.wait((self._playback,))
 
-        self._player = AudioPlayer(self)
+        self._playback = asyncio.create_task(self._play_queue(source))
+        await self._wait_playback(self._playback)
 
-        try:
-            await self._player.play(source)
-            await self._player.play(SilentAudioSource(), False)
-        except AttributeError:
-            pass
+    async def listen(self, broadcast: Broadcast) -> None:
+        """
+        Listen to a broadcast, replacing whatever is currently playing, until the broadcast finishes or playback is stopped.
 
-        await self.stop()
+        Warning
+        -------
+        This method should only be called internally.
+
+        Parameters
+        ----------
+        broadcast : Broadcast
+            The broadcast to listen to - It joins wherever the broadcast currently is.
+
+        Raises
+        ------
+        TypeError
+            If this connection streams from a shard process, which can't listen to a broadcast in this process.
+        """
+        if self._shard:
+            error: str = "Sharded connections can't listen to a broadcast"
+            raise TypeError(error)
+
+        if self._playback and not self._playback.done():
+            self._playback.cancel()
+            await asyncio.wait((self._playback,))
+
+        self._playback = asyncio.create_task(self._listen(broadcast))
+        await self._wait_playback(self._playback)
+
+    def enqueue(self, source: AudioSource) -> None:
+        """
+        Queue audio from a given source to play once everything before it has finished, without a gap between them.
+
+        If nothing is playing, the source starts playing at once - As nothing awaits that playback, an error raised while playing it is logged.
+
+        Warning
+        -------
+        This method should only be called internally.
+
+        Parameters
+        ----------
+        source : AudioSource
+            The source in which the audio will be framed.
+        """
+        if self._playback and not self._playback.done():
+            self._queue.append(source)
+            return
+
+        self._playback = asyncio.create_task(self._play_queue(source))
+        self._playback.add_done_callback(_log_playback_error)
+
+    def mix(self, source: AudioSource) -> None:
+        """
+        Overlay audio from a given source on top of the mixed audio currently playing.
+
+        If nothing is playing, the source starts playing on its own - If something other than mixed audio is playing, it is replaced.
+
+        Warning
+        -------
+        This method should only be called internally.
+
+        Parameters
+        ----------
+        source : AudioSource
+            The PCM source to mix in.
+
+        Raises
+        ------
+        TypeError
+            If this connection streams from a shard process, which can't mix.
+        """
+        if self._shard:
+            error: str = "Sharded connections can't mix audio"
+            raise TypeError(error)
+
+        if self._mixer:
+            mixer, playback = self._mixer
+
+            if playback is self._playback and not playback.done() and not mixer.finished:
+                mixer.add(source)
+                return
+
+        # Installed before its playback starts, so sources mixed in the meantime join it instead of replacing it
+        mixer = MixerAudioSource(source)
+
+        self._playback = asyncio.create_task(self._mix(mixer, self._playback))
+        self._playback.add_done_callback(_log_playback_error)
+        self._mixer = (mixer, self._playback)
+
+    def skip(self) -> None:
+        """
+        Skip the source currently playing, moving straight on to the next queued source.
+
+        Warning
+        -------
+        This method should only be called internally.
+        """
+        if self._shard:
+            self._shard.stop(self._guild_id)
+            return
+
+        if self._player:
+            self._player.skip()
+
+    def clear_queue(self) -> None:
+        """
+        Remove every queued source, leaving the source currently playing untouched.
+
+        Warning
+        -------
+        This method should only be called internally.
+        """
+        self._queue.clear()
+
+    def seek(self, seconds: float) -> None:
+        """
+        Move playback of the current source to a new position.
+
+        Warning
+        -------
+        This method should only be called internally.
+
+        Parameters
+        ----------
+        seconds : float
+            The position to move to, from the start of the source.
+
+        Raises
+        ------
+        NotImplementedError
+            If the current source can't seek.
+        """
+        if self._shard:
+            self._shard.seek(self._guild_id, seconds)
+            return
+
+        if not self._player:
+            return
+
+        self._player.seek(seconds)
+
+    def set_volume(self, volume: float) -> None:
+        """
+        Change the volume audio is played at, taking effect from the next frame encoded.
+
+        Only sources decoded to PCM are affected - Sources that are already Opus, such as Ogg files and cached files, play unchanged.
+
+        Warning
+        -------
+        This method should only be called internally.
+
+        Parameters
+        ----------
+        volume : float
+            The new volume, as a multiplier of each source's amplitude - `1.0` leaves audio unchanged.
+
+        Raises
+        ------
+        ValueError
+            If the volume is negative.
+        """
+        self._gain.volume = volume
+
+        if self._shard:
+            self._shard.volume(self._guild_id, volume)
 
     async def stop(self) -> None:
         """
@@ -326,10 +1159,18 @@ class VoiceConnection:
         -------
         This method should only be called internally.
         """
+        self._queue.clear()
+
+        if self._shard:
+            self._shard.stop(self._guild_id)
+            return
+
+        if self._broadcast and self._playback:
+            self._playback.cancel()
+            await asyncio.wait((self._playback,))
+            await self._set_speaking(False)
+
         if not self._player:
             return
 
         await self._player.stop()
-        await self._set_speaking(False)
-
-        self._player = None
@@ -5,6 +5,7 @@ import typing
 __all__: typing.Sequence[str] = (
     "ConnectionAlreadyEstablishedError",
     "ConnectionNotEstablishedError",
+    "ConnectionTimeoutError",
     "EncryptionModeNotSupportedError",
 )
 
@@ -17,5 +18,9 @@ class ConnectionNotEstablishedError(RuntimeError):
     """Thrown when an attempt to manipulate a connection occurs when the connection doesn't exist."""
 
 
+class ConnectionTimeoutError(TimeoutError):
+    """Thrown when a connection doesn't become ready to send audio in time."""
+
+
 class EncryptionModeNotSupportedError(RuntimeError):
     """Thrown when an attempt to use an unsupported encryption mode occurs."""
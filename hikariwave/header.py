@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+from hikariwave.internal import constants
+
 import struct
 import typing
 
-__all__: typing.Sequence[str] = ("Header",)
+__all__: typing.Sequence[str] = (
+    "Header",
+    "RTPHeader",
+)
+
+_SEQUENCE_MASK: typing.Final[int] = constants.BIT_16 - 1
+_TIMESTAMP_MASK: typing.Final[int] = constants.BIT_32 - 1
 
 
 class Header:
@@ -42,3 +50,122 @@ class Header:
         )
 
         return header
+
+
+class RTPHeader:
+    """
+    Reusable RTP header for a single connection.
+
+    The version, payload type and SSRC are written once, while the sequence and timestamp are updated in place
+    inside a preallocated buffer.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    _LAYOUT: typing.Final[struct.Struct] = struct.Struct(">BBHII")
+    _COUNTERS: typing.Final[struct.Struct] = struct.Struct(">HI")
+    _SSRC: typing.Final[struct.Struct] = struct.Struct(">I")
+
+    def __init__(self, ssrc: int, sequence: int = 0, timestamp: int = 0) -> None:
+        """
+        Create a new reusable RTP header.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        ssrc : int
+            The SSRC of the connection sending this header - Provided by Discord's `READY` payload.
+        sequence : int
+            The sequence to start from.
+        timestamp : int
+            The timestamp to start from.
+        """
+        self._ssrc: int = ssrc
+        self._sequence: int = sequence & _SEQUENCE_MASK
+        self._timestamp: int = timestamp & _TIMESTAMP_MASK
+
+        self._buffer: bytearray = bytearray(self._LAYOUT.size)
+        self._view: memoryview = memoryview(self._buffer)
+
+        self._LAYOUT.pack_into(
+            self._buffer,
+            0,
+            0x80,  # Version 2, no padding, no extension, no CSRC
+            0x78,  # Opus
+            self._sequence,
+            self._timestamp,
+            self._ssrc,
+        )
+
+    @property
+    def sequence(self) -> int:
+        """The sequence of the next packet."""
+        return self._sequence
+
+    @property
+    def timestamp(self) -> int:
+        """The timestamp of the next packet."""
+        return self._timestamp
+
+    @property
+    def ssrc(self) -> int:
+        """The SSRC written into this header."""
+        return self._ssrc
+
+    @ssrc.setter
+    def ssrc(self, ssrc: int) -> None:
+        self._ssrc = ssrc
+        self._SSRC.pack_into(self._buffer, 8, ssrc)
+
+    @property
+    def view(self) -> memoryview:
+        """The fully formed header of the next packet - Only valid until the header is advanced."""
+        return self._view
+
+    def advance(self) -> None:
+        """
+        Move on to the next packet, incrementing the sequence and the timestamp by one frame.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._sequence = (self._sequence + 1) & _SEQUENCE_MASK
+        self._timestamp = (self._timestamp + constants.FRAME_SIZE) & _TIMESTAMP_MASK
+
+        self._COUNTERS.pack_into(self._buffer, 2, self._sequence, self._timestamp)
+
+    def skip(self) -> None:
+        """
+        Account for a frame that was never sent, incrementing only the timestamp.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._timestamp = (self._timestamp + constants.FRAME_SIZE) & _TIMESTAMP_MASK
+
+        self._COUNTERS.pack_into(self._buffer, 2, self._sequence, self._timestamp)
+
+    def rewind(self, frames: int) -> None:
+        """
+        Take back packets that were stamped but never sent, decrementing the sequence and the timestamp.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        frames : int
+            The amount of packets to take back.
+        """
+        self._sequence = (self._sequence - frames) & _SEQUENCE_MASK
+        self._timestamp = (self._timestamp - frames * constants.FRAME_SIZE) & _TIMESTAMP_MASK
+
+        self._COUNTERS.pack_into(self._buffer, 2, self._sequence, self._timestamp)
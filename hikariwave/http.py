@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from typing import Union
+
+import aiohttp
+import logging
+import time
+import types
+import typing
+
+__all__: typing.Sequence[str] = ("SessionPool",)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.http")
+
+
+class SessionPool:
+    """
+    Shared `aiohttp` sessions whose connectors pool connections for voice websockets and web audio sources.
+
+    One pool is owned by each `VoiceClient`, so DNS lookups, TCP connections and TLS sessions are reused
+    across guilds and tracks instead of every connection and track creating a session of its own. Web audio
+    streams share a connector whose limits are configurable, while voice websockets - which hold their
+    connection for as long as they stay connected - get an unbounded one of their own.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 0,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+    ) -> None:
+        """
+        Create a new session pool - The sessions themselves are created when they're first used.
+
+        Parameters
+        ----------
+        limit : int
+            The maximum amount of simultaneous web audio streams - If `0`, there is no limit.
+        limit_per_host : int
+            The maximum amount of simultaneous web audio streams from a single host - If `0`, there is no limit.
+        keepalive_timeout : float
+            How long (in seconds) an idle connection is kept open for reuse.
+        dns_cache_ttl : int
+            How long (in seconds) resolved hostnames are cached.
+        """
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._keepalive_timeout: float = keepalive_timeout
+        self._dns_cache_ttl: int = dns_cache_ttl
+
+        self._stream_session: Union[aiohttp.ClientSession, None] = None
+        self._websocket_session: Union[aiohttp.ClientSession, None] = None
+
+        self._connections_created: int = 0
+        self._connections_reused: int = 0
+        self._connections_queued: int = 0
+        self._connect_time_total: float = 0.0
+        self._connect_time_max: float = 0.0
+        self._requests_active: int = 0
+
+    @property
+    def stream_session(self) -> aiohttp.ClientSession:
+        """
+        The shared session for web audio streams - It is created on first access, which must happen inside a running event loop.
+
+        A stream holds its connection until its track ends, and live streams never do, so with a limit set, tracks past
+        it wait for another track to end before they start.
+        """
+        if not self._stream_session or self._stream_session.closed:
+            self._stream_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                    ttl_dns_cache=self._dns_cache_ttl,
+                ),
+                trace_configs=[self._trace_config()],
+            )
+
+            _logger.debug("Created HTTP session for web audio streams with a limit of %s connections", self._limit)
+
+        return self._stream_session
+
+    @property
+    def websocket_session(self) -> aiohttp.ClientSession:
+        """
+        The shared session for voice websockets - It is created on first access, which must happen inside a running event loop.
+
+        Voice websockets stay open for as long as their connection, so they don't count towards the pool's limits;
+        otherwise every guild past a limit would wait forever for a connection to be released.
+        """
+        if not self._websocket_session or self._websocket_session.closed:
+            self._websocket_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0,
+                    ttl_dns_cache=self._dns_cache_ttl,
+                ),
+                trace_configs=[self._trace_config()],
+            )
+
+            _logger.debug("Created HTTP session for voice websockets")
+
+        return self._websocket_session
+
+    @property
+    def connections_created(self) -> int:
+        """The amount of new connections that have been opened."""
+        return self._connections_created
+
+    @property
+    def connections_reused(self) -> int:
+        """The amount of requests that were served by an already open connection."""
+        return self._connections_reused
+
+    @property
+    def connections_queued(self) -> int:
+        """The amount of web audio streams that had to wait for a connection because the pool was at a limit."""
+        return self._connections_queued
+
+    @property
+    def connect_time(self) -> float:
+        """The average time (in seconds) spent opening a new connection, including DNS and TLS."""
+        if not self._connections_created:
+            return 0.0
+
+        return self._connect_time_total / self._connections_created
+
+    @property
+    def max_connect_time(self) -> float:
+        """The longest time (in seconds) spent opening a new connection, including DNS and TLS."""
+        return self._connect_time_max
+
+    @property
+    def requests_active(self) -> int:
+        """The amount of requests currently in flight."""
+        return self._requests_active
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+
+        async def on_request_start(_: aiohttp.ClientSession, context: types.SimpleNamespace, __: typing.Any) -> None:
+            self._requests_active += 1
+
+        async def on_request_end(_: aiohttp.ClientSession, context: types.SimpleNamespace, __: typing.Any) -> None:
+            self._requests_active -= 1
+
+        async def on_connection_queued_start(_: aiohttp.ClientSession, context: types.SimpleNamespace, __: typing.Any) -> None:
+            self._connections_queued += 1
+
+        async def on_connection_create_start(_: aiohttp.ClientSession, context: types.SimpleNamespace, __: typing.Any) -> None:
+            context.connect_started = time.perf_counter()
+
+        async def on_connection_create_end(_: aiohttp.ClientSession, context: types.SimpleNamespace, __: typing.Any) -> None:
+            elapsed: float = time.perf_counter() - context.connect_started
+
+            self._connections_created += 1
+            self._connect_time_total += elapsed
+            self._connect_time_max = max(self._connect_time_max, elapsed)
+
+        async def on_connection_reuseconn(_: aiohttp.ClientSession, context: types.SimpleNamespace, __: typing.Any) -> None:
+            self._connections_reused += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_end)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+
+        return trace_config
+
+    async def close(self) -> None:
+        """Close the shared sessions and every pooled connection."""
+        for session in (self._stream_session, self._websocket_session):
+            if session and not session.closed:
+                await session.close()
+
+        self._stream_session = None
+        self._websocket_session = None
@@ -12,7 +12,12 @@ __all__: typing.Sequence[str] = ("VoiceClientProtocol",)
 class VoiceClientProtocol(asyncio.DatagramProtocol):
     """UDP client to interact with Discord's voice gateway."""
 
-    def __init__(self, ssrc: int, callback: Callable[[str, int], None]) -> None:
+    def __init__(
+        self,
+        ssrc: int,
+        callback: Callable[[str, int], None],
+        receive: Union[Callable[[bytes], None], None] = None,
+    ) -> None:
         """
         Create a new UDP client.
 
@@ -26,10 +31,13 @@ class VoiceClientProtocol(asyncio.DatagramProtocol):
             The provided SSRC from Discord's `READY` packet.
         callback : typing.Callable[[str, int], None]
             The synchronous method to call when the device's external UDP IP and port are discovered.
+        receive : typing.Callable[[bytes], None] | None
+            The synchronous method to call with every other packet received - If `None`, they are ignored.
         """
         self._transport: Union[asyncio.DatagramTransport, None] = None
         self._ssrc: int = ssrc
         self._callback: Callable[[str, int], None] = callback
+        self._receive: Union[Callable[[bytes], None], None] = receive
 
     def connection_made(self, transport: asyncio.DatagramTransport) -> None:
         """
@@ -58,6 +66,9 @@ class VoiceClientProtocol(asyncio.DatagramProtocol):
         - Calling this method may cause issues.
         """
         if len(data) != 74 or data[1] != 0x02:
+            if self._receive:
+                self._receive(data)
+
             return
 
         ip: str = data[8 : data.index(0, 8)].decode("ascii")
@@ -0,0 +1,730 @@
+from __future__ import annotations
+
+from hikariwave.audio.clock import LateFramePolicy
+from hikariwave.audio.encryption import EncryptionMode
+from hikariwave.audio.gain import GainStage
+from hikariwave.audio.player import AudioPlayer
+from hikariwave.audio.scheduler import PlaybackScheduler
+from hikariwave.audio.source.cached import CachedAudioSource
+from hikariwave.audio.source.file import FileAudioSource
+from hikariwave.audio.source.ogg import OggOpusAudioSource
+from hikariwave.audio.source.silent import SilentAudioSource
+from hikariwave.header import RTPHeader
+from hikariwave.protocol import VoiceClientProtocol
+from typing import Union
+
+import asyncio
+import hikariwave.error as errors
+import logging
+import msgspec
+import multiprocessing
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    from hikariwave.audio.source.base import AudioSource
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from typing import Callable
+
+__all__: typing.Sequence[str] = (
+    "Shard",
+    "ShardPool",
+)
+
+_logger: logging.Logger = logging.getLogger("hikariwave.sharding")
+
+_DISCOVERY_TIMEOUT: typing.Final[float] = 10.0
+"""The longest time (in seconds) a shard may take to discover a guild's external address."""
+_SOURCES: typing.Final[dict[str, Callable[[str], AudioSource]]] = {
+    source.__name__: source
+    for source in (CachedAudioSource, FileAudioSource, OggOpusAudioSource)
+}
+
+
+class _Attach(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+    ssrc: int
+    ip: str
+    port: int
+    volume: float = 1.0
+
+
+class _Session(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+    mode: str
+    secret_key: bytes
+
+
+class _Play(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+    source: str
+    filepath: str
+
+
+class _Seek(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+    seconds: float
+
+
+class _Volume(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+    volume: float
+
+
+class _Stop(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+
+
+class _Detach(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+
+
+class _Discovered(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+    ip: str
+    port: int
+
+
+class _Finished(msgspec.Struct, tag=True, array_like=True):
+    guild_id: int
+    error: Union[str, None] = None
+
+
+_Command = Union[_Attach, _Session, _Play, _Seek, _Volume, _Stop, _Detach]
+_Event = Union[_Discovered, _Finished]
+
+
+def _read(connection: Connection, loop: asyncio.AbstractEventLoop, callback: Callable[[Union[bytes, None]], None]) -> None:
+    while True:
+        try:
+            message: Union[bytes, None] = connection.recv_bytes()
+        except (EOFError, OSError):
+            message = None
+
+        try:
+            loop.call_soon_threadsafe(callback, message)
+        except RuntimeError:
+            return
+
+        if message is None:
+            return
+
+
+class _ShardedVoice:
+    """The media half of a voice connection, owned by a shard worker."""
+
+    def __init__(self, guild_id: int, ssrc: int, volume: float) -> None:
+        self._guild_id: int = guild_id
+        self._ssrc: int = ssrc
+        self._header: RTPHeader = RTPHeader(ssrc)
+        self._gain: GainStage = GainStage(volume)
+        self._silence: None = None
+
+        self._transport: Union[asyncio.DatagramTransport, None] = None
+        self._mode: Union[str, None] = None
+        self._encryption: Union[EncryptionMode, None] = None
+
+        self._next_ssrc: Union[int, None] = None
+        self._next_transport: Union[asyncio.DatagramTransport, None] = None
+
+        self._player: Union[AudioPlayer, None] = None
+        self._task: Union[asyncio.Task[None], None] = None
+
+    async def _set_speaking(self, speaking: bool) -> None:
+        # Silence isn't suppressed in shard workers, so their players never change whether they speak
+        return
+
+
+class _ShardWorker:
+    """The event loop of a shard worker process, serving the commands of its parent."""
+
+    def __init__(self, connection: Connection, late_frame_policy: LateFramePolicy) -> None:
+        self._connection: Connection = connection
+        self._scheduler: PlaybackScheduler = PlaybackScheduler(late_frame_policy)
+
+        self._decoder: msgspec.msgpack.Decoder[_Command] = msgspec.msgpack.Decoder(_Command)
+        self._encoder: msgspec.msgpack.Encoder = msgspec.msgpack.Encoder()
+
+        self._voices: dict[int, _ShardedVoice] = {}
+        self._closed: asyncio.Event = asyncio.Event()
+
+    def _send(self, event: _Event) -> None:
+        try:
+            self._connection.send_bytes(self._encoder.encode(event))
+        except (BrokenPipeError, OSError):
+            self._closed.set()
+
+    def _received(self, message: Union[bytes, None]) -> None:
+        if message is None:
+            self._closed.set()
+            return
+
+        command: _Command = self._decoder.decode(message)
+
+        if isinstance(command, _Attach):
+            asyncio.create_task(self._attach(command))
+        elif isinstance(command, _Session):
+            self._session(command)
+        elif isinstance(command, _Play):
+            self._play(command)
+        elif isinstance(command, _Seek):
+            self._seek(command)
+        elif isinstance(command, _Volume):
+            self._volume(command)
+        elif isinstance(command, _Stop):
+            self._stop(command.guild_id)
+        else:
+            self._detach(command.guild_id)
+
+    async def _attach(self, command: _Attach) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        voice: Union[_ShardedVoice, None] = self._voices.get(command.guild_id, None)
+
+        if not voice:
+            voice = _ShardedVoice(command.guild_id, command.ssrc, command.volume)
+            self._voices[command.guild_id] = voice
+        elif voice._next_transport:
+            voice._next_transport.close()
+
+        def on_ip_discovered(ip: str, port: int) -> None:
+            self._send(_Discovered(command.guild_id, ip, port))
+
+        voice._next_ssrc = command.ssrc
+        voice._next_transport, _ = await loop.create_datagram_endpoint(
+            lambda: VoiceClientProtocol(command.ssrc, on_ip_discovered),
+            remote_addr=(command.ip, command.port),
+        )
+
+    def _session(self, command: _Session) -> None:
+        voice: Union[_ShardedVoice, None] = self._voices.get(command.guild_id, None)
+
+        if not voice:
+            return
+
+        voice._mode = command.mode
+        voice._encryption = EncryptionMode(command.secret_key)
+
+        if voice._next_ssrc is not None:
+            voice._ssrc = voice._next_ssrc
+            voice._header.ssrc = voice._ssrc
+            voice._next_ssrc = None
+
+        if voice._next_transport:
+            if voice._transport:
+                voice._transport.close()
+
+            voice._transport = voice._next_transport
+            voice._next_transport = None
+
+        if voice._player:
+            voice._player._rebind()
+
+    def _play(self, command: _Play) -> None:
+        voice: Union[_ShardedVoice, None] = self._voices.get(command.guild_id, None)
+
+        if not voice:
+            self._send(_Finished(command.guild_id, "Connection is not attached to this shard"))
+            return
+
+        if voice._task:
+            voice._task.cancel()
+
+        voice._task = asyncio.create_task(self._stream(voice, _SOURCES[command.source](command.filepath)))
+
+    async def _stream(self, voice: _ShardedVoice, source: AudioSource) -> None:
+        error: Union[str, None] = None
+
+        player: AudioPlayer = AudioPlayer(voice, self._scheduler)
+        voice._player = player
+
+        try:
+            await player.play(source)
+            await player.play(SilentAudioSource(), False)
+        except asyncio.CancelledError:
+            await player.stop()
+            raise
+        except Exception as e:
+            error = str(e)
+        finally:
+            if voice._player is player:
+                voice._player = None
+                voice._task = None
+
+        self._send(_Finished(voice._guild_id, error))
+
+    def _seek(self, command: _Seek) -> None:
+        voice: Union[_ShardedVoice, None] = self._voices.get(command.guild_id, None)
+
+        if not voice or not voice._player:
+            return
+
+        try:
+            voice._player.seek(command.seconds)
+        except NotImplementedError as e:
+            _logger.warning("Failed to seek GUILD: %s - %s", command.guild_id, e)
+
+    def _volume(self, command: _Volume) -> None:
+        voice: Union[_ShardedVoice, None] = self._voices.get(command.guild_id, None)
+
+        if voice:
+            voice._gain.volume = command.volume
+
+    def _stop(self, guild_id: int) -> None:
+        voice: Union[_ShardedVoice, None] = self._voices.get(guild_id, None)
+
+        if voice and voice._player:
+            asyncio.create_task(voice._player.stop())
+
+    def _detach(self, guild_id: int) -> None:
+        voice: Union[_ShardedVoice, None] = self._voices.pop(guild_id, None)
+
+        if not voice:
+            return
+
+        if voice._task:
+            voice._task.cancel()
+
+        for transport in (voice._transport, voice._next_transport):
+            if transport:
+                transport.close()
+
+    async def run(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        threading.Thread(
+            target=_read,
+            args=(self._connection, loop, self._received),
+            name="hikariwave-shard-reader",
+            daemon=True,
+        ).start()
+
+        await self._closed.wait()
+
+        for guild_id in tuple(self._voices):
+            self._detach(guild_id)
+
+
+def _encode_snowflake(value: typing.Any) -> int:
+    if isinstance(value, int):
+        return int(value)
+
+    error: str = f"Objects of type {type(value).__name__} can't be sent to a shard"
+    raise NotImplementedError(error)
+
+
+def _worker_main(connection: Connection, late_frame_policy: LateFramePolicy) -> None:
+    asyncio.run(_ShardWorker(connection, late_frame_policy).run())
+
+
+class Shard:
+    """
+    A worker process that owns the UDP sockets, FFmpeg pipes, Opus encoders and encryption of its guilds.
+
+    Warning
+    -------
+    This is an internal object and should not be instantiated.
+    """
+
+    def __init__(self, index: int, late_frame_policy: LateFramePolicy) -> None:
+        """
+        Start a new shard worker process.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        index : int
+            The index of this shard in its pool.
+        late_frame_policy : LateFramePolicy
+            How the worker's playback should behave when it falls behind its send schedule.
+        """
+        self._index: int = index
+        self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        context = multiprocessing.get_context("spawn")
+        self._connection, worker_connection = context.Pipe()
+        self._process: BaseProcess = context.Process(
+            target=_worker_main,
+            args=(worker_connection, late_frame_policy),
+            name=f"hikariwave-shard-{index}",
+            daemon=True,
+        )
+        self._process.start()
+        worker_connection.close()
+
+        self._encoder: msgspec.msgpack.Encoder = msgspec.msgpack.Encoder(enc_hook=_encode_snowflake)
+        self._decoder: msgspec.msgpack.Decoder[_Event] = msgspec.msgpack.Decoder(_Event)
+
+        self._guilds: set[int] = set()
+        self._closing: bool = False
+        self._discoveries: dict[int, asyncio.Future[tuple[str, int]]] = {}
+        self._plays: dict[int, asyncio.Future[None]] = {}
+
+        threading.Thread(
+            target=_read,
+            args=(self._connection, self._loop, self._received),
+            name=f"hikariwave-shard-{index}-reader",
+            daemon=True,
+        ).start()
+
+    @property
+    def index(self) -> int:
+        """The index of this shard in its pool."""
+        return self._index
+
+    @property
+    def load(self) -> int:
+        """The amount of guilds currently assigned to this shard."""
+        return len(self._guilds)
+
+    @property
+    def alive(self) -> bool:
+        """If this shard's worker process is still running."""
+        return self._process.is_alive()
+
+    def _send(self, command: _Command) -> None:
+        self._connection.send_bytes(self._encoder.encode(command))
+
+    def _received(self, message: Union[bytes, None]) -> None:
+        if message is None:
+            if not self._closing:
+                _logger.warning("Shard %s worker process exited", self._index)
+
+            error: str = f"Shard {self._index} worker process exited"
+
+            for future in (*self._discoveries.values(), *self._plays.values()):
+                if not future.done():
+                    future.set_exception(RuntimeError(error))
+
+            self._discoveries.clear()
+            self._plays.clear()
+            return
+
+        event: _Event = self._decoder.decode(message)
+
+        if isinstance(event, _Discovered):
+            discovery: Union[asyncio.Future[tuple[str, int]], None] = self._discoveries.pop(event.guild_id, None)
+
+            if discovery and not discovery.done():
+                discovery.set_result((event.ip, event.port))
+            return
+
+        play: Union[asyncio.Future[None], None] = self._plays.pop(event.guild_id, None)
+
+        if not play or play.done():
+            return
+
+        if event.error:
+            play.set_exception(RuntimeError(event.error))
+        else:
+            play.set_result(None)
+
+    async def attach(
+        self,
+        guild_id: int,
+        ssrc: int,
+        ip: str,
+        port: int,
+        volume: float = 1.0,
+        timeout: float = _DISCOVERY_TIMEOUT,
+    ) -> tuple[str, int]:
+        """
+        Open a guild's UDP socket in this shard and discover its external address.
+
+        If the guild is already attached, its playback carries on through the current socket until the new session
+        arrives, which is when the new socket takes over.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild being attached.
+        ssrc : int
+            The SSRC provided by Discord's `READY` payload.
+        ip : str
+            The IP of the voice server's UDP endpoint.
+        port : int
+            The port of the voice server's UDP endpoint.
+        volume : float
+            The volume the guild's playback starts at.
+        timeout : float
+            The longest time (in seconds) to wait for the external address to be discovered.
+
+        Returns
+        -------
+        tuple[str, int]
+            The external IP and port of the guild's UDP socket.
+
+        Raises
+        ------
+        ConnectionTimeoutError
+            If the external address wasn't discovered in time.
+        RuntimeError
+            If this shard's worker process has exited.
+        """
+        if not self.alive:
+            error: str = f"Shard {self._index} worker process exited"
+            raise RuntimeError(error)
+
+        self._guilds.add(guild_id)
+
+        discovery: asyncio.Future[tuple[str, int]] = self._loop.create_future()
+        self._discoveries[guild_id] = discovery
+
+        self._send(_Attach(guild_id, ssrc, ip, port, volume))
+
+        try:
+            return await asyncio.wait_for(discovery, timeout)
+        except asyncio.TimeoutError:
+            if self._discoveries.get(guild_id, None) is discovery:
+                del self._discoveries[guild_id]
+
+            error: str = f"Shard {self._index} didn't discover the external address of guild {guild_id} within {timeout} seconds"
+            raise errors.ConnectionTimeoutError(error) from None
+
+    def session(self, guild_id: int, mode: str, secret_key: bytes) -> None:
+        """
+        Hand a guild's negotiated encryption mode and secret key to this shard.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild.
+        mode : str
+            The negotiated encryption mode.
+        secret_key : bytes
+            The secret key provided by Discord's `SESSION_DESCRIPTION` payload.
+        """
+        self._send(_Session(guild_id, mode, secret_key))
+
+    async def play(self, guild_id: int, source: AudioSource) -> None:
+        """
+        Stream an audio source to a guild from this shard, returning once it has finished.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild.
+        source : AudioSource
+            The source to stream - It is recreated in the worker process from its type and file path.
+
+        Raises
+        ------
+        TypeError
+            If the source can't be recreated in the worker process.
+        """
+        name: str = type(source).__name__
+        filepath: Union[str, None] = getattr(source, "_filepath", None)
+
+        if name not in _SOURCES or filepath is None:
+            error: str = f"{name} can't be played from a shard worker"
+            raise TypeError(error)
+
+        previous: Union[asyncio.Future[None], None] = self._plays.pop(guild_id, None)
+
+        if previous and not previous.done():
+            previous.set_result(None)
+
+        play: asyncio.Future[None] = self._loop.create_future()
+        self._plays[guild_id] = play
+
+        self._send(_Play(guild_id, name, filepath))
+        await play
+
+    def seek(self, guild_id: int, seconds: float) -> None:
+        """
+        Move a guild's playback in this shard to a new position.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild.
+        seconds : float
+            The position to move to, from the start of the source.
+        """
+        self._send(_Seek(guild_id, seconds))
+
+    def volume(self, guild_id: int, volume: float) -> None:
+        """
+        Change the volume of a guild's playback in this shard.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild.
+        volume : float
+            The new volume, as a multiplier of the source's amplitude.
+        """
+        self._send(_Volume(guild_id, volume))
+
+    def stop(self, guild_id: int) -> None:
+        """
+        Stop a guild's playback in this shard.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild.
+        """
+        self._send(_Stop(guild_id))
+
+    def detach(self, guild_id: int) -> None:
+        """
+        Close a guild's UDP socket and playback in this shard.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild being detached.
+        """
+        if guild_id not in self._guilds:
+            return
+
+        self._guilds.discard(guild_id)
+        self._discoveries.pop(guild_id, None)
+
+        play: Union[asyncio.Future[None], None] = self._plays.pop(guild_id, None)
+
+        if play and not play.done():
+            play.set_result(None)
+
+        try:
+            self._send(_Detach(guild_id))
+        except (BrokenPipeError, OSError):
+            pass
+
+    async def close(self) -> None:
+        """
+        Shut this shard's worker process down.
+
+        Warning
+        -------
+        This is an internal method and should not be called.
+        """
+        self._closing = True
+        self._connection.close()
+
+        await asyncio.to_thread(self._process.join, 5.0)
+
+        if self._process.is_alive():
+            self._process.kill()
+
+
+class ShardPool:
+    """
+    Pool of worker processes that active connections are sharded across, so Opus encoding and encryption scale past one CPU core.
+
+    The main process keeps the Discord gateway and voice websockets, while each worker owns the UDP sockets,
+    FFmpeg pipes, Opus encoders and encryption of the guilds assigned to it. Guilds are assigned to the
+    least-loaded worker, and the processes talk over pipes with compact msgpack messages.
+    """
+
+    def __init__(self, shards: int, *, late_frame_policy: LateFramePolicy = LateFramePolicy.BURST) -> None:
+        """
+        Create a new shard pool - Worker processes are started when the first guild is assigned.
+
+        Parameters
+        ----------
+        shards : int
+            The amount of worker processes.
+        late_frame_policy : LateFramePolicy
+            How the workers' playback should behave when it falls behind its send schedule.
+        """
+        if shards < 1:
+            error: str = "A shard pool needs at least one shard"
+            raise ValueError(error)
+
+        self._size: int = shards
+        self._late_frame_policy: LateFramePolicy = late_frame_policy
+
+        self._shards: list[Shard] = []
+        self._assignments: dict[int, Shard] = {}
+
+    @property
+    def shards(self) -> tuple[Shard, ...]:
+        """Every running shard of this pool."""
+        return tuple(self._shards)
+
+    def assign(self, guild_id: int) -> Shard:
+        """
+        Assign a guild to the least-loaded shard.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild.
+
+        Returns
+        -------
+        Shard
+            The shard that the guild is assigned to.
+        """
+        if guild_id in self._assignments:
+            return self._assignments[guild_id]
+
+        if not self._shards:
+            self._shards = [Shard(index, self._late_frame_policy) for index in range(self._size)]
+
+        shard: Shard = min(
+            (shard for shard in self._shards if shard.alive),
+            key=lambda shard: shard.load,
+            default=self._shards[0],
+        )
+        self._assignments[guild_id] = shard
+        shard._guilds.add(guild_id)
+
+        _logger.debug("Assigned GUILD: %s to shard %s", guild_id, shard.index)
+
+        return shard
+
+    def release(self, guild_id: int) -> None:
+        """
+        Release a guild from its shard.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild.
+        """
+        shard: Union[Shard, None] = self._assignments.pop(guild_id, None)
+
+        if shard:
+            shard.detach(guild_id)
+
+    async def close(self) -> None:
+        """Shut every worker process of this pool down."""
+        self._assignments.clear()
+
+        await asyncio.gather(*(shard.close() for shard in self._shards))
+        self._shards.clear()
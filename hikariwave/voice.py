@@ -313,12 +313,15 @@ class Speaking(msgspec.Struct):
     speaking: SpeakingType
     """The type of speaking to use."""
 
-    delay: int
-    """The delay to use."""
-
     ssrc: int
     """The SSRC to use."""
 
+    delay: int = msgspec.field(default=0)
+    """The delay to use - Not sent by the server."""
+
+    user_id: Union[hikari.Snowflake, msgspec.UnsetType] = msgspec.field(default=msgspec.UNSET)
+    """The user that the SSRC belongs to - Only sent by the server."""
+
 
 class HeartbeatAcknowledgement(msgspec.Struct):
     """Heartbeat Acknowledgement.
@@ -361,8 +364,8 @@ class Hello(msgspec.Struct):
     **Sent by:** Client
     """
 
-    heartbeat_interval: int
-    """The interval between heartbeats."""
+    heartbeat_interval: float
+    """The interval (in milliseconds) between heartbeats."""
 
 
 class Resumed(msgspec.Struct):
@@ -420,33 +423,58 @@ def _dec_hook(type: type, obj: typing.Any) -> typing.Any:
     return obj
 
 
-def encode(obj: msgspec.Struct) -> bytes:
-    return msgspec.json.encode(
-        obj,
-        enc_hook=_enc_hook,
+def _tagged_payload(code: VoiceCode, payload_type: type[msgspec.Struct]) -> type[msgspec.Struct]:
+    data_type: typing.Any = payload_type
+
+    if not payload_type.__struct_fields__:
+        data_type = Union[payload_type, None]  # Field-less payloads are sent with `"d": null`
+
+    return msgspec.defstruct(
+        f"_{payload_type.__name__}Payload",
+        [("d", data_type), ("seq", Union[int, None], None)],
+        tag_field="op",
+        tag=int(code),
     )
 
 
+_TAGGED_PAYLOADS: typing.Final[dict[type[msgspec.Struct], tuple[VoiceCode, type[msgspec.Struct]]]] = {
+    _tagged_payload(code, payload_type): (code, payload_type)
+    for code, payload_type in VoicePayloadMappingT.items()
+}
+
+_ENCODER: typing.Final[msgspec.json.Encoder] = msgspec.json.Encoder(enc_hook=_enc_hook)
+_DECODER: typing.Final[msgspec.json.Decoder[typing.Any]] = msgspec.json.Decoder(
+    Union[tuple(_TAGGED_PAYLOADS)],
+    strict=True,
+    dec_hook=_dec_hook,
+)
+_RAW_DECODER: typing.Final[msgspec.json.Decoder[VoicePayload[msgspec.Raw]]] = msgspec.json.Decoder(
+    VoicePayload[msgspec.Raw],
+    strict=True,
+    dec_hook=_dec_hook,
+)
+
+
+def encode(obj: msgspec.Struct) -> bytes:
+    return _ENCODER.encode(obj)
+
+
 def decode(
     payload: Union[str, bytes],
 ) -> (
     Union[VoicePayload[msgspec.Struct], VoicePayload[msgspec.Raw]]
 ):  # TODO: This should be typed better.
-    base = msgspec.json.decode(
-        payload,
-        strict=True,
-        type=VoicePayload[msgspec.Raw],
-        dec_hook=_dec_hook,
-    )
+    try:
+        tagged: typing.Any = _DECODER.decode(payload)
+    except msgspec.ValidationError:
+        base: VoicePayload[msgspec.Raw] = _RAW_DECODER.decode(payload)
+
+        if base.op in VoicePayloadMappingT:
+            raise
 
-    payload_inner_type = VoicePayloadMappingT.get(base.op)
+        return base
 
-    if payload_inner_type:
-        return msgspec.json.decode(
-            payload,
-            strict=True,
-            type=VoicePayload[payload_inner_type],
-            dec_hook=_dec_hook,
-        )
+    code, payload_type = _TAGGED_PAYLOADS[type(tagged)]
+    data: typing.Any = tagged.d
 
-    return base
+    return VoicePayload(code, data if data is not None else payload_type(), tagged.seq)
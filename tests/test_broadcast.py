@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from hikariwave.audio.broadcast import Broadcast
+from hikariwave.audio.scheduler import PlaybackScheduler
+from hikariwave.audio.source.base import AudioSource
+from typing import AsyncGenerator, Union
+from typing_extensions import override
+
+import asyncio
+import pytest
+import typing
+
+if typing.TYPE_CHECKING:
+    from hikariwave.connection import VoiceConnection
+
+
+class _OpusSource(AudioSource):
+    def __init__(self, frames: int, error: Union[Exception, None] = None) -> None:
+        self._frames: int = frames
+        self._error: Union[Exception, None] = error
+
+    @property
+    @override
+    def encoded(self) -> bool:
+        return True
+
+    @override
+    async def decode(self) -> AsyncGenerator[bytes, None]: # type: ignore
+        for _ in range(self._frames):
+            yield b"\xf8\xff\xfe"
+
+        if self._error:
+            raise self._error
+
+
+class _Encryption:
+    def plain(self, header: memoryview, frame: memoryview) -> memoryview:
+        return frame
+
+
+class _Listener:
+    # Without a header or transport, a listener is skipped on every tick
+    def __init__(self) -> None:
+        self._encryption: _Encryption = _Encryption()
+        self._mode: str = "plain"
+        self._header: None = None
+        self._transport: None = None
+
+
+def _listener() -> VoiceConnection:
+    return typing.cast("VoiceConnection", _Listener())
+
+
+async def _broadcast(source: AudioSource, scheduled: bool) -> Broadcast:
+    broadcast: Broadcast = Broadcast(source, PlaybackScheduler() if scheduled else None)
+    broadcast.subscribe(_listener())
+
+    await asyncio.wait_for(broadcast.wait(), 5)
+    return broadcast
+
+
+@pytest.mark.parametrize("scheduled", [False, True])
+def test_plays_every_frame(scheduled: bool) -> None:
+    broadcast: Broadcast = asyncio.run(_broadcast(_OpusSource(10), scheduled))
+
+    assert broadcast.done
+    assert broadcast.frames_sent == 10
+
+
+@pytest.mark.parametrize("scheduled", [False, True])
+def test_source_failure_finishes_with_its_exception(scheduled: bool, caplog: pytest.LogCaptureFixture) -> None:
+    async def run() -> Broadcast:
+        broadcast: Broadcast = Broadcast(_OpusSource(10, RuntimeError("Source failed")), PlaybackScheduler() if scheduled else None)
+        broadcast.subscribe(_listener())
+
+        with pytest.raises(RuntimeError, match="Source failed"):
+            await asyncio.wait_for(broadcast.wait(), 5)
+
+        # Lets the broadcast's task finish, and log its failure
+        await broadcast.stop()
+        return broadcast
+
+    assert asyncio.run(run()).done
+    assert "Broadcast failed" in caplog.text
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from aiohttp import web
+from hikariwave.http import SessionPool
+
+import aiohttp
+import asyncio
+
+
+async def _serve() -> tuple[web.AppRunner, str]:
+    async def audio(request: web.Request) -> web.StreamResponse:
+        response: web.StreamResponse = web.StreamResponse()
+        response.content_length = 1024
+        await response.prepare(request)
+
+        # The body is held back like a stream's, so its connection stays busy
+        await response.write(b"\x00" * 512)
+        await asyncio.sleep(0.2)
+        await response.write(b"\x00" * 512)
+
+        return response
+
+    app: web.Application = web.Application()
+    app.router.add_get("/audio", audio)
+
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+
+    site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port: int = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}/audio"
+
+
+async def _read(session: aiohttp.ClientSession, url: str) -> bytes:
+    async with session.get(url) as response:
+        return await response.read()
+
+
+def test_streams_past_the_limit_wait() -> None:
+    async def run() -> tuple[bool, bool, int, int]:
+        runner, url = await _serve()
+        pool: SessionPool = SessionPool(limit=1)
+
+        try:
+            async with pool.stream_session.get(url) as first:
+                second: asyncio.Task[bytes] = asyncio.create_task(_read(pool.stream_session, url))
+                await asyncio.sleep(0.1)
+
+                # Voice websockets don't count towards the limit
+                websocket_served: bool = len(await _read(pool.websocket_session, url)) == 1024
+                waited: bool = not second.done()
+
+                await first.read()
+
+            await second
+            return waited, websocket_served, pool.connections_queued, pool.connections_reused
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    waited, websocket_served, queued, reused = asyncio.run(run())
+
+    assert waited
+    assert websocket_served
+    assert queued == 1
+    assert reused == 1
+
+
+def test_streams_are_unbounded_by_default() -> None:
+    async def run() -> int:
+        runner, url = await _serve()
+        pool: SessionPool = SessionPool()
+
+        try:
+            responses: list[aiohttp.ClientResponse] = [await pool.stream_session.get(url) for _ in range(150)]
+
+            for response in responses:
+                response.release()
+
+            return pool.connections_queued
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == 0
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from hikariwave.audio.source.ogg import OggOpusDemuxer
+from hikariwave.audio.source.ogg import packet_samples
+
+import pytest
+import struct
+
+_PAGE_HEADER: struct.Struct = struct.Struct("<4sBBqIIIB")
+_CONTINUED: int = 0x01
+
+# TOC byte of a single 20ms CELT frame
+_FRAME: bytes = b"\xf8"
+
+
+def _page(*segments: bytes, serial: int = 1, granule: int = 0, header_type: int = 0, terminated: bool = True) -> bytes:
+    lacing: bytearray = bytearray()
+
+    for index, segment in enumerate(segments):
+        lacing += b"\xff" * (len(segment) // 255)
+
+        if terminated or index < len(segments) - 1:
+            lacing.append(len(segment) % 255)
+
+    header: bytes = _PAGE_HEADER.pack(b"OggS", 0, header_type, granule, serial, 0, 0, len(lacing))
+    return header + lacing + b"".join(segments)
+
+
+def _opus_head(pre_skip: int = 312) -> bytes:
+    return b"OpusHead" + struct.pack("<BBHIhB", 1, 2, pre_skip, 48000, 0, 0)
+
+
+def _headers(serial: int = 1, pre_skip: int = 312) -> bytes:
+    return _page(_opus_head(pre_skip), serial=serial) + _page(b"OpusTags" + bytes(8), serial=serial)
+
+
+def _feed(demuxer: OggOpusDemuxer, *chunks: bytes) -> list[bytes]:
+    return [packet for chunk in chunks for packet in demuxer.feed(chunk)]
+
+
+def test_headers_are_consumed() -> None:
+    demuxer: OggOpusDemuxer = OggOpusDemuxer()
+    packets: list[bytes] = _feed(demuxer, _headers() + _page(_FRAME + b"a", _FRAME + b"b", granule=1920))
+
+    assert packets == [_FRAME + b"a", _FRAME + b"b"]
+    assert demuxer.pre_skip == 312
+    assert demuxer.granule == 1920
+
+
+def test_chunk_boundaries_do_not_matter() -> None:
+    stream: bytes = _headers() + _page(*(_FRAME + bytes([i]) * i for i in range(1, 40)))
+    expected: list[bytes] = _feed(OggOpusDemuxer(), stream)
+
+    demuxer: OggOpusDemuxer = OggOpusDemuxer()
+
+    assert _feed(demuxer, *(stream[i : i + 1] for i in range(len(stream)))) == expected
+    assert len(expected) == 39
+
+
+def test_resyncs_past_garbage() -> None:
+    stream: bytes = (
+        b"junk"
+        + _headers()
+        + b"Ogg\x00gar"
+        + _page(_FRAME + b"a")
+        + b"\x00" * 100
+        + _page(_FRAME + b"b")
+    )
+
+    assert _feed(OggOpusDemuxer(), stream) == [_FRAME + b"a", _FRAME + b"b"]
+
+
+def test_resyncs_across_chunks() -> None:
+    page: bytes = _page(_FRAME + b"a")
+    demuxer: OggOpusDemuxer = OggOpusDemuxer()
+
+    # The capture pattern is split between chunks right after unrelated bytes
+    packets: list[bytes] = _feed(demuxer, _headers() + b"\x00" * 50 + page[:2], page[2:])
+
+    assert packets == [_FRAME + b"a"]
+
+
+def test_packet_spanning_pages() -> None:
+    packet: bytes = _FRAME + bytes(range(256)) * 3
+
+    first: bytes = _page(packet[:510], terminated=False)
+    second: bytes = _page(packet[510:], header_type=_CONTINUED)
+
+    assert len(packet[:510]) % 255 == 0
+    assert _feed(OggOpusDemuxer(), _headers() + first + second) == [packet]
+
+
+def test_packet_spanning_pages_in_pieces() -> None:
+    packet: bytes = _FRAME + bytes(1000)
+    stream: bytes = (
+        _headers()
+        + _page(packet[:255], terminated=False)
+        + _page(packet[255:765], header_type=_CONTINUED, terminated=False)
+        + _page(packet[765:], _FRAME + b"next", header_type=_CONTINUED)
+    )
+
+    assert _feed(OggOpusDemuxer(), *(stream[i : i + 7] for i in range(0, len(stream), 7))) == [packet, _FRAME + b"next"]
+
+
+def test_unfinished_packet_is_dropped_without_continuation() -> None:
+    # The page continuing the packet was lost, so its first part must not be glued onto the next packet
+    stream: bytes = _headers() + _page(_FRAME + bytes(254), terminated=False) + _page(_FRAME + b"a")
+
+    assert _feed(OggOpusDemuxer(), stream) == [_FRAME + b"a"]
+
+
+def test_other_logical_streams_are_ignored() -> None:
+    stream: bytes = _headers() + _page(b"\x00other", serial=2) + _page(_FRAME + b"a")
+
+    assert _feed(OggOpusDemuxer(), stream) == [_FRAME + b"a"]
+
+
+def test_rejects_non_opus_streams() -> None:
+    vorbis: bytes = _page(b"\x01vorbis" + bytes(23))
+
+    with pytest.raises(ValueError, match="Opus"):
+        _feed(OggOpusDemuxer(), vorbis)
+
+
+def test_position_follows_granule() -> None:
+    demuxer: OggOpusDemuxer = OggOpusDemuxer()
+
+    _feed(demuxer, _headers(), _page(_FRAME, _FRAME, granule=312 + 1920))
+    assert demuxer.position == 1920
+
+    # Without a granule position, the duration of each packet returned is counted
+    _feed(demuxer, _page(_FRAME, granule=-1))
+    assert demuxer.position == 2880
+
+
+def test_packets_within_pre_skip_are_dropped() -> None:
+    demuxer: OggOpusDemuxer = OggOpusDemuxer()
+
+    # Two whole frames fit in the pre-skip, and the 80 samples left of it are played as part of the third
+    packets: list[bytes] = _feed(demuxer, _headers(pre_skip=2000), _page(*(_FRAME + bytes([i]) for i in range(4)), granule=-1))
+
+    assert packets == [_FRAME + b"\x02", _FRAME + b"\x03"]
+    assert demuxer.position == 4 * 960 - 2000
+
+
+@pytest.mark.parametrize(
+    ("packet", "samples"),
+    [
+        (b"", 0),
+        (b"\xf8", 960),
+        (b"\xf9", 1920),
+        (b"\x03\x03", 3 * 480),
+        (b"\x03", 0),
+    ],
+)
+def test_packet_samples(packet: bytes, samples: int) -> None:
+    assert packet_samples(packet) == samples
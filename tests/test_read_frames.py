@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from hikariwave.audio.source.base import read_frames
+from hikariwave.internal import constants
+
+import asyncio
+import pytest
+import random
+
+_FRAME_TOTAL: int = constants.FRAME_SIZE * constants.CHANNELS * 2
+
+
+async def _collect(chunks: list[bytes]) -> list[bytes]:
+    stream: asyncio.StreamReader = asyncio.StreamReader()
+
+    async def feed() -> None:
+        for chunk in chunks:
+            stream.feed_data(chunk)
+
+            # Let each chunk be read on its own, the way a pipe delivers it
+            await asyncio.sleep(0)
+
+        stream.feed_eof()
+
+    feeder: asyncio.Task[None] = asyncio.create_task(feed())
+    frames: list[bytes] = [bytes(frame) async for frame in read_frames(stream)]
+
+    await feeder
+    return frames
+
+
+def _split(data: bytes, sizes: list[int]) -> list[bytes]:
+    chunks: list[bytes] = []
+    position: int = 0
+
+    for size in sizes:
+        chunks.append(data[position : position + size])
+        position += size
+
+    return chunks
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fragmented_reads_yield_exact_frames(seed: int) -> None:
+    generator: random.Random = random.Random(seed)
+    data: bytes = generator.randbytes(_FRAME_TOTAL * 20 + 1234)
+
+    sizes: list[int] = []
+    remaining: int = len(data)
+
+    while remaining:
+        size: int = min(remaining, generator.choice((1, 3, 511, _FRAME_TOTAL - 1, _FRAME_TOTAL + 1, constants.BLOCK_SIZE)))
+        sizes.append(size)
+        remaining -= size
+
+    frames: list[bytes] = asyncio.run(_collect(_split(data, sizes)))
+    padded: bytes = data + bytes(-len(data) % _FRAME_TOTAL)
+
+    assert all(len(frame) == _FRAME_TOTAL for frame in frames)
+    assert frames == [padded[i : i + _FRAME_TOTAL] for i in range(0, len(padded), _FRAME_TOTAL)]
+
+
+def test_only_the_final_frame_is_padded() -> None:
+    data: bytes = b"\x01" * (_FRAME_TOTAL * 2 + 10)
+    frames: list[bytes] = asyncio.run(_collect(_split(data, [7, _FRAME_TOTAL, _FRAME_TOTAL + 3])))
+
+    assert frames[:2] == [b"\x01" * _FRAME_TOTAL] * 2
+    assert frames[2] == b"\x01" * 10 + bytes(_FRAME_TOTAL - 10)
+
+
+def test_empty_stream_yields_nothing() -> None:
+    assert asyncio.run(_collect([])) == []
+
+
+def test_frames_are_only_valid_until_resumed() -> None:
+    async def hold() -> tuple[list[memoryview], list[bytes]]:
+        stream: asyncio.StreamReader = asyncio.StreamReader()
+        stream.feed_data(random.Random(0).randbytes(_FRAME_TOTAL * 3))
+        stream.feed_eof()
+
+        views: list[memoryview] = []
+        copies: list[bytes] = []
+
+        async for frame in read_frames(stream):
+            views.append(frame)
+            copies.append(bytes(frame))
+
+        return views, copies
+
+    views, copies = asyncio.run(hold())
+
+    # Frames share one buffer, so a view held past the next frame no longer shows its own frame
+    assert len(copies) == 3
+    assert any(bytes(view) != copy for view, copy in zip(views, copies))
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from aiohttp import web
+from hikariwave.audio.cache import WebCache
+
+import aiohttp
+import asyncio
+import os
+import pathlib
+import pytest
+
+_BODY: bytes = os.urandom(256 * 1024)
+_ETAG: str = '"v1"'
+
+
+async def _serve(requests: list[str]) -> tuple[web.AppRunner, str]:
+    async def audio(request: web.Request) -> web.StreamResponse:
+        requests.append(request.headers.get("If-None-Match", ""))
+
+        if request.headers.get("If-None-Match", None) == _ETAG:
+            return web.Response(status=304)
+
+        response: web.StreamResponse = web.StreamResponse(headers={"ETag": _ETAG})
+        response.content_length = len(_BODY)
+        await response.prepare(request)
+
+        for position in range(0, len(_BODY), 16384):
+            await response.write(_BODY[position : position + 16384])
+            await asyncio.sleep(0.001)
+
+        return response
+
+    app: web.Application = web.Application()
+    app.router.add_get("/audio", audio)
+
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+
+    site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port: int = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}/audio"
+
+
+async def _read(cache: WebCache, url: str, session: aiohttp.ClientSession) -> bytes:
+    return b"".join([chunk async for chunk in cache.stream(url, session)])
+
+
+def test_concurrent_plays_share_one_download(tmp_path: pathlib.Path, caplog: pytest.LogCaptureFixture) -> None:
+    async def run() -> tuple[list[str], list[bytes], bytes]:
+        requests: list[str] = []
+        runner, url = await _serve(requests)
+        cache: WebCache = WebCache(str(tmp_path))
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                bodies: list[bytes] = await asyncio.gather(*(_read(cache, url, session) for _ in range(3)))
+
+                # The download is committed in the background once its last chunk is read
+                await asyncio.gather(*cache._tasks)
+
+                replay: bytes = await _read(cache, url, session)
+        finally:
+            await runner.cleanup()
+
+        return requests, bodies, replay
+
+    requests, bodies, replay = asyncio.run(run())
+
+    assert requests == ["", _ETAG]
+    assert bodies == [_BODY] * 3
+    assert replay == _BODY
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+    assert "Failed to cache" not in caplog.text